@@ -0,0 +1,130 @@
+"""Microbenchmarks: PygameCanvas frame time and the pygame -> Qt handoff.
+
+The first table forces a full redraw by dropping the cached background before
+every frame, which is what the canvas did on each tick before the static layer
+was cached. The second compares the original handoff (tostring() copy, RGB888
+QImage, QPixmap conversion, rescale to the label) with the shared-buffer
+RGB32 image rendered at the label's size, and with the QPainter backend
+repainting the car's dirty area in a frame of that size. The last table is the cold import and
+initialization cost of each backend. Run from the repository root:
+
+    SDL_VIDEODRIVER=dummy QT_QPA_PLATFORM=offscreen PYTHONPATH=src python benchmarks/bench_render.py
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import timeit
+
+import pygame
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap, QRegion
+from PySide6.QtWidgets import QApplication
+
+from elevator_sim.core.model import DoorState, ElevatorState
+from elevator_sim.render.pygame_canvas import PygameCanvas
+from elevator_sim.render.qpainter_canvas import QPainterCanvas
+
+LABEL_SIZE = 518
+
+
+def _states(floor_count: int, frames: int):
+    for i in range(frames):
+        state = ElevatorState()
+        state.current_floor = 1 + (i * 0.05) % (floor_count - 1)
+        state.door_state = DoorState.OPEN if i % 60 < 20 else DoorState.CLOSED
+        yield state
+
+
+def bench_draw(floor_count: int, full_redraw: bool, frames: int = 300) -> float:
+    canvas = PygameCanvas(480, 520, floor_count)
+    states = list(_states(floor_count, frames))
+
+    def run() -> None:
+        for state in states:
+            if full_redraw:
+                canvas._background = None
+            canvas.draw(state)
+
+    best = min(timeit.repeat(run, number=1, repeat=3))
+    return best / frames * 1e3
+
+
+def legacy_handoff(canvas: PygameCanvas) -> QPixmap:
+    buffer = pygame.image.tostring(canvas.surface, "RGB")
+    image = QImage(buffer, canvas.width, canvas.height, QImage.Format_RGB888)
+    return QPixmap.fromImage(image).scaled(LABEL_SIZE, LABEL_SIZE, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+def bench_handoff(legacy: bool, frames: int = 300) -> float:
+    canvas = PygameCanvas(480, 520) if legacy else PygameCanvas(LABEL_SIZE, LABEL_SIZE)
+    states = list(_states(canvas.floor_count, frames))
+
+    def run() -> None:
+        for state in states:
+            image = canvas.draw(state)
+            if legacy:
+                legacy_handoff(canvas)
+            else:
+                QPixmap.fromImage(image)
+
+    best = min(timeit.repeat(run, number=1, repeat=3))
+    return best / frames * 1e3
+
+
+def bench_qpainter(frames: int = 300) -> float:
+    canvas = QPainterCanvas()
+    canvas.resize(LABEL_SIZE, LABEL_SIZE)
+    target = QImage(LABEL_SIZE, LABEL_SIZE, QImage.Format_RGB32)
+    states = list(_states(canvas.floor_count, frames))
+
+    def run() -> None:
+        # Like a real repaint, only the area the car left and entered is painted.
+        for state in states:
+            previous = canvas._car_rect
+            canvas.draw(state)
+            dirty = previous.united(canvas._car_rect)
+            canvas.render(target, dirty.topLeft(), QRegion(dirty))
+
+    best = min(timeit.repeat(run, number=1, repeat=3))
+    return best / frames * 1e3
+
+
+_IMPORT_PROBES = {
+    "pygame": "from elevator_sim.render.pygame_canvas import PygameCanvas; PygameCanvas(8, 8)",
+    "qpainter": "from elevator_sim.render.qpainter_canvas import QPainterCanvas",
+}
+
+
+def import_time(backend: str) -> float:
+    # PySide6 is imported first: the application pays for it either way.
+    code = (
+        "import time, PySide6.QtWidgets; started = time.perf_counter(); "
+        f"{_IMPORT_PROBES[backend]}; print(time.perf_counter() - started)"
+    )
+    runs = []
+    for _ in range(3):
+        output = subprocess.check_output([sys.executable, "-c", code], stderr=subprocess.DEVNULL)
+        runs.append(float(output.split()[-1]))  # pygame prints a banner first
+    return min(runs) * 1e3
+
+
+def main() -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'floors':>8}  {'full redraw':>12}  {'cached':>12}   (ms per draw)")
+    for floor_count in (6, 50, 300):
+        full = bench_draw(floor_count, full_redraw=True)
+        cached = bench_draw(floor_count, full_redraw=False)
+        print(f"{floor_count:>8}  {full:>12.3f}  {cached:>12.3f}")
+    print()
+    print(f"{'tostring + RGB888 + scale':>26}  {'shared RGB32':>12}  {'QPainter':>12}   (ms per frame)")
+    print(f"{bench_handoff(legacy=True):>26.3f}  {bench_handoff(legacy=False):>12.3f}  {bench_qpainter():>12.3f}")
+    print()
+    print(f"{'pygame':>10}  {'qpainter':>10}   (ms to import and initialize the backend)")
+    print(f"{import_time('pygame'):>10.1f}  {import_time('qpainter'):>10.1f}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
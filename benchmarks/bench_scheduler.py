@@ -0,0 +1,89 @@
+"""Microbenchmark: indexed ScanScheduler against the original sorted-set version.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_scheduler.py
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import List, Optional, Set
+
+from elevator_sim.core.model import Direction
+from elevator_sim.core.scheduler import BaseScheduler, CScanScheduler, LookScheduler, NextStop, ScanScheduler
+
+
+class LegacyScanScheduler(BaseScheduler):
+    name = "SCAN (legacy)"
+
+    def __init__(self) -> None:
+        self._requests: Set[int] = set()
+
+    def add_request(self, floor: int) -> None:
+        self._requests.add(floor)
+
+    def remove_request(self, floor: int) -> None:
+        self._requests.discard(floor)
+
+    def clear(self) -> None:
+        self._requests.clear()
+
+    def pending_requests(self) -> List[int]:
+        return sorted(self._requests)
+
+    def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
+        if not self._requests:
+            return None
+        floors = sorted(self._requests)
+        if direction == Direction.UP:
+            ahead = [floor for floor in floors if floor > current_floor]
+            if ahead:
+                return NextStop(min(ahead), Direction.UP)
+            behind = [floor for floor in floors if floor < current_floor]
+            if behind:
+                return NextStop(max(behind), Direction.DOWN)
+        elif direction == Direction.DOWN:
+            behind = [floor for floor in floors if floor < current_floor]
+            if behind:
+                return NextStop(max(behind), Direction.DOWN)
+            ahead = [floor for floor in floors if floor > current_floor]
+            if ahead:
+                return NextStop(min(ahead), Direction.UP)
+        else:
+            nearest = min(floors, key=lambda f: (abs(f - current_floor), f))
+            if nearest == current_floor:
+                return NextStop(nearest, Direction.IDLE)
+            next_dir = Direction.UP if nearest > current_floor else Direction.DOWN
+            return NextStop(nearest, next_dir)
+        return None
+
+
+def bench(scheduler_cls, pending: int, calls: int = 200) -> float:
+    rng = random.Random(pending)
+    scheduler = scheduler_cls()
+    for floor in rng.sample(range(1, pending * 4), pending):
+        scheduler.add_request(floor)
+    positions = [rng.uniform(1, pending * 4) for _ in range(calls)]
+    directions = [rng.choice((Direction.UP, Direction.DOWN, Direction.IDLE)) for _ in range(calls)]
+
+    def run() -> None:
+        for position, direction in zip(positions, directions):
+            scheduler.next_stop(position, direction)
+
+    best = min(timeit.repeat(run, number=1, repeat=3))
+    return best / calls * 1e6
+
+
+def main() -> None:
+    schedulers = (LegacyScanScheduler, ScanScheduler, LookScheduler, CScanScheduler)
+    print(f"{'pending':>8}  " + "  ".join(f"{cls.name:>14}" for cls in schedulers) + "   (us per next_stop)")
+    for pending in (1_000, 10_000, 100_000):
+        calls = 20 if pending >= 100_000 else 200
+        timings = [bench(cls, pending, calls) for cls in schedulers]
+        print(f"{pending:>8}  " + "  ".join(f"{value:>14.2f}" for value in timings))
+
+
+if __name__ == "__main__":
+    main()
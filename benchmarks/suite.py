@@ -0,0 +1,344 @@
+"""Benchmark suite for the hot paths, with a stored baseline and a regression gate.
+
+Times ElevatorController.update while travelling, cycling its doors and idle;
+add_request, remove_request and next_stop of every registered scheduler at
+growing queue sizes; PygameCanvas.draw at several floor counts; and
+format_event and consume_events throughput, in microseconds per operation.
+Each case is also expressed relative to a fixed pure-Python reference loop
+timed alongside it, and only a slowdown in both figures counts, so the
+baseline holds on a machine whose speed drifts between runs.
+
+By default the results are compared with benchmarks/baseline.json and the
+exit status is 1 when a case is slower than its baseline by more than
+--threshold (a ratio). Record a new baseline on the reference machine after
+an intentional change with --update. Run from the repository root:
+
+    SDL_VIDEODRIVER=dummy PYTHONPATH=src python benchmarks/suite.py [--update] [--filter scheduler.]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.events import (
+    ArrivedAtFloor,
+    DirectionChanged,
+    DoorClosed,
+    DoorOpened,
+    EmergencyStop,
+    RequestAdded,
+    format_event,
+)
+from elevator_sim.core.journal import ARRIVED_AT_FLOOR, DOOR_CLOSED, DOOR_OPENED, REQUEST_ADDED
+from elevator_sim.core.model import Direction
+from elevator_sim.core.scheduler import SCHEDULERS
+from elevator_sim.core.worker import SIM_STEP
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+THRESHOLD = 1.5
+REPEAT = 5
+ROUNDS = 3
+REFERENCE_OPS = 20_000
+QUEUE_SIZES = (100, 1_000, 10_000)
+FLOOR_COUNTS = (6, 50, 300)
+
+Case = Callable[[int], float]
+
+
+def measure(setup: Callable[[], Any], run: Callable[[Any], None], ops: int, repeat: int) -> float:
+    """Best time of `run(setup())` over `repeat` runs, in microseconds per op."""
+    best = float("inf")
+    for _ in range(repeat):
+        state = setup()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run(state)
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best / ops * 1e6
+
+
+def _update_case(phase: str, steps: int = 3_000) -> Case:
+    def setup() -> ElevatorController:
+        controller = ElevatorController(floor_count=300)
+        if phase == "travel":
+            controller.add_request(300)  # 3000 steps at 1 floor/s never reach it
+        return controller
+
+    def run(controller: ElevatorController) -> None:
+        update = controller.update
+        if phase == "door":
+            for _ in range(steps):
+                if controller.is_idle():
+                    controller.request_open_door()
+                update(SIM_STEP)
+        else:
+            for _ in range(steps):
+                update(SIM_STEP)
+
+    return lambda repeat: measure(setup, run, steps, repeat)
+
+
+def _scheduler_case(name: str, operation: str, size: int) -> Case:
+    cls = SCHEDULERS[name]
+    rng = random.Random(size)
+    floors = rng.sample(range(1, size * 4), size)
+    calls = 1_000
+    probes = [(rng.uniform(1, size * 4), rng.choice(list(Direction))) for _ in range(calls)]
+
+    def filled():
+        scheduler = cls()
+        for floor in floors:
+            scheduler.add_request(floor)
+        return scheduler
+
+    if operation == "add_request":
+        ops = size
+
+        def setup():
+            return cls()
+
+        def run(scheduler) -> None:
+            for floor in floors:
+                scheduler.add_request(floor)
+
+    elif operation == "remove_request":
+        ops = size
+        setup = filled
+
+        def run(scheduler) -> None:
+            for floor in floors:
+                scheduler.remove_request(floor)
+
+    else:
+        ops = calls
+        setup = filled
+
+        def run(scheduler) -> None:
+            for position, direction in probes:
+                scheduler.next_stop(position, direction)
+
+    return lambda repeat: measure(setup, run, ops, repeat)
+
+
+def _draw_case(floor_count: int, frames: int = 300) -> Case:
+    from elevator_sim.core.model import DoorState, ElevatorState
+    from elevator_sim.render.pygame_canvas import PygameCanvas
+
+    states = []
+    for i in range(frames):
+        state = ElevatorState()
+        state.current_floor = 1 + (i * 0.05) % (floor_count - 1)
+        state.door_state = DoorState.OPEN if i % 60 < 20 else DoorState.CLOSED
+        states.append(state)
+
+    def setup() -> PygameCanvas:
+        canvas = PygameCanvas(518, 518, floor_count)
+        canvas.draw(states[0])
+        return canvas
+
+    def run(canvas: PygameCanvas) -> None:
+        for state in states:
+            canvas.draw(state)
+
+    return lambda repeat: measure(setup, run, frames, repeat)
+
+
+def _format_case(count: int = 10_000) -> Case:
+    samples = [
+        RequestAdded(3),
+        ArrivedAtFloor(3),
+        DoorOpened(3),
+        DoorClosed(3),
+        DirectionChanged(Direction.UP),
+        EmergencyStop(True),
+    ]
+    events = [samples[i % len(samples)] for i in range(count)]
+
+    def run(_: None) -> None:
+        for event in events:
+            format_event(event)
+
+    return lambda repeat: measure(lambda: None, run, count, repeat)
+
+
+def _consume_case(count: int = 10_000) -> Case:
+    codes = (REQUEST_ADDED, ARRIVED_AT_FLOOR, DOOR_OPENED, DOOR_CLOSED)
+
+    def setup() -> ElevatorController:
+        controller = ElevatorController()
+        for i in range(count):
+            controller.journal.record(codes[i % len(codes)], i * SIM_STEP, 1 + i % 6)
+        return controller
+
+    def run(controller: ElevatorController) -> None:
+        controller.consume_events()
+
+    return lambda repeat: measure(setup, run, count, repeat)
+
+
+def cases() -> Dict[str, Callable[[], Case]]:
+    """Case name -> factory, so unselected cases cost nothing to prepare."""
+    registry: Dict[str, Callable[[], Case]] = {}
+    for phase in ("travel", "door", "idle"):
+        registry[f"controller.update.{phase}"] = lambda phase=phase: _update_case(phase)
+    for name in SCHEDULERS:
+        for operation in ("add_request", "remove_request", "next_stop"):
+            for size in QUEUE_SIZES:
+                registry[f"scheduler.{name}.{operation}.{size}"] = (
+                    lambda name=name, operation=operation, size=size: _scheduler_case(name, operation, size)
+                )
+    for floor_count in FLOOR_COUNTS:
+        registry[f"render.draw.{floor_count}"] = lambda floor_count=floor_count: _draw_case(floor_count)
+    registry["events.format_event"] = _format_case
+    registry["events.consume_events"] = _consume_case
+    return registry
+
+
+class Timing(NamedTuple):
+    us: float  # microseconds per operation
+    relative: float  # the same, in units of the reference loop measured alongside
+
+
+def _reference_loop(_: None, count: int = REFERENCE_OPS) -> None:
+    counter = _Counter()
+    table: Dict[int, int] = {}
+    for i in range(count):
+        counter.step(0.5)
+        table[i & 255] = i
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def step(self, dt: float) -> bool:
+        self.value += dt
+        return self.value > 1e9
+
+
+def run_suite(pattern: str = "", repeat: int = REPEAT, rounds: int = ROUNDS) -> Dict[str, Timing]:
+    """Time each case `rounds` times, each right after the reference loop.
+
+    Shared and frequency-scaled CPUs drift by 2x between runs. The best
+    times of the case and of the reference over the same rounds both come
+    from the machine's fast periods, so their ratio stays put when the
+    machine, rather than the code, got slower.
+    """
+    results: Dict[str, Timing] = {}
+    for name, factory in cases().items():
+        if pattern not in name:
+            continue
+        try:
+            case = factory()
+        except ImportError as exc:  # pygame or PySide6 missing
+            print(f"skipped {name}: {exc}", file=sys.stderr)
+            continue
+        reference = us = float("inf")
+        for _ in range(rounds):
+            reference = min(reference, measure(lambda: None, _reference_loop, REFERENCE_OPS, repeat))
+            us = min(us, case(repeat))
+        results[name] = Timing(us, us / reference)
+    return results
+
+
+def compare(
+    baseline: Dict[str, Timing], results: Dict[str, Timing], threshold: float = THRESHOLD
+) -> List[Tuple[str, float]]:
+    """(name, slowdown) for the cases slower than their baseline by more than `threshold`."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        slowdown = _slowdown(previous, current)
+        if slowdown > threshold:
+            regressions.append((name, slowdown))
+    return regressions
+
+
+def _slowdown(previous: Timing, current: Timing) -> float:
+    # A real regression shows in both figures; a machine running slower
+    # overall only in the absolute one, a noisy reference only in the other.
+    return min(current.us / previous.us, current.relative / previous.relative)
+
+
+def load_baseline(path: Path) -> Dict[str, Timing]:
+    with open(path, encoding="utf-8") as handle:
+        document = json.load(handle)
+    return {name: Timing(**values) for name, values in document["results"].items()}
+
+
+def save_baseline(path: Path, results: Dict[str, Timing]) -> None:
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "recorded": time.strftime("%Y-%m-%d"),
+        "results": {
+            name: {"us": round(timing.us, 4), "relative": round(timing.relative, 4)}
+            for name, timing in sorted(results.items())
+        },
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2)
+        handle.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="allowed slowdown ratio")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.filter, args.repeat, args.rounds)
+    if args.json is not None:
+        save_baseline(args.json, results)
+    if args.update:
+        if args.filter and args.baseline.exists():
+            results = {**load_baseline(args.baseline), **results}
+        save_baseline(args.baseline, results)
+        print(f"wrote {len(results)} cases to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+    regressions = compare(baseline, results, args.threshold)
+    if regressions:
+        # Give the suspects one more chance before failing the run.
+        for name, _ in regressions:
+            retry = run_suite(name, args.repeat, args.rounds)[name]
+            results[name] = min(results[name], retry, key=lambda timing: timing.relative)
+        regressions = compare(baseline, results, args.threshold)
+    slow = dict(regressions)
+
+    print(f"{'case':<42}  {'us/op':>9}  {'baseline':>9}  {'slowdown':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<42}  {current.us:>9.3f}  {'-':>9}  {'new':>8}")
+            continue
+        slowdown = _slowdown(previous, current)
+        flag = "  REGRESSION" if name in slow else ""
+        print(f"{name:<42}  {current.us:>9.3f}  {previous.us:>9.3f}  {slowdown:>7.2f}x{flag}")
+    if slow:
+        print(f"{len(slow)} case(s) slower than {args.threshold:.2f}x their baseline", file=sys.stderr)
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
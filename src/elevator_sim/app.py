@@ -1,15 +1,39 @@
+import argparse
 import sys
 
 from PySide6.QtWidgets import QApplication
 
-from .ui.main_window import MainWindow
+from .ui.main_window import LOG_MAX_LINES, RENDERERS, MainWindow
 
 
 def main() -> None:
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    parser = argparse.ArgumentParser(prog="python -m elevator_sim.app")
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERERS,
+        default="pygame",
+        help="drawing backend for the simulation view (default: pygame)",
+    )
+    parser.add_argument(
+        "--log-lines",
+        type=int,
+        default=LOG_MAX_LINES,
+        help=f"lines kept in the log panel; the rotating log file is separate (default: {LOG_MAX_LINES})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="start with hot-path profiling and its overlay on (F3 toggles, Ctrl+Shift+D saves)",
+    )
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.setApplicationName("Elevator Simulation")
+    window = MainWindow(renderer=args.renderer, log_lines=args.log_lines, profile=args.profile)
     window.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    window.shutdown()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
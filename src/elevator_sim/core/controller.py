@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import copy
+from dataclasses import replace
 from typing import List, Optional
 
-from .events import (
-    ArrivedAtFloor,
-    DirectionChanged,
-    DoorClosed,
-    DoorOpened,
-    EmergencyStop,
-    Event,
-    RequestAdded,
+from .events import Event
+from .journal import (
+    ARRIVED_AT_FLOOR,
+    DIRECTION_CHANGED,
+    DIRECTION_INDEX,
+    DOOR_CLOSED,
+    DOOR_OPENED,
+    EMERGENCY_STOP,
+    REQUEST_ADDED,
+    DEFAULT_CAPACITY,
+    EventJournal,
+    JournalBatch,
 )
 from .model import Direction, DoorState, ElevatorState
-from .scheduler import BaseScheduler, FifoScheduler
+from .scheduler import BaseScheduler, DecisionCache, FifoScheduler, NextStop
 
 
 class ElevatorController:
@@ -24,6 +30,7 @@ class ElevatorController:
         door_open_time: float = 0.6,
         door_close_time: float = 0.6,
         dwell_time: float = 1.5,
+        journal_capacity: int = DEFAULT_CAPACITY,
     ) -> None:
         self.floor_count = max(2, floor_count)
         self.scheduler = scheduler or FifoScheduler()
@@ -33,7 +40,15 @@ class ElevatorController:
         self.dwell_time = dwell_time
         self.door_timer = 0.0
         self.emergency_stop = False
-        self._events: List[Event] = []
+        self.decision_cache = DecisionCache()
+        self.time = 0.0
+        self.journal = EventJournal(journal_capacity)
+        self._configure_scheduler()
+
+    def _configure_scheduler(self) -> None:
+        self.scheduler.configure(
+            self.floor_count, self.state.speed_fps, self.door_open_time, self.dwell_time, self.door_close_time
+        )
 
     def set_floor_count(self, floor_count: int) -> None:
         self.floor_count = max(2, floor_count)
@@ -41,24 +56,30 @@ class ElevatorController:
         self.scheduler.clear()
         for floor in valid_requests:
             self.scheduler.add_request(floor)
+        self._configure_scheduler()
+        self.decision_cache.invalidate()
 
     def set_scheduler(self, scheduler: BaseScheduler) -> None:
         pending = self.scheduler.pending_requests()
         self.scheduler = scheduler
+        self._configure_scheduler()
         for floor in pending:
             self.scheduler.add_request(floor)
+        self.decision_cache.invalidate()
 
     def reset(self) -> None:
         self.scheduler.clear()
         self.state = ElevatorState(speed_fps=self.state.speed_fps)
         self.door_timer = 0.0
         self.emergency_stop = False
+        self.decision_cache.invalidate()
 
     def add_request(self, floor: int) -> bool:
         if floor < 1 or floor > self.floor_count:
             return False
         self.scheduler.add_request(floor)
-        self._emit(RequestAdded(floor))
+        self.decision_cache.invalidate()
+        self._emit(REQUEST_ADDED, floor)
         return True
 
     def request_open_door(self) -> bool:
@@ -90,11 +111,12 @@ class ElevatorController:
         self.emergency_stop = active
         if active:
             self._set_direction(Direction.IDLE)
-        self._emit(EmergencyStop(active))
+        self._emit(EMERGENCY_STOP, int(active))
 
     def update(self, dt: float) -> None:
         if dt <= 0.0:
             return
+        self.time += dt
         if self.emergency_stop:
             return
 
@@ -102,7 +124,68 @@ class ElevatorController:
         if self.state.door_state != DoorState.CLOSED:
             return
 
-        decision = self.scheduler.next_stop(self.state.current_floor, self.state.direction)
+        self._advance_car(dt)
+
+    def update_doors(self, dt: float) -> None:
+        if dt <= 0.0:
+            return
+        self.time += dt
+        if self.emergency_stop:
+            return
+        self._advance_doors(dt)
+
+    def time_to_next_change(self) -> Optional[float]:
+        if self.emergency_stop:
+            return None
+        if self.state.door_state != DoorState.CLOSED:
+            return max(self.door_timer, 0.0)
+
+        decision = self._next_stop()
+        if decision is None:
+            if self.state.direction != Direction.IDLE or self.state.target_floor is not None:
+                return 0.0
+            return None
+        if decision.floor != self.state.target_floor:
+            return 0.0
+        if self.state.speed_fps <= 0.0:
+            return None
+        return abs(decision.floor - self.state.current_floor) / self.state.speed_fps
+
+    def consume_events(self) -> List[Event]:
+        return list(self.journal.drain())
+
+    def drain_events(self) -> JournalBatch:
+        """Events since the last drain, as views into the journal's ring buffer.
+
+        The batch is not copied: the next update() or add_request() may
+        overwrite it, so iterate it first (or use consume_events() for a list).
+        Events beyond `journal_capacity` between drains are lost and counted
+        in `journal.dropped`.
+        """
+        return self.journal.drain()
+
+    def pending_requests(self) -> List[int]:
+        return self.scheduler.pending_requests()
+
+    def fork(self) -> ElevatorController:
+        """Independent copy of the controller, its scheduler and undrained events."""
+        clone = copy.copy(self)
+        # Everything else is immutable; these are the mutable members.
+        clone.scheduler = self.scheduler.clone()
+        clone.state = replace(self.state)
+        clone.decision_cache = self.decision_cache.copy()
+        clone.journal = self.journal.copy()
+        return clone
+
+    def is_idle(self) -> bool:
+        return (
+            self.state.door_state == DoorState.CLOSED
+            and self.state.direction == Direction.IDLE
+            and not self.scheduler.has_requests()
+        )
+
+    def _advance_car(self, dt: float) -> None:
+        decision = self._next_stop()
         if decision is None:
             self._set_direction(Direction.IDLE)
             self.state.target_floor = None
@@ -127,13 +210,8 @@ class ElevatorController:
         if abs(self.state.current_floor - decision.floor) < 1e-3:
             self._arrive_at_floor(decision.floor)
 
-    def consume_events(self) -> List[Event]:
-        events = list(self._events)
-        self._events.clear()
-        return events
-
-    def pending_requests(self) -> List[int]:
-        return self.scheduler.pending_requests()
+    def _next_stop(self) -> Optional[NextStop]:
+        return self.decision_cache.next_stop(self.scheduler, self.state.current_floor, self.state.direction)
 
     def _advance_doors(self, dt: float) -> None:
         if self.state.door_state == DoorState.OPENING:
@@ -141,7 +219,7 @@ class ElevatorController:
             if self.door_timer <= 0.0:
                 self.state.door_state = DoorState.OPEN
                 self.door_timer = self.dwell_time
-                self._emit(DoorOpened(int(round(self.state.current_floor))))
+                self._emit(DOOR_OPENED, int(round(self.state.current_floor)))
         elif self.state.door_state == DoorState.OPEN:
             self.door_timer -= dt
             if self.door_timer <= 0.0:
@@ -151,13 +229,14 @@ class ElevatorController:
             self.door_timer -= dt
             if self.door_timer <= 0.0:
                 self.state.door_state = DoorState.CLOSED
-                self._emit(DoorClosed(int(round(self.state.current_floor))))
+                self._emit(DOOR_CLOSED, int(round(self.state.current_floor)))
 
     def _arrive_at_floor(self, floor: int) -> None:
         self.state.current_floor = float(floor)
         self.state.target_floor = None
         self.scheduler.remove_request(floor)
-        self._emit(ArrivedAtFloor(floor))
+        self.decision_cache.invalidate()
+        self._emit(ARRIVED_AT_FLOOR, floor)
         self.state.door_state = DoorState.OPENING
         self.door_timer = self.door_open_time
         self._set_direction(Direction.IDLE)
@@ -165,7 +244,8 @@ class ElevatorController:
     def _set_direction(self, direction: Direction) -> None:
         if self.state.direction != direction:
             self.state.direction = direction
-            self._emit(DirectionChanged(direction))
+            self.decision_cache.invalidate()
+            self._emit(DIRECTION_CHANGED, DIRECTION_INDEX[direction])
 
-    def _emit(self, event: Event) -> None:
-        self._events.append(event)
+    def _emit(self, code: int, value: int) -> None:
+        self.journal.record(code, self.time, value)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any, Callable, Dict, Type
 
 from .model import Direction
 
@@ -37,18 +38,21 @@ class EmergencyStop(Event):
     active: bool
 
 
+_FORMATTERS: Dict[Type[Event], Callable[[Any], str]] = {
+    RequestAdded: lambda event: f"Request added: floor {event.floor}",
+    ArrivedAtFloor: lambda event: f"Arrived at floor {event.floor}",
+    DoorOpened: lambda event: f"Door opened at floor {event.floor}",
+    DoorClosed: lambda event: f"Door closed at floor {event.floor}",
+    DirectionChanged: lambda event: f"Direction changed: {event.direction.value}",
+    EmergencyStop: lambda event: f"Emergency stop {'engaged' if event.active else 'cleared'}",
+}
+
+
 def format_event(event: Event) -> str:
-    if isinstance(event, RequestAdded):
-        return f"Request added: floor {event.floor}"
-    if isinstance(event, ArrivedAtFloor):
-        return f"Arrived at floor {event.floor}"
-    if isinstance(event, DoorOpened):
-        return f"Door opened at floor {event.floor}"
-    if isinstance(event, DoorClosed):
-        return f"Door closed at floor {event.floor}"
-    if isinstance(event, DirectionChanged):
-        return f"Direction changed: {event.direction.value}"
-    if isinstance(event, EmergencyStop):
-        state = "engaged" if event.active else "cleared"
-        return f"Emergency stop {state}"
-    return "Unknown event"
+    formatter = _FORMATTERS.get(type(event))
+    if formatter is None:
+        for event_type, candidate in _FORMATTERS.items():
+            if isinstance(event, event_type):
+                return candidate(event)
+        return "Unknown event"
+    return formatter(event)
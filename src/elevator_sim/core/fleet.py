@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import Union
+
+import numpy as np
+
+from .model import Direction, DoorState, ElevatorState
+
+ArrayLike = Union[float, np.ndarray]
+
+DIRECTION_CODES = {Direction.IDLE: 0, Direction.UP: 1, Direction.DOWN: -1}
+DOOR_CODES = {DoorState.CLOSED: 0, DoorState.OPENING: 1, DoorState.OPEN: 2, DoorState.CLOSING: 3}
+NO_TARGET = 0
+
+_DIRECTIONS = {code: direction for direction, code in DIRECTION_CODES.items()}
+_DOORS = {code: door for door, code in DOOR_CODES.items()}
+_CLOSED = DOOR_CODES[DoorState.CLOSED]
+_OPENING = DOOR_CODES[DoorState.OPENING]
+_OPEN = DOOR_CODES[DoorState.OPEN]
+_CLOSING = DOOR_CODES[DoorState.CLOSING]
+
+
+class FleetEngine:
+    """Struct-of-arrays engine advancing many independent cars in one batch.
+
+    Every car behaves like an ElevatorController driven by a SimpleScheduler:
+    one target per car, the same door state machine and the same movement
+    clamping, but all cars are stepped together with masked array operations.
+    Floors are 1-based; a target of NO_TARGET means the car has nothing to do.
+    """
+
+    def __init__(
+        self,
+        car_count: int,
+        floor_count: int = 6,
+        speed_fps: ArrayLike = 1.0,
+        door_open_time: ArrayLike = 0.6,
+        door_close_time: ArrayLike = 0.6,
+        dwell_time: ArrayLike = 1.5,
+    ) -> None:
+        self.car_count = car_count
+        self.floor_count = max(2, floor_count)
+        self.speed_fps = self._per_car(speed_fps)
+        self.door_open_time = self._per_car(door_open_time)
+        self.door_close_time = self._per_car(door_close_time)
+        self.dwell_time = self._per_car(dwell_time)
+
+        self.positions = np.ones(car_count, dtype=np.float64)
+        self.directions = np.zeros(car_count, dtype=np.int8)
+        self.door_states = np.full(car_count, _CLOSED, dtype=np.int8)
+        self.door_timers = np.zeros(car_count, dtype=np.float64)
+        self.targets = np.full(car_count, NO_TARGET, dtype=np.int32)
+        self.emergency = np.zeros(car_count, dtype=bool)
+        self.arrivals = np.zeros(car_count, dtype=np.int64)
+
+    def request(self, cars: np.ndarray, floors: np.ndarray) -> np.ndarray:
+        """Set targets for the given cars; returns the mask of accepted requests."""
+        cars = np.asarray(cars)
+        floors = np.asarray(floors)
+        accepted = (floors >= 1) & (floors <= self.floor_count)
+        self.targets[cars[accepted]] = floors[accepted]
+        return accepted
+
+    def step(self, dt: float) -> None:
+        if dt <= 0.0:
+            return
+        active = ~self.emergency
+        self._advance_doors(dt, active)
+        self._advance_cars(dt, active & (self.door_states == _CLOSED))
+
+    def state(self, index: int) -> ElevatorState:
+        target = int(self.targets[index])
+        return ElevatorState(
+            current_floor=float(self.positions[index]),
+            direction=_DIRECTIONS[int(self.directions[index])],
+            door_state=_DOORS[int(self.door_states[index])],
+            speed_fps=float(self.speed_fps[index]),
+            target_floor=None if target == NO_TARGET else target,
+        )
+
+    def _advance_doors(self, dt: float, active: np.ndarray) -> None:
+        doors = self.door_states
+        opening = active & (doors == _OPENING)
+        opened = active & (doors == _OPEN)
+        closing = active & (doors == _CLOSING)
+        in_motion = opening | opened | closing
+
+        self.door_timers[in_motion] -= dt
+        expired = in_motion & (self.door_timers <= 0.0)
+
+        finished_opening = opening & expired
+        doors[finished_opening] = _OPEN
+        self.door_timers[finished_opening] = self.dwell_time[finished_opening]
+
+        finished_dwell = opened & expired
+        doors[finished_dwell] = _CLOSING
+        self.door_timers[finished_dwell] = self.door_close_time[finished_dwell]
+
+        doors[closing & expired] = _CLOSED
+
+    def _advance_cars(self, dt: float, ready: np.ndarray) -> None:
+        has_target = self.targets != NO_TARGET
+        self.directions[ready & ~has_target] = DIRECTION_CODES[Direction.IDLE]
+
+        moving = ready & has_target
+        if not moving.any():
+            return
+
+        targets = self.targets.astype(np.float64)
+        delta = targets - self.positions
+        at_floor = moving & (np.abs(delta) < 1e-3)
+        travelling = moving & ~at_floor
+
+        step = self.speed_fps * dt
+        self.positions[travelling] += np.clip(delta, -step, step)[travelling]
+        self.directions[travelling] = np.sign(delta[travelling]).astype(np.int8)
+
+        arrived = at_floor | (travelling & (np.abs(targets - self.positions) < 1e-3))
+        self._arrive(arrived, targets)
+
+    def _arrive(self, arrived: np.ndarray, targets: np.ndarray) -> None:
+        self.positions[arrived] = targets[arrived]
+        self.targets[arrived] = NO_TARGET
+        self.door_states[arrived] = _OPENING
+        self.door_timers[arrived] = self.door_open_time[arrived]
+        self.directions[arrived] = DIRECTION_CODES[Direction.IDLE]
+        self.arrivals[arrived] += 1
+
+    def _per_car(self, value: ArrayLike) -> np.ndarray:
+        return np.array(np.broadcast_to(np.asarray(value, dtype=np.float64), (self.car_count,)))
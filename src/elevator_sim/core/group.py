@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .controller import ElevatorController
+from .events import ArrivedAtFloor, Event
+from .model import Direction
+from .scheduler import BaseScheduler, FifoScheduler
+
+
+class BaseDispatcher:
+    name = "Base"
+
+    def assign(self, floor: int, cars: Sequence[ElevatorController], loads: Sequence[int]) -> int:
+        raise NotImplementedError
+
+
+class RoundRobinDispatcher(BaseDispatcher):
+    name = "Round robin"
+
+    def __init__(self) -> None:
+        self._next = 0
+
+    def assign(self, floor: int, cars: Sequence[ElevatorController], loads: Sequence[int]) -> int:
+        index = self._next % len(cars)
+        self._next = index + 1
+        return index
+
+
+class NearestCarDispatcher(BaseDispatcher):
+    name = "Nearest car"
+
+    def __init__(self, stop_penalty: float = 2.0) -> None:
+        self.stop_penalty = stop_penalty
+
+    def assign(self, floor: int, cars: Sequence[ElevatorController], loads: Sequence[int]) -> int:
+        best_index = 0
+        best_cost = float("inf")
+        for index, car in enumerate(cars):
+            cost = self._cost(floor, car) + loads[index] * self.stop_penalty
+            if cost < best_cost:
+                best_index = index
+                best_cost = cost
+        return best_index
+
+    def _cost(self, floor: int, car: ElevatorController) -> float:
+        position = car.state.current_floor
+        direction = car.state.direction
+        target = car.state.target_floor
+        moving_away = (direction == Direction.UP and floor < position) or (
+            direction == Direction.DOWN and floor > position
+        )
+        if moving_away and target is not None:
+            return abs(target - position) + abs(target - floor)
+        return abs(floor - position)
+
+
+class ElevatorGroup:
+    """A bank of cars sharing hall requests through a dispatcher.
+
+    Each car is a full ElevatorController with its own scheduler queue. Hall
+    requests are deduplicated per floor and tracked until the assigned car
+    arrives, so per-tick work is linear in the number of cars.
+    """
+
+    def __init__(
+        self,
+        car_count: int = 4,
+        floor_count: int = 6,
+        dispatcher: Optional[BaseDispatcher] = None,
+        scheduler_factory: Callable[[], BaseScheduler] = FifoScheduler,
+        speed_fps: float = 1.0,
+        door_open_time: float = 0.6,
+        door_close_time: float = 0.6,
+        dwell_time: float = 1.5,
+        throughput_window: float = 300.0,
+    ) -> None:
+        self.floor_count = max(2, floor_count)
+        self.cars = [
+            ElevatorController(
+                floor_count=self.floor_count,
+                scheduler=scheduler_factory(),
+                speed_fps=speed_fps,
+                door_open_time=door_open_time,
+                door_close_time=door_close_time,
+                dwell_time=dwell_time,
+            )
+            for _ in range(max(1, car_count))
+        ]
+        self.dispatcher = dispatcher or NearestCarDispatcher()
+        self.throughput_window = throughput_window
+        self.time = 0.0
+        self.served = 0
+        self._assignments: Dict[int, int] = {}
+        self._loads = [0] * len(self.cars)
+        self._served_times: Deque[float] = deque()
+        self._events: List[Tuple[int, Event]] = []
+
+    def add_request(self, floor: int) -> Optional[int]:
+        if floor < 1 or floor > self.floor_count:
+            return None
+        assigned = self._assignments.get(floor)
+        if assigned is not None:
+            return assigned
+        index = self.dispatcher.assign(floor, self.cars, self._loads)
+        car = self.cars[index]
+        if not car.add_request(floor):
+            return None
+        self._assignments[floor] = index
+        self._loads[index] += 1
+        self._collect_events(index, car)
+        return index
+
+    def add_car_request(self, car_index: int, floor: int) -> bool:
+        car = self.cars[car_index]
+        accepted = car.add_request(floor)
+        self._collect_events(car_index, car)
+        return accepted
+
+    def update(self, dt: float) -> None:
+        if dt <= 0.0:
+            return
+        self.time += dt
+        for index, car in enumerate(self.cars):
+            car.update(dt)
+            self._collect_events(index, car)
+        self._expire_served()
+
+    def throughput(self) -> int:
+        """Hall requests served within the last `throughput_window` seconds."""
+        self._expire_served()
+        return len(self._served_times)
+
+    def pending_requests(self) -> List[int]:
+        return sorted(self._assignments)
+
+    def assignment(self, floor: int) -> Optional[int]:
+        return self._assignments.get(floor)
+
+    def consume_events(self) -> List[Tuple[int, Event]]:
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+    def _collect_events(self, index: int, car: ElevatorController) -> None:
+        for event in car.consume_events():
+            if isinstance(event, ArrivedAtFloor) and self._assignments.get(event.floor) == index:
+                del self._assignments[event.floor]
+                self._loads[index] -= 1
+                self.served += 1
+                self._served_times.append(self.time)
+            self._events.append((index, event))
+
+    def _expire_served(self) -> None:
+        horizon = self.time - self.throughput_window
+        while self._served_times and self._served_times[0] < horizon:
+            self._served_times.popleft()
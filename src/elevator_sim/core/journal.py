@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Iterator, List, Tuple
+
+from .events import (
+    ArrivedAtFloor,
+    DirectionChanged,
+    DoorClosed,
+    DoorOpened,
+    EmergencyStop,
+    Event,
+    RequestAdded,
+)
+from .model import Direction
+
+REQUEST_ADDED = 0
+ARRIVED_AT_FLOOR = 1
+DOOR_OPENED = 2
+DOOR_CLOSED = 3
+DIRECTION_CHANGED = 4
+EMERGENCY_STOP = 5
+
+DEFAULT_CAPACITY = 4096
+
+DIRECTION_VALUES = (Direction.UP, Direction.DOWN, Direction.IDLE)
+DIRECTION_INDEX = {direction: index for index, direction in enumerate(DIRECTION_VALUES)}
+
+_DECODERS: Tuple[Callable[[int], Event], ...] = (
+    RequestAdded,
+    ArrivedAtFloor,
+    DoorOpened,
+    DoorClosed,
+    lambda value: DirectionChanged(DIRECTION_VALUES[value]),
+    lambda value: EmergencyStop(bool(value)),
+)
+
+
+def decode(code: int, value: int) -> Event:
+    return _DECODERS[code](value)
+
+
+def encode(event: Event) -> Tuple[int, int]:
+    if isinstance(event, RequestAdded):
+        return REQUEST_ADDED, event.floor
+    if isinstance(event, ArrivedAtFloor):
+        return ARRIVED_AT_FLOOR, event.floor
+    if isinstance(event, DoorOpened):
+        return DOOR_OPENED, event.floor
+    if isinstance(event, DoorClosed):
+        return DOOR_CLOSED, event.floor
+    if isinstance(event, DirectionChanged):
+        return DIRECTION_CHANGED, DIRECTION_INDEX[event.direction]
+    if isinstance(event, EmergencyStop):
+        return EMERGENCY_STOP, int(event.active)
+    raise TypeError(f"Cannot journal {type(event).__name__}")
+
+
+Segment = Tuple[memoryview, memoryview, memoryview]
+
+
+class JournalBatch:
+    """Records drained from an EventJournal, as views into its ring buffer.
+
+    Nothing is copied or decoded until the batch is iterated. The views share
+    memory with the journal, so consume the batch before recording again.
+    """
+
+    def __init__(self, segments: List[Segment]) -> None:
+        self._segments = segments
+
+    def __len__(self) -> int:
+        return sum(len(codes) for codes, _, _ in self._segments)
+
+    def __iter__(self) -> Iterator[Event]:
+        for codes, _, values in self._segments:
+            for code, value in zip(codes, values):
+                yield _DECODERS[code](value)
+
+    def records(self) -> Iterator[Tuple[int, float, int]]:
+        for codes, times, values in self._segments:
+            yield from zip(codes, times, values)
+
+    def timed(self) -> Iterator[Tuple[float, Event]]:
+        for code, time, value in self.records():
+            yield time, _DECODERS[code](value)
+
+
+class EventJournal:
+    """Preallocated ring buffer of fixed-width event records.
+
+    Each record is a type code, the simulated time and one integer payload
+    (a floor, a direction index or a flag): 13 bytes instead of a dataclass
+    instance per event. When the ring is full the oldest record is
+    overwritten and counted in `dropped`, so drain at least every
+    `capacity` events or size the journal for the gap.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.dropped = 0
+        self._codes = array("b", bytes(capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("i", bytes(4 * capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def record(self, code: int, time: float, value: int) -> None:
+        index = (self._start + self._size) % self.capacity
+        if self._size == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+            self.dropped += 1
+        else:
+            self._size += 1
+        self._codes[index] = code
+        self._times[index] = time
+        self._values[index] = value
+
+    def append(self, event: Event, time: float) -> None:
+        code, value = encode(event)
+        self.record(code, time, value)
+
+    def drain(self) -> JournalBatch:
+        segments = self._peek()
+        self._start = (self._start + self._size) % self.capacity
+        self._size = 0
+        return JournalBatch(segments)
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+    def copy(self) -> EventJournal:
+        clone = EventJournal.__new__(EventJournal)
+        clone.capacity = self.capacity
+        clone.dropped = self.dropped
+        clone._codes = self._codes[:]
+        clone._times = self._times[:]
+        clone._values = self._values[:]
+        clone._start = self._start
+        clone._size = self._size
+        return clone
+
+    def pending(self) -> Tuple[array, array, array]:
+        """Copies of the undrained records, oldest first."""
+        end = self._start + self._size
+        if end <= self.capacity:
+            span = slice(self._start, end)
+            return self._codes[span], self._times[span], self._values[span]
+        head, tail = slice(self._start, self.capacity), slice(0, end - self.capacity)
+        return (
+            self._codes[head] + self._codes[tail],
+            self._times[head] + self._times[tail],
+            self._values[head] + self._values[tail],
+        )
+
+    def _peek(self) -> List[Segment]:
+        start, size = self._start, self._size
+        end = start + size
+        if end <= self.capacity:
+            return [self._segment(start, end)] if size else []
+        return [self._segment(start, self.capacity), self._segment(0, end - self.capacity)]
+
+    def _segment(self, start: int, end: int) -> Segment:
+        return (
+            memoryview(self._codes)[start:end],
+            memoryview(self._times)[start:end],
+            memoryview(self._values)[start:end],
+        )
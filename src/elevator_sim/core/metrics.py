@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .events import ArrivedAtFloor, DirectionChanged, DoorClosed, DoorOpened, Event, RequestAdded
+from .model import Direction
+from .simulation import Simulation, TimedRequest
+
+
+class QuantileSketch:
+    """Streaming quantiles with bounded memory and relative accuracy.
+
+    Samples are counted in logarithmic buckets, so any reported quantile is
+    within `relative_accuracy` of a real sample. When more than `max_buckets`
+    are in use the lowest ones are merged, which only costs accuracy at the
+    bottom of the distribution.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._zeros = 0
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if value <= 0.0:
+            self._zeros += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                value = 2.0 * self._gamma**key / (self._gamma + 1.0)
+                return min(max(value, self.minimum), self.maximum)
+        return self.maximum
+
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def _collapse(self) -> None:
+        lowest = min(self._buckets)
+        count = self._buckets.pop(lowest)
+        target = min(self._buckets)
+        self._buckets[target] += count
+
+
+@dataclass(frozen=True)
+class DistributionSummary:
+    count: int
+    mean: Optional[float]
+    p50: Optional[float]
+    p95: Optional[float]
+    p99: Optional[float]
+    maximum: Optional[float]
+
+
+@dataclass(frozen=True)
+class KpiSummary:
+    request_wait: DistributionSummary
+    passenger_wait: DistributionSummary
+    journey_time: DistributionSummary
+    stops_per_trip: DistributionSummary
+    utilization: float
+
+
+class KpiCollector:
+    """Service-quality metrics computed from the simulation's event stream.
+
+    Request wait runs from RequestAdded to the first ArrivedAtFloor at that
+    floor. Passenger wait, journey time (to destination) and stops per trip
+    come from completed passenger trips. Utilization is the share of time the
+    car was moving or had its doors away from closed.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.request_wait = QuantileSketch(relative_accuracy)
+        self.passenger_wait = QuantileSketch(relative_accuracy)
+        self.journey_time = QuantileSketch(relative_accuracy)
+        self.stops_per_trip = QuantileSketch(relative_accuracy)
+        self._open_requests: Dict[int, float] = {}
+        self._moving = False
+        self._doors_busy = False
+        self._busy_since: Optional[float] = None
+        self._busy_time = 0.0
+        self._last_time = 0.0
+
+    def attach(self, simulation: Simulation) -> None:
+        simulation.subscribe(self.observe)
+        simulation.subscribe_trips(self.record_trip)
+
+    def observe(self, time: float, event: Event) -> None:
+        self._last_time = time
+        if isinstance(event, RequestAdded):
+            self._open_requests.setdefault(event.floor, time)
+        elif isinstance(event, ArrivedAtFloor):
+            requested_at = self._open_requests.pop(event.floor, None)
+            if requested_at is not None:
+                self.request_wait.add(time - requested_at)
+            self._set_busy(time, moving=self._moving, doors_busy=True)
+        elif isinstance(event, DoorOpened):
+            self._set_busy(time, moving=self._moving, doors_busy=True)
+        elif isinstance(event, DoorClosed):
+            self._set_busy(time, moving=self._moving, doors_busy=False)
+        elif isinstance(event, DirectionChanged):
+            self._set_busy(time, moving=event.direction != Direction.IDLE, doors_busy=self._doors_busy)
+
+    def record_trip(self, request: TimedRequest, boarded_at: float, delivered_at: float, stops: int) -> None:
+        self.passenger_wait.add(boarded_at - request.time)
+        self.journey_time.add(delivered_at - request.time)
+        self.stops_per_trip.add(float(stops))
+
+    def utilization(self, until: Optional[float] = None) -> float:
+        end = self._last_time if until is None else until
+        busy = self._busy_time
+        if self._busy_since is not None:
+            busy += end - self._busy_since
+        return busy / end if end > 0.0 else 0.0
+
+    def summary(self, until: Optional[float] = None) -> KpiSummary:
+        return KpiSummary(
+            request_wait=_summarize(self.request_wait),
+            passenger_wait=_summarize(self.passenger_wait),
+            journey_time=_summarize(self.journey_time),
+            stops_per_trip=_summarize(self.stops_per_trip),
+            utilization=self.utilization(until),
+        )
+
+    def _set_busy(self, time: float, moving: bool, doors_busy: bool) -> None:
+        was_busy = self._busy_since is not None
+        self._moving = moving
+        self._doors_busy = doors_busy
+        busy = moving or doors_busy
+        if busy and not was_busy:
+            self._busy_since = time
+        elif was_busy and not busy:
+            self._busy_time += time - self._busy_since
+            self._busy_since = None
+
+
+def format_kpis(summary: KpiSummary) -> List[str]:
+    lines = []
+    for label, distribution in (
+        ("Request wait (s)", summary.request_wait),
+        ("Passenger wait (s)", summary.passenger_wait),
+        ("Journey time (s)", summary.journey_time),
+        ("Stops per trip", summary.stops_per_trip),
+    ):
+        if distribution.count == 0:
+            continue
+        lines.append(
+            f"{label}: n={distribution.count} mean={distribution.mean:.2f} "
+            f"p50={distribution.p50:.2f} p95={distribution.p95:.2f} p99={distribution.p99:.2f} "
+            f"max={distribution.maximum:.2f}"
+        )
+    lines.append(f"Utilization: {summary.utilization:.1%}")
+    return lines
+
+
+def _summarize(sketch: QuantileSketch) -> DistributionSummary:
+    return DistributionSummary(
+        count=sketch.count,
+        mean=sketch.mean(),
+        p50=sketch.quantile(0.5),
+        p95=sketch.quantile(0.95),
+        p99=sketch.quantile(0.99),
+        maximum=sketch.maximum if sketch.count else None,
+    )
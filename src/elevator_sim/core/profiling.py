@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import bisect
+import json
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Tuple, Union
+
+# Upper bucket edges in seconds; the last bucket takes everything slower.
+BUCKET_EDGES = (1e-5, 3e-5, 1e-4, 3e-4, 1e-3, 3e-3, 1e-2, 3e-2, 1e-1)
+BUCKET_LABELS = ("10us", "30us", "100us", "300us", "1ms", "3ms", "10ms", "30ms", "100ms", "slower")
+
+
+@dataclass(frozen=True)
+class SpanStats:
+    count: int  # since the last reset; the rest describe the rolling window
+    mean: float
+    p50: float
+    p95: float
+    max: float
+    histogram: Tuple[int, ...]
+
+
+class Profiler:
+    """Named timing spans, each kept as a rolling window of its last samples.
+
+    Disabled by default. Call sites bracket a phase with start() and lap(),
+    which only cost a method call and a flag check while disabled:
+
+        started = profiler.start()
+        render()
+        started = profiler.lap("render", started)
+        present()
+        profiler.lap("present", started)
+
+    Samples may be recorded from several threads; stats are read by one.
+    """
+
+    def __init__(self, window: int = 600, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.enabled = False
+        self.window = window
+        self._clock = clock
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def start(self) -> float:
+        return self._clock() if self.enabled else 0.0
+
+    def lap(self, name: str, started: float) -> float:
+        """Record the time since `started` under `name`; returns now for the next lap."""
+        if not self.enabled:
+            return 0.0
+        now = self._clock()
+        if started:  # 0.0 means profiling was off when the span began
+            self.record(name, now - started)
+        return now
+
+    def record(self, name: str, seconds: float) -> None:
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples.setdefault(name, deque(maxlen=self.window))
+        samples.append(seconds)
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._counts.clear()
+
+    def stats(self) -> Dict[str, SpanStats]:
+        result = {}
+        for name, samples in list(self._samples.items()):
+            values = sorted(samples)
+            if not values:
+                continue
+            histogram = [0] * (len(BUCKET_EDGES) + 1)
+            for value in values:
+                histogram[bisect.bisect_left(BUCKET_EDGES, value)] += 1
+            result[name] = SpanStats(
+                count=self._counts.get(name, len(values)),
+                mean=sum(values) / len(values),
+                p50=values[len(values) // 2],
+                p95=values[min(len(values) - 1, int(len(values) * 0.95))],
+                max=values[-1],
+                histogram=tuple(histogram),
+            )
+        return result
+
+    def report(self) -> List[str]:
+        """One line per span: mean, p95 and max in ms and a histogram sparkline."""
+        lines = []
+        for name, stats in sorted(self.stats().items()):
+            lines.append(
+                f"{name:<20} {stats.mean * 1e3:7.3f} {stats.p95 * 1e3:7.3f} {stats.max * 1e3:7.3f}  "
+                f"{sparkline(stats.histogram)}"
+            )
+        return lines
+
+    def dump(self, target: Union[str, Path]) -> None:
+        document = {
+            "window": self.window,
+            "buckets": list(BUCKET_LABELS),
+            "spans": {name: asdict(stats) for name, stats in sorted(self.stats().items())},
+        }
+        with open(target, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+            handle.write("\n")
+
+
+_BARS = " ▁▂▃▄▅▆▇█"
+
+
+def sparkline(histogram: Tuple[int, ...]) -> str:
+    peak = max(histogram) or 1
+    return "".join(_BARS[-(-count * (len(_BARS) - 1) // peak)] for count in histogram)
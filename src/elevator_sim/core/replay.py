@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, List, Union
+
+from .controller import ElevatorController
+from .journal import DIRECTION_INDEX
+from .model import DoorState
+from .scheduler import BaseScheduler, create_scheduler
+
+MAGIC = b"ELEVREC1"
+
+_HEADER = struct.Struct("<8sidddddB")
+_UPDATE = struct.Struct("<Bd")
+_INPUT = struct.Struct("<Bdi")
+_CHECKPOINT = struct.Struct("<BQ")
+_STATE = struct.Struct("<dbbiddB")
+
+OP_UPDATE = 0
+OP_ADD_REQUEST = 1
+OP_OPEN_DOOR = 2
+OP_CLOSE_DOOR = 3
+OP_EMERGENCY = 4
+OP_SCHEDULER = 5
+OP_FLOOR_COUNT = 6
+OP_RESET = 7
+OP_CHECKPOINT = 8
+
+_DOOR_INDEX = {door: index for index, door in enumerate(DoorState)}
+
+
+def state_hash(controller: ElevatorController, previous: int = 0) -> int:
+    """Chain `previous` with everything that determines the controller's future."""
+    state = controller.state
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(previous.to_bytes(8, "little"))
+    digest.update(
+        _STATE.pack(
+            state.current_floor,
+            DIRECTION_INDEX[state.direction],
+            _DOOR_INDEX[state.door_state],
+            -1 if state.target_floor is None else state.target_floor,
+            controller.door_timer,
+            controller.time,
+            int(controller.emergency_stop),
+        )
+    )
+    digest.update(array("i", controller.pending_requests()).tobytes())
+    return int.from_bytes(digest.digest(), "little")
+
+
+class SessionRecorder:
+    """Forwards inputs to a controller and records them, with every dt, to a file.
+
+    Start recording from a freshly reset controller: the header stores its
+    configuration and clock, and replay rebuilds it from that alone. A chained
+    state hash is written every `checkpoint_interval` updates.
+    """
+
+    def __init__(
+        self,
+        controller: ElevatorController,
+        target: Union[str, Path, BinaryIO],
+        checkpoint_interval: int = 30,
+    ) -> None:
+        self.controller = controller
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        if isinstance(target, (str, Path)):
+            self._stream: BinaryIO = open(target, "wb")
+            self._owns_stream = True
+        else:
+            self._stream = target
+            self._owns_stream = False
+        self._updates = 0
+        self._hash = 0
+        self._write_header()
+
+    def add_request(self, floor: int) -> bool:
+        self._input(OP_ADD_REQUEST, floor)
+        return self.controller.add_request(floor)
+
+    def request_open_door(self) -> bool:
+        self._input(OP_OPEN_DOOR)
+        return self.controller.request_open_door()
+
+    def request_close_door(self) -> bool:
+        self._input(OP_CLOSE_DOOR)
+        return self.controller.request_close_door()
+
+    def set_emergency_stop(self, active: bool) -> None:
+        self._input(OP_EMERGENCY, int(active))
+        self.controller.set_emergency_stop(active)
+
+    def set_scheduler(self, scheduler: BaseScheduler) -> None:
+        name = scheduler.name.encode("utf-8")
+        self._input(OP_SCHEDULER, len(name))
+        self._stream.write(name)
+        self.controller.set_scheduler(scheduler)
+
+    def set_floor_count(self, floor_count: int) -> None:
+        self._input(OP_FLOOR_COUNT, floor_count)
+        self.controller.set_floor_count(floor_count)
+
+    def reset(self) -> None:
+        self._input(OP_RESET)
+        self.controller.reset()
+
+    def update(self, dt: float) -> None:
+        self._stream.write(_UPDATE.pack(OP_UPDATE, dt))
+        self.controller.update(dt)
+        self._updates += 1
+        if self._updates % self.checkpoint_interval == 0:
+            self._hash = state_hash(self.controller, self._hash)
+            self._stream.write(_CHECKPOINT.pack(OP_CHECKPOINT, self._hash))
+
+    def close(self) -> None:
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+    def _write_header(self) -> None:
+        controller = self.controller
+        name = controller.scheduler.name.encode("utf-8")
+        self._stream.write(
+            _HEADER.pack(
+                MAGIC,
+                controller.floor_count,
+                controller.state.speed_fps,
+                controller.door_open_time,
+                controller.door_close_time,
+                controller.dwell_time,
+                controller.time,
+                len(name),
+            )
+        )
+        self._stream.write(name)
+
+    def _input(self, op: int, value: int = 0) -> None:
+        self._stream.write(_INPUT.pack(op, self.controller.time, value))
+
+
+@dataclass
+class ReplayResult:
+    controller: ElevatorController
+    updates: int = 0
+    inputs: int = 0
+    checkpoints: int = 0
+    mismatches: List[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+def replay(source: Union[str, Path, bytes], stop_at_mismatch: bool = False) -> ReplayResult:
+    """Re-run a recorded session headless and verify every state checkpoint."""
+    data = source if isinstance(source, bytes) else Path(source).read_bytes()
+    magic, floors, speed, door_open, door_close, dwell, start_time, name_len = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not an elevator session recording")
+    offset = _HEADER.size
+    scheduler_name = data[offset : offset + name_len].decode("utf-8")
+    offset += name_len
+
+    controller = ElevatorController(
+        floor_count=floors,
+        scheduler=create_scheduler(scheduler_name),
+        speed_fps=speed,
+        door_open_time=door_open,
+        door_close_time=door_close,
+        dwell_time=dwell,
+    )
+    controller.time = start_time
+    result = ReplayResult(controller)
+    running_hash = 0
+    size = len(data)
+    update = controller.update
+
+    while offset < size:
+        op = data[offset]
+        if op == OP_UPDATE:
+            update(_UPDATE.unpack_from(data, offset)[1])
+            offset += _UPDATE.size
+            result.updates += 1
+            continue
+        if op == OP_CHECKPOINT:
+            expected = _CHECKPOINT.unpack_from(data, offset)[1]
+            offset += _CHECKPOINT.size
+            running_hash = state_hash(controller, running_hash)
+            result.checkpoints += 1
+            if running_hash != expected:
+                result.mismatches.append(result.updates)
+                if stop_at_mismatch:
+                    break
+                running_hash = expected
+            continue
+
+        _, _, value = _INPUT.unpack_from(data, offset)
+        offset += _INPUT.size
+        result.inputs += 1
+        if op == OP_ADD_REQUEST:
+            controller.add_request(value)
+        elif op == OP_OPEN_DOOR:
+            controller.request_open_door()
+        elif op == OP_CLOSE_DOOR:
+            controller.request_close_door()
+        elif op == OP_EMERGENCY:
+            controller.set_emergency_stop(bool(value))
+        elif op == OP_SCHEDULER:
+            controller.set_scheduler(create_scheduler(data[offset : offset + value].decode("utf-8")))
+            offset += value
+        elif op == OP_FLOOR_COUNT:
+            controller.set_floor_count(value)
+        elif op == OP_RESET:
+            controller.reset()
+        else:
+            raise ValueError(f"Unknown record type {op} at offset {offset}")
+
+    return result
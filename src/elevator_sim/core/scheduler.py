@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import copy
+import math
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass
-from typing import Deque, List, Optional, Set
-from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Type
+from collections import OrderedDict
 
 from .model import Direction
 
+if TYPE_CHECKING:
+    from .profiling import Profiler
+
 
 @dataclass(frozen=True)
 class NextStop:
@@ -15,8 +21,16 @@ class NextStop:
 
 class BaseScheduler:
     name = "Base"
+    # False when next_stop depends on the exact position, not just on the
+    # whole floors around it, so DecisionCache must ask every time.
+    cacheable = True
 
     def add_request(self, floor: int) -> None:
+        """Queue a stop at `floor`, 1 or above.
+
+        ElevatorController.add_request rejects floors outside the building
+        before they get here; a scheduler may raise ValueError for floors below 1.
+        """
         raise NotImplementedError
 
     def remove_request(self, floor: int) -> None:
@@ -28,9 +42,35 @@ class BaseScheduler:
     def pending_requests(self) -> List[int]:
         raise NotImplementedError
 
+    def has_requests(self) -> bool:
+        return bool(self.pending_requests())
+
     def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
         raise NotImplementedError
 
+    def configure(
+        self,
+        floor_count: int,
+        speed_fps: float,
+        door_open_time: float,
+        dwell_time: float,
+        door_close_time: float,
+    ) -> None:
+        """The car's parameters, passed by the controller; only schedulers that plan by time use them."""
+
+    def get_state(self) -> List[int]:
+        return self.pending_requests()
+
+    def set_state(self, values: List[int]) -> None:
+        self.clear()
+        for floor in values:
+            self.add_request(floor)
+
+    def clone(self) -> BaseScheduler:
+        clone = type(self)()
+        clone.set_state(self.get_state())
+        return clone
+
 
 class SimpleScheduler(BaseScheduler):
     name = "Simple"
@@ -51,6 +91,14 @@ class SimpleScheduler(BaseScheduler):
     def pending_requests(self) -> List[int]:
         return [self._target] if self._target is not None else []
 
+    def has_requests(self) -> bool:
+        return self._target is not None
+
+    def clone(self) -> SimpleScheduler:
+        clone = SimpleScheduler()
+        clone._target = self._target
+        return clone
+
     def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
         if self._target is None:
             return None
@@ -64,17 +112,17 @@ class FifoScheduler(BaseScheduler):
     name = "FIFO"
 
     def __init__(self) -> None:
-        self._queue: Deque[int] = deque()
+        # OrderedDict keys act as an insertion-ordered set: O(1) dedupe, removal
+        # and head lookup, where a plain dict's iteration would have to skip
+        # the holes left behind by repeatedly removing the head.
+        self._queue: "OrderedDict[int, None]" = OrderedDict()
 
     def add_request(self, floor: int) -> None:
         if floor not in self._queue:
-            self._queue.append(floor)
+            self._queue[floor] = None
 
     def remove_request(self, floor: int) -> None:
-        try:
-            self._queue.remove(floor)
-        except ValueError:
-            return
+        self._queue.pop(floor, None)
 
     def clear(self) -> None:
         self._queue.clear()
@@ -82,10 +130,18 @@ class FifoScheduler(BaseScheduler):
     def pending_requests(self) -> List[int]:
         return list(self._queue)
 
+    def has_requests(self) -> bool:
+        return bool(self._queue)
+
+    def clone(self) -> FifoScheduler:
+        clone = FifoScheduler()
+        clone._queue = self._queue.copy()
+        return clone
+
     def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
         if not self._queue:
             return None
-        target = self._queue[0]
+        target = next(iter(self._queue))
         if current_floor == target:
             return NextStop(target, Direction.IDLE)
         next_dir = Direction.UP if target > current_floor else Direction.DOWN
@@ -97,44 +153,348 @@ class ScanScheduler(BaseScheduler):
 
     def __init__(self) -> None:
         self._requests: Set[int] = set()
+        self._floors: List[int] = []
 
     def add_request(self, floor: int) -> None:
-        self._requests.add(floor)
+        if floor not in self._requests:
+            self._requests.add(floor)
+            insort(self._floors, floor)
 
     def remove_request(self, floor: int) -> None:
-        self._requests.discard(floor)
+        if floor in self._requests:
+            self._requests.discard(floor)
+            del self._floors[bisect_left(self._floors, floor)]
 
     def clear(self) -> None:
         self._requests.clear()
+        self._floors.clear()
 
     def pending_requests(self) -> List[int]:
-        return sorted(self._requests)
+        return list(self._floors)
+
+    def has_requests(self) -> bool:
+        return bool(self._floors)
+
+    def clone(self) -> ScanScheduler:
+        clone = type(self)()
+        clone._requests = set(self._requests)
+        clone._floors = list(self._floors)
+        return clone
 
     def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
-        if not self._requests:
+        if not self._floors:
             return None
 
-        floors = sorted(self._requests)
-
         if direction == Direction.UP:
-            ahead = [floor for floor in floors if floor > current_floor]
-            if ahead:
-                return NextStop(min(ahead), Direction.UP)
-            behind = [floor for floor in floors if floor < current_floor]
-            if behind:
-                return NextStop(max(behind), Direction.DOWN)
+            above = self._above(current_floor)
+            if above is not None:
+                return NextStop(above, Direction.UP)
+            below = self._below(current_floor)
+            if below is not None:
+                return NextStop(below, Direction.DOWN)
         elif direction == Direction.DOWN:
-            behind = [floor for floor in floors if floor < current_floor]
-            if behind:
-                return NextStop(max(behind), Direction.DOWN)
-            ahead = [floor for floor in floors if floor > current_floor]
-            if ahead:
-                return NextStop(min(ahead), Direction.UP)
+            below = self._below(current_floor)
+            if below is not None:
+                return NextStop(below, Direction.DOWN)
+            above = self._above(current_floor)
+            if above is not None:
+                return NextStop(above, Direction.UP)
         else:
-            nearest = min(floors, key=lambda f: (abs(f - current_floor), f))
+            nearest = self._nearest(current_floor)
             if nearest == current_floor:
                 return NextStop(nearest, Direction.IDLE)
             next_dir = Direction.UP if nearest > current_floor else Direction.DOWN
             return NextStop(nearest, next_dir)
 
         return None
+
+    def _above(self, current_floor: float) -> Optional[int]:
+        index = bisect_right(self._floors, current_floor)
+        return self._floors[index] if index < len(self._floors) else None
+
+    def _below(self, current_floor: float) -> Optional[int]:
+        index = bisect_left(self._floors, current_floor)
+        return self._floors[index - 1] if index > 0 else None
+
+    def _nearest(self, current_floor: float) -> int:
+        index = bisect_left(self._floors, current_floor)
+        candidates = self._floors[max(0, index - 1) : index + 1]
+        return min(candidates, key=lambda f: (abs(f - current_floor), f))
+
+
+_SWEEP_CODES = (Direction.IDLE, Direction.UP, Direction.DOWN)
+
+
+class LookScheduler(ScanScheduler):
+    """SCAN that remembers its sweep direction across stops.
+
+    The controller reports an idle direction after every arrival, which makes
+    plain SCAN fall back to the nearest request; LOOK keeps sweeping the same
+    way until nothing is left ahead and only then reverses.
+    """
+
+    name = "LOOK"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sweep = Direction.IDLE
+
+    def clear(self) -> None:
+        super().clear()
+        self._sweep = Direction.IDLE
+
+    def get_state(self) -> List[int]:
+        return [_SWEEP_CODES.index(self._sweep)] + self.pending_requests()
+
+    def set_state(self, values: List[int]) -> None:
+        super().set_state(values[1:])
+        self._sweep = _SWEEP_CODES[values[0]]
+
+    def clone(self) -> LookScheduler:
+        clone = super().clone()
+        clone._sweep = self._sweep
+        return clone
+
+    def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
+        if current_floor in self._requests:
+            return NextStop(int(current_floor), Direction.IDLE)
+        decision = super().next_stop(current_floor, direction if direction != Direction.IDLE else self._sweep)
+        if decision is not None and decision.direction != Direction.IDLE:
+            self._sweep = decision.direction
+        return decision
+
+
+class CScanScheduler(ScanScheduler):
+    """Circular SCAN: serve requests on the way up only, then return to the lowest."""
+
+    name = "C-SCAN"
+
+    def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
+        if not self._floors:
+            return None
+
+        lowest = self._floors[0]
+        if direction == Direction.DOWN and lowest < current_floor:
+            return NextStop(lowest, Direction.DOWN)
+
+        index = bisect_left(self._floors, current_floor)
+        if index < len(self._floors):
+            floor = self._floors[index]
+            if floor == current_floor:
+                return NextStop(floor, Direction.IDLE)
+            return NextStop(floor, Direction.UP)
+        return NextStop(lowest, Direction.DOWN)
+
+
+class _FloorSums:
+    """Fenwick tree over floor numbers: sum of the pending floors up to a floor in O(log n)."""
+
+    def __init__(self, size: int) -> None:
+        self._tree = [0] * (size + 1)
+
+    @property
+    def size(self) -> int:
+        return len(self._tree) - 1
+
+    def copy(self) -> _FloorSums:
+        clone = _FloorSums(0)
+        clone._tree = list(self._tree)
+        return clone
+
+    def add(self, floor: int, delta: int) -> None:
+        tree = self._tree
+        while floor < len(tree):
+            tree[floor] += delta
+            floor += floor & -floor
+
+    def prefix(self, floor: int) -> int:
+        tree = self._tree
+        floor = min(floor, len(tree) - 1)
+        total = 0
+        while floor > 0:
+            total += tree[floor]
+            floor -= floor & -floor
+        return total
+
+
+class CostScheduler(LookScheduler):
+    """Serves the pending floors in whichever sweep order finishes them soonest on average.
+
+    The two candidate orders are up first then down, and down first then up.
+    Each pending floor costs its travel time at the car's speed plus one door
+    cycle (open, dwell, close) per stop served before it. The sum over all
+    floors is the total wait, and the cheaper order wins. Travel time is
+    linear in distance, so an order's cost only needs the count and sum of
+    the floors above and below the car. Those come from the sorted index
+    and a Fenwick tree updated with each request, so a decision stays
+    O(log n). A sweep in progress is only reversed when the other order is
+    cheaper by REVERSAL_MARGIN, so a stream of new calls cannot make the
+    car flip-flop.
+    """
+
+    name = "Cost"
+    cacheable = False  # tour costs use the exact position
+    REVERSAL_MARGIN = 0.2
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._sums = _FloorSums(8)
+        self._total = 0
+        # Controller defaults until configure() is called.
+        self._seconds_per_floor = 1.0
+        self._stop_time = 0.6 + 1.5 + 0.6
+
+    def configure(
+        self,
+        floor_count: int,
+        speed_fps: float,
+        door_open_time: float,
+        dwell_time: float,
+        door_close_time: float,
+    ) -> None:
+        self._seconds_per_floor = 1.0 / speed_fps if speed_fps > 0.0 else 0.0
+        self._stop_time = door_open_time + dwell_time + door_close_time
+        if floor_count > self._sums.size:
+            self._rebuild(floor_count)
+
+    def add_request(self, floor: int) -> None:
+        if floor < 1:
+            raise ValueError(f"Invalid floor: {floor}")
+        if floor in self._requests:
+            return
+        super().add_request(floor)
+        if floor > self._sums.size:
+            self._rebuild(max(floor, 2 * self._sums.size))
+        else:
+            self._sums.add(floor, floor)
+        self._total += floor
+
+    def remove_request(self, floor: int) -> None:
+        if floor in self._requests:
+            super().remove_request(floor)
+            self._sums.add(floor, -floor)
+            self._total -= floor
+
+    def clear(self) -> None:
+        super().clear()
+        self._sums = _FloorSums(self._sums.size)
+        self._total = 0
+
+    def clone(self) -> CostScheduler:
+        clone = super().clone()
+        clone._sums = self._sums.copy()
+        clone._total = self._total
+        clone._seconds_per_floor = self._seconds_per_floor
+        clone._stop_time = self._stop_time
+        return clone
+
+    def next_stop(self, current_floor: float, direction: Direction) -> Optional[NextStop]:
+        floors = self._floors
+        if not floors:
+            return None
+        if current_floor in self._requests:
+            return NextStop(int(current_floor), Direction.IDLE)
+
+        below = bisect_left(floors, current_floor)
+        above = len(floors) - bisect_right(floors, current_floor)
+        if not below:
+            sweep = Direction.UP
+        elif not above:
+            sweep = Direction.DOWN
+        else:
+            up_first, down_first = self.tour_costs(current_floor)
+            keep = direction if direction != Direction.IDLE else self._sweep
+            if keep == Direction.UP:
+                sweep = Direction.DOWN if down_first < up_first * (1.0 - self.REVERSAL_MARGIN) else Direction.UP
+            elif keep == Direction.DOWN:
+                sweep = Direction.UP if up_first < down_first * (1.0 - self.REVERSAL_MARGIN) else Direction.DOWN
+            else:
+                sweep = Direction.UP if up_first <= down_first else Direction.DOWN
+
+        self._sweep = sweep
+        if sweep == Direction.UP:
+            return NextStop(floors[bisect_right(floors, current_floor)], Direction.UP)
+        return NextStop(floors[below - 1], Direction.DOWN)
+
+    def tour_costs(self, current_floor: float) -> Tuple[float, float]:
+        """Total seconds until every pending floor is reached, going up first and going down first."""
+        floors = self._floors
+        per_floor = self._seconds_per_floor
+        stop = self._stop_time
+        m = bisect_left(floors, current_floor)
+        k = len(floors) - bisect_right(floors, current_floor)
+        sum_below = self._sums.prefix(math.ceil(current_floor) - 1)
+        sum_above = self._total - self._sums.prefix(math.floor(current_floor))
+        highest = floors[-1] if k else current_floor
+        lowest = floors[0] if m else current_floor
+
+        # The i-th stop of a leg waits for the travel to it and i - 1 door cycles.
+        up_leg = (sum_above - k * current_floor) * per_floor + stop * k * (k - 1) / 2
+        down_leg = (m * current_floor - sum_below) * per_floor + stop * m * (m - 1) / 2
+
+        turn_at_top = (highest - current_floor) * per_floor + k * stop
+        up_first = up_leg + m * turn_at_top + (m * highest - sum_below) * per_floor + stop * m * (m - 1) / 2
+
+        turn_at_bottom = (current_floor - lowest) * per_floor + m * stop
+        down_first = down_leg + k * turn_at_bottom + (sum_above - k * lowest) * per_floor + stop * k * (k - 1) / 2
+        return up_first, down_first
+
+    def _rebuild(self, size: int) -> None:
+        self._sums = _FloorSums(size)
+        for floor in self._floors:
+            self._sums.add(floor, floor)
+
+
+class DecisionCache:
+    """Memoizes next_stop until the requests, the direction or the floor band change.
+
+    Within a band between two floors a cacheable scheduler only compares the
+    position against whole floor numbers, so the answer can only change when a
+    request is added or removed, the direction changes or the car crosses a
+    floor. The owner calls invalidate() for the first two; the band is part of
+    the key. Schedulers that set `cacheable = False` are asked on every call.
+    With a `profiler`, each scheduler call on a miss is timed as "scheduler.next_stop".
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.profiler: Optional[Profiler] = None
+        self._key: Optional[Tuple[int, bool, Direction]] = None
+        self._decision: Optional[NextStop] = None
+
+    def invalidate(self) -> None:
+        self._key = None
+
+    def copy(self) -> DecisionCache:
+        """A cache for a clone of the scheduler; keeps the decision, counters and profiler."""
+        return copy.copy(self)
+
+    def next_stop(self, scheduler: BaseScheduler, current_floor: float, direction: Direction) -> Optional[NextStop]:
+        band = math.floor(current_floor)
+        key = (band, current_floor == band, direction) if scheduler.cacheable else None
+        if key is not None and key == self._key:
+            self.hits += 1
+            return self._decision
+        self.misses += 1
+        if self.profiler is None:
+            self._decision = scheduler.next_stop(current_floor, direction)
+        else:
+            started = self.profiler.start()
+            self._decision = scheduler.next_stop(current_floor, direction)
+            self.profiler.lap("scheduler.next_stop", started)
+        self._key = key
+        return self._decision
+
+
+SCHEDULERS: Dict[str, Type[BaseScheduler]] = {
+    cls.name: cls
+    for cls in (SimpleScheduler, FifoScheduler, ScanScheduler, LookScheduler, CScanScheduler, CostScheduler)
+}
+
+
+def create_scheduler(name: str) -> BaseScheduler:
+    try:
+        return SCHEDULERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown scheduler: {name}") from None
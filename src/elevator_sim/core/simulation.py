@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .controller import ElevatorController
+from .events import ArrivedAtFloor, DoorOpened, Event
+from .model import DoorState
+
+EventListener = Callable[[float, Event], None]
+
+
+@dataclass(frozen=True)
+class TimedRequest:
+    time: float
+    floor: int
+    destination: Optional[int] = None
+
+
+TripListener = Callable[["TimedRequest", float, float, int], None]
+
+
+@dataclass
+class _Rider:
+    request: TimedRequest
+    boarded_at: float
+    arrivals_at_boarding: int
+
+
+@dataclass
+class SimulationStats:
+    steps: int = 0
+    requests: int = 0
+    rejected: int = 0
+    arrivals: int = 0
+    door_cycles: int = 0
+    floors_travelled: float = 0.0
+    boarded: int = 0
+    delivered: int = 0
+
+
+class Simulation:
+    """Drives an ElevatorController on a simulated clock, without Qt or pygame.
+
+    Requests must be ordered by time; they are pulled lazily, so the source can
+    be a generator. A request with a destination is a passenger: it waits at
+    its floor, boards when the car arrives there and then calls the car to its
+    destination. Emitted events are stamped with the simulated time and handed
+    to every subscribed listener.
+    """
+
+    def __init__(
+        self,
+        controller: ElevatorController,
+        requests: Iterable[TimedRequest] = (),
+        dt: float = 1.0 / 30.0,
+    ) -> None:
+        if dt <= 0.0:
+            raise ValueError("dt must be positive")
+        self.controller = controller
+        self.dt = dt
+        self.time = 0.0
+        self.stats = SimulationStats()
+        self._requests: Iterator[TimedRequest] = iter(requests)
+        self._next_request: Optional[TimedRequest] = next(self._requests, None)
+        self._listeners: List[EventListener] = []
+        self._trip_listeners: List[TripListener] = []
+        self._waiting: Dict[int, List[TimedRequest]] = {}
+        self._riding: Dict[int, List[_Rider]] = {}
+
+    def subscribe(self, listener: EventListener) -> None:
+        self._listeners.append(listener)
+
+    def subscribe_trips(self, listener: TripListener) -> None:
+        """Call listener(request, boarded_at, delivered_at, stops) for each delivered passenger."""
+        self._trip_listeners.append(listener)
+
+    def run(self, until: Optional[float] = None) -> SimulationStats:
+        """Run until the given simulated time, or until all requests are served."""
+        while True:
+            self._release_requests()
+            if until is not None and self.time >= until:
+                break
+            if until is None and self._next_request is None and self.controller.is_idle():
+                break
+            if not self._step(until):
+                break
+        return self.stats
+
+    def _step(self, until: Optional[float]) -> bool:
+        dt = self.dt
+        if until is not None:
+            dt = min(dt, until - self.time)
+        self._advance(dt, self.controller.update)
+        return True
+
+    def _advance(self, dt: float, update: Callable[[float], None]) -> None:
+        previous_floor = self.controller.state.current_floor
+        update(dt)
+        self.time += dt
+        self.stats.steps += 1
+        self.stats.floors_travelled += abs(self.controller.state.current_floor - previous_floor)
+        self._dispatch_events()
+
+    def _release_requests(self) -> None:
+        while self._next_request is not None and self._next_request.time <= self.time:
+            request = self._next_request
+            if self.controller.add_request(request.floor):
+                self.stats.requests += 1
+                if request.destination is not None:
+                    self._waiting.setdefault(request.floor, []).append(request)
+            else:
+                self.stats.rejected += 1
+            self._next_request = next(self._requests, None)
+        self._dispatch_events()
+
+    def _dispatch_events(self) -> None:
+        batch = self.controller.drain_events()
+        while len(batch):
+            # Boarding records new requests, so it waits until the batch, which
+            # still points into the controller's journal, has been consumed.
+            arrivals: List[Tuple[int, int]] = []
+            for event in batch:
+                if isinstance(event, ArrivedAtFloor):
+                    self.stats.arrivals += 1
+                    arrivals.append((event.floor, self.stats.arrivals))
+                elif isinstance(event, DoorOpened):
+                    self.stats.door_cycles += 1
+                for listener in self._listeners:
+                    listener(self.time, event)
+            for floor, arrival_count in arrivals:
+                self._exchange_passengers(floor, arrival_count)
+            batch = self.controller.drain_events()
+
+    def _exchange_passengers(self, floor: int, arrival_count: int) -> None:
+        for rider in self._riding.pop(floor, ()):
+            self.stats.delivered += 1
+            stops = arrival_count - rider.arrivals_at_boarding
+            for listener in self._trip_listeners:
+                listener(rider.request, rider.boarded_at, self.time, stops)
+
+        for request in self._waiting.pop(floor, ()):
+            destination = request.destination
+            if destination is None or not self.controller.add_request(destination):
+                continue
+            self.stats.boarded += 1
+            self._riding.setdefault(destination, []).append(_Rider(request, self.time, arrival_count))
+
+
+class EventDrivenSimulation(Simulation):
+    """Advances the clock straight to the next state change instead of ticking.
+
+    Each step lands exactly on a door timer expiry, an arrival, the next timed
+    request or the end of the run, so idle periods and long travel segments
+    cost a single controller update. A door transition ends its step rather
+    than also moving the car, so the motion that follows starts on time.
+    """
+
+    _MIN_STEP = 1e-9
+
+    def _step(self, until: Optional[float]) -> bool:
+        candidates = []
+        change = self.controller.time_to_next_change()
+        if change is not None:
+            candidates.append(change)
+        if self._next_request is not None:
+            candidates.append(self._next_request.time - self.time)
+        if until is not None:
+            candidates.append(until - self.time)
+        if not candidates:
+            return False
+
+        dt = max(min(candidates), self._MIN_STEP)
+        if self.controller.state.door_state != DoorState.CLOSED:
+            self._advance(dt, self.controller.update_doors)
+        else:
+            self._advance(dt, self.controller.update)
+        return True
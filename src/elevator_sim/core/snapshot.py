@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import struct
+from array import array
+
+from .controller import ElevatorController
+from .journal import DEFAULT_CAPACITY, DIRECTION_INDEX, DIRECTION_VALUES
+from .model import DoorState, ElevatorState
+from .scheduler import create_scheduler
+
+MAGIC = b"ELEVSNP1"
+
+# magic, floor_count, speed, door open/close, dwell, clock, current floor,
+# direction, door state, target (-1 for none), door timer, emergency flag,
+# scheduler name length, scheduler state length, pending event count
+_HEADER = struct.Struct("<8sidddddd bbid B B I I")
+
+_DOORS = tuple(DoorState)
+_DOOR_INDEX = {door: index for index, door in enumerate(_DOORS)}
+
+
+def snapshot(controller: ElevatorController) -> bytes:
+    """Serialize the full controller state, scheduler internals and undrained events."""
+    state = controller.state
+    name = controller.scheduler.name.encode("utf-8")
+    scheduler_state = array("i", controller.scheduler.get_state())
+    codes, times, values = controller.journal.pending()
+    header = _HEADER.pack(
+        MAGIC,
+        controller.floor_count,
+        state.speed_fps,
+        controller.door_open_time,
+        controller.door_close_time,
+        controller.dwell_time,
+        controller.time,
+        state.current_floor,
+        DIRECTION_INDEX[state.direction],
+        _DOOR_INDEX[state.door_state],
+        -1 if state.target_floor is None else state.target_floor,
+        controller.door_timer,
+        int(controller.emergency_stop),
+        len(name),
+        len(scheduler_state),
+        len(codes),
+    )
+    return b"".join(
+        (header, name, scheduler_state.tobytes(), codes.tobytes(), times.tobytes(), values.tobytes())
+    )
+
+
+def restore(data: bytes) -> ElevatorController:
+    """Build a new controller from a snapshot() payload."""
+    (
+        magic,
+        floor_count,
+        speed,
+        door_open,
+        door_close,
+        dwell,
+        clock,
+        current_floor,
+        direction,
+        door_state,
+        target,
+        door_timer,
+        emergency,
+        name_len,
+        state_len,
+        event_count,
+    ) = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not an elevator controller snapshot")
+
+    offset = _HEADER.size
+    name = data[offset : offset + name_len].decode("utf-8")
+    offset += name_len
+    scheduler_state = array("i")
+    scheduler_state.frombytes(data[offset : offset + 4 * state_len])
+    offset += 4 * state_len
+
+    scheduler = create_scheduler(name)
+    scheduler.set_state(scheduler_state.tolist())
+    controller = ElevatorController(
+        floor_count=floor_count,
+        scheduler=scheduler,
+        speed_fps=speed,
+        door_open_time=door_open,
+        door_close_time=door_close,
+        dwell_time=dwell,
+        journal_capacity=max(DEFAULT_CAPACITY, event_count),
+    )
+    controller.state = ElevatorState(
+        current_floor=current_floor,
+        direction=DIRECTION_VALUES[direction],
+        door_state=_DOORS[door_state],
+        speed_fps=speed,
+        target_floor=None if target < 0 else target,
+    )
+    controller.door_timer = door_timer
+    controller.emergency_stop = bool(emergency)
+    controller.time = clock
+
+    codes, times, values = array("b"), array("d"), array("i")
+    codes.frombytes(data[offset : offset + event_count])
+    offset += event_count
+    times.frombytes(data[offset : offset + 8 * event_count])
+    offset += 8 * event_count
+    values.frombytes(data[offset : offset + 4 * event_count])
+    for code, time, value in zip(codes, times, values):
+        controller.journal.record(code, time, value)
+    return controller
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+from enum import Enum
+from typing import Dict, Iterator, Optional, Tuple
+
+from .simulation import TimedRequest
+
+
+class TrafficProfile(Enum):
+    UP_PEAK = "up-peak"
+    DOWN_PEAK = "down-peak"
+    LUNCH = "lunch"
+    INTER_FLOOR = "inter-floor"
+
+
+# Share of passengers leaving the lobby and heading to the lobby; the rest
+# travel between two random floors.
+_PROFILE_MIX: Dict[TrafficProfile, Tuple[float, float]] = {
+    TrafficProfile.UP_PEAK: (0.85, 0.05),
+    TrafficProfile.DOWN_PEAK: (0.05, 0.85),
+    TrafficProfile.LUNCH: (0.4, 0.4),
+    TrafficProfile.INTER_FLOOR: (0.0, 0.0),
+}
+
+
+def generate_traffic(
+    floor_count: int,
+    rate_per_minute: float,
+    profile: TrafficProfile = TrafficProfile.INTER_FLOOR,
+    seed: Optional[int] = None,
+    duration: Optional[float] = None,
+    lobby: int = 1,
+) -> Iterator[TimedRequest]:
+    """Yield passengers as Poisson arrivals, lazily and in time order.
+
+    Each passenger is a TimedRequest whose floor is the origin and whose
+    destination is set. Without a duration the stream is endless, so bound
+    the simulation run instead.
+    """
+    if floor_count < 2:
+        raise ValueError("floor_count must be at least 2")
+    if rate_per_minute <= 0.0:
+        raise ValueError("rate_per_minute must be positive")
+
+    rng = random.Random(seed)
+    rate_per_second = rate_per_minute / 60.0
+    from_lobby, to_lobby = _PROFILE_MIX[profile]
+    time = 0.0
+    while True:
+        time += rng.expovariate(rate_per_second)
+        if duration is not None and time > duration:
+            return
+        draw = rng.random()
+        if draw < from_lobby:
+            origin = lobby
+            destination = _other_floor(rng, floor_count, lobby)
+        elif draw < from_lobby + to_lobby:
+            origin = _other_floor(rng, floor_count, lobby)
+            destination = lobby
+        else:
+            origin = rng.randint(1, floor_count)
+            destination = _other_floor(rng, floor_count, origin)
+        yield TimedRequest(time, origin, destination)
+
+
+def _other_floor(rng: random.Random, floor_count: int, exclude: int) -> int:
+    floor = rng.randint(1, floor_count - 1)
+    return floor + 1 if floor >= exclude else floor
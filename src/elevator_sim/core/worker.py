@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import dataclasses
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Deque, Hashable, Iterator, Optional, Tuple, Union
+
+from .controller import ElevatorController
+from .events import Event
+from .model import ElevatorState
+from .profiling import Profiler
+from .replay import SessionRecorder
+
+SIM_STEP = 1.0 / 60.0
+MAX_CATCH_UP = 1.0
+IDLE_WAIT = 0.25
+
+Inputs = Union[ElevatorController, SessionRecorder]
+Command = Callable[["SimulationWorker"], Any]
+
+
+@dataclass(frozen=True)
+class ControllerSnapshot:
+    """What the UI needs from the controller, copied at one instant.
+
+    `state` is a private copy that is never mutated after publishing.
+    """
+
+    time: float
+    state: ElevatorState
+    floor_count: int
+    scheduler_name: str
+    pending_requests: Tuple[int, ...]
+    emergency_stop: bool
+    idle: bool
+    running: bool
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    tag: Hashable
+    value: Any = None
+    error: Optional[Exception] = None
+
+
+class SimulationWorker:
+    """Runs a controller on its own thread, in real time and in fixed steps.
+
+    Only the worker thread touches the controller once started. Other threads
+    submit commands, read the latest snapshot (a single reference swap, so
+    no lock) and drain timed events and command results in order. Steps and
+    scheduler calls are timed into `profiler` while it is enabled.
+    """
+
+    def __init__(
+        self,
+        controller: ElevatorController,
+        step: float = SIM_STEP,
+        clock: Callable[[], float] = time.monotonic,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        self.controller = controller
+        self.inputs: Inputs = controller
+        self.step = step
+        self.profiler = profiler or Profiler()
+        controller.decision_cache.profiler = self.profiler
+        self.running = False
+        self._clock = clock
+        self._commands: "queue.SimpleQueue[Optional[Tuple[Command, Optional[Hashable]]]]" = queue.SimpleQueue()
+        self._outbox: Deque[Union[Tuple[float, Event], CommandResult]] = deque()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot = self._capture()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Apply the commands already submitted, then end the thread."""
+        if self._thread is not None:
+            self._commands.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, command: Command, tag: Optional[Hashable] = None) -> None:
+        """Run `command(worker)` on the worker thread.
+
+        With a tag, its return value comes back through drain() as a
+        CommandResult. An exception always does, so the thread keeps running.
+        """
+        self._commands.put((command, tag))
+
+    def call(self, method: str, *args: Any, tag: Optional[Hashable] = None) -> None:
+        """Submit `inputs.<method>(*args)`, recorded if a session is active."""
+        self.submit(lambda worker: getattr(worker.inputs, method)(*args), tag)
+
+    def set_running(self, running: bool) -> None:
+        self.submit(lambda worker: setattr(worker, "running", running))
+
+    def start_recording(self, target: Union[str, Path, BinaryIO], tag: Hashable = "recording") -> None:
+        """Record inputs from here on; the result carries `target`, or the error."""
+        self.stop_recording()
+        self.submit(lambda worker: worker._open_session(target), tag)
+
+    def stop_recording(self) -> None:
+        self.submit(SimulationWorker._close_session)
+
+    def snapshot(self) -> ControllerSnapshot:
+        return self._snapshot
+
+    def drain(self) -> Iterator[Union[Tuple[float, Event], CommandResult]]:
+        outbox = self._outbox
+        while outbox:
+            yield outbox.popleft()
+
+    def _run(self) -> None:
+        last = self._clock()
+        accumulator = 0.0
+        while True:
+            was_running = self.running
+            busy = self.running and not self.controller.is_idle()
+            wait = self.step if busy else (IDLE_WAIT if self.running else None)
+            try:
+                item = self._commands.get(timeout=wait)
+                while True:
+                    if item is None:
+                        self._publish()
+                        return
+                    self._apply(*item)
+                    item = self._commands.get_nowait()
+            except queue.Empty:
+                pass
+
+            now = self._clock()
+            if self.running:
+                if was_running:
+                    accumulator = min(accumulator + now - last, MAX_CATCH_UP)
+                profiler = self.profiler
+                while accumulator >= self.step:
+                    started = profiler.start()
+                    self.inputs.update(self.step)
+                    profiler.lap("controller.update", started)
+                    accumulator -= self.step
+            else:
+                accumulator = 0.0
+            last = now
+            self._publish()
+
+    def _open_session(self, target: Union[str, Path, BinaryIO]) -> Union[str, Path, BinaryIO]:
+        self.inputs = SessionRecorder(self.controller, target)
+        return target
+
+    def _close_session(self) -> None:
+        if isinstance(self.inputs, SessionRecorder):
+            self.inputs.close()
+            self.inputs = self.controller
+
+    def _apply(self, command: Command, tag: Optional[Hashable]) -> None:
+        try:
+            value = command(self)
+        except Exception as exc:
+            self._outbox.append(CommandResult(tag, error=exc))
+            return
+        if tag is not None:
+            self._outbox.append(CommandResult(tag, value))
+
+    def _publish(self) -> None:
+        batch = self.controller.drain_events()
+        if len(batch):
+            self._outbox.extend(list(batch.timed()))
+        self._snapshot = self._capture()
+
+    def _capture(self) -> ControllerSnapshot:
+        controller = self.controller
+        return ControllerSnapshot(
+            time=controller.time,
+            state=dataclasses.replace(controller.state),
+            floor_count=controller.floor_count,
+            scheduler_name=controller.scheduler.name,
+            pending_requests=tuple(controller.pending_requests()),
+            emergency_stop=controller.emergency_stop,
+            idle=controller.is_idle(),
+            running=self.running,
+        )
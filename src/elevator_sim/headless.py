@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, TextIO
+
+from .core.controller import ElevatorController
+from .core.events import Event, format_event
+from .core.journal import DEFAULT_CAPACITY
+from .core.metrics import KpiCollector, format_kpis
+from .core.replay import replay
+from .core.scheduler import SCHEDULERS, create_scheduler
+from .core.simulation import EventDrivenSimulation, Simulation, SimulationStats, TimedRequest
+from .core.traffic import TrafficProfile, generate_traffic
+
+
+def load_scenario(path: Path) -> List[TimedRequest]:
+    """Read `<time> <floor>` lines; blank lines and `#` comments are ignored."""
+    requests: List[TimedRequest] = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            text = line.split("#", 1)[0].strip()
+            if not text:
+                continue
+            parts = text.split()
+            if len(parts) != 2:
+                raise ValueError(f"{path}:{line_no}: expected '<time> <floor>'")
+            requests.append(TimedRequest(float(parts[0]), int(parts[1])))
+    requests.sort(key=lambda request: request.time)
+    return requests
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m elevator_sim.headless",
+        description="Run the elevator controller headless, faster than real time.",
+    )
+    parser.add_argument("scenario", type=Path, nargs="?", help="file of '<time> <floor>' request lines")
+    parser.add_argument(
+        "--traffic",
+        choices=[profile.value for profile in TrafficProfile],
+        default=None,
+        help="generate passengers with this profile instead of reading a scenario",
+    )
+    parser.add_argument("--rate", type=float, default=4.0, help="passengers per minute for --traffic")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for --traffic")
+    parser.add_argument("--duration", type=float, default=3600.0, help="seconds of generated traffic")
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        help="re-run a recorded GUI session and verify its state checkpoints",
+    )
+    parser.add_argument("--floors", type=int, default=6)
+    parser.add_argument("--scheduler", choices=sorted(SCHEDULERS), default="FIFO")
+    parser.add_argument(
+        "--engine",
+        choices=("tick", "event"),
+        default="tick",
+        help="fixed-step ticking, or jump straight to the next state change",
+    )
+    parser.add_argument("--dt", type=float, default=1.0 / 30.0, help="fixed step in simulated seconds")
+    parser.add_argument("--until", type=float, default=None, help="stop at this simulated time")
+    parser.add_argument("--speed", type=float, default=1.0, help="floors per second")
+    parser.add_argument("--door-open", type=float, default=0.6)
+    parser.add_argument("--door-close", type=float, default=0.6)
+    parser.add_argument("--dwell", type=float, default=1.5)
+    parser.add_argument("--events", default=None, help="write the event stream here ('-' for stdout)")
+    parser.add_argument(
+        "--journal-capacity",
+        type=int,
+        default=DEFAULT_CAPACITY,
+        help="events the controller buffers between drains before dropping the oldest",
+    )
+    return parser
+
+
+def format_summary(stats: SimulationStats, sim_time: float, wall_time: float) -> str:
+    speedup = sim_time / wall_time if wall_time > 0.0 else float("inf")
+    lines = [
+        f"Simulated {sim_time:.1f} s in {wall_time:.3f} s wall clock ({speedup:.0f}x real time)",
+        f"Steps: {stats.steps}",
+        f"Requests: {stats.requests} ({stats.rejected} rejected)",
+        f"Arrivals: {stats.arrivals}",
+        f"Door cycles: {stats.door_cycles}",
+        f"Floors travelled: {stats.floors_travelled:.1f}",
+    ]
+    if stats.boarded:
+        lines.append(f"Passengers: {stats.boarded} boarded, {stats.delivered} delivered")
+    return "\n".join(lines)
+
+
+def run_replay(path: Path) -> None:
+    started = time.perf_counter()
+    result = replay(path)
+    wall_time = time.perf_counter() - started
+    controller = result.controller
+    print(
+        f"Replayed {result.updates} updates and {result.inputs} inputs "
+        f"({controller.time:.1f} s simulated) in {wall_time:.3f} s"
+    )
+    if result.ok:
+        print(f"All {result.checkpoints} state checkpoints match")
+    else:
+        print(
+            f"{len(result.mismatches)} of {result.checkpoints} checkpoints diverged, "
+            f"first after update {result.mismatches[0]}"
+        )
+        sys.exit(1)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    sources = [args.scenario, args.traffic, args.replay]
+    if sum(source is not None for source in sources) != 1:
+        parser.error("give exactly one of a scenario file, --traffic or --replay")
+    if args.replay is not None:
+        run_replay(args.replay)
+        return
+
+    controller = ElevatorController(
+        floor_count=args.floors,
+        scheduler=create_scheduler(args.scheduler),
+        speed_fps=args.speed,
+        door_open_time=args.door_open,
+        door_close_time=args.door_close,
+        dwell_time=args.dwell,
+        journal_capacity=args.journal_capacity,
+    )
+    engine = EventDrivenSimulation if args.engine == "event" else Simulation
+    requests: Iterable[TimedRequest]
+    if args.traffic is not None:
+        requests = generate_traffic(
+            controller.floor_count,
+            args.rate,
+            TrafficProfile(args.traffic),
+            seed=args.seed,
+            duration=args.duration,
+        )
+    else:
+        requests = load_scenario(args.scenario)
+    simulation = engine(controller, requests, dt=args.dt)
+    kpis = KpiCollector()
+    kpis.attach(simulation)
+
+    stream: Optional[TextIO] = None
+    if args.events == "-":
+        stream = sys.stdout
+    elif args.events:
+        stream = open(args.events, "w", encoding="utf-8")
+
+    if stream is not None:
+        out = stream
+
+        def write_event(sim_time: float, event: Event) -> None:
+            out.write(f"{sim_time:10.3f}  {format_event(event)}\n")
+
+        simulation.subscribe(write_event)
+
+    started = time.perf_counter()
+    try:
+        stats = simulation.run(until=args.until)
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+    wall_time = time.perf_counter() - started
+
+    print(format_summary(stats, simulation.time, wall_time))
+    cache = controller.decision_cache
+    print(f"Decision cache: {cache.hits} hits, {cache.misses} misses")
+    journal = controller.journal
+    print(f"Event journal: {journal.dropped} dropped (capacity {journal.capacity})")
+    for line in format_kpis(kpis.summary(until=simulation.time)):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional
+import sys
+from typing import Optional, Tuple
 
 import pygame
 from PySide6.QtGui import QImage
 
 from ..core.model import DoorState, ElevatorState
+from .viewport import FloorViewport
+
+_PIXEL_LAYOUT = "BGRA" if sys.byteorder == "little" else "ARGB"
 
 
 class PygameCanvas:
@@ -13,16 +17,21 @@ class PygameCanvas:
 
     def __init__(self, width: int, height: int, floor_count: int = 6) -> None:
         if not PygameCanvas._pygame_ready:
-            pygame.init()
+            # Only fonts need initializing: drawing on an offscreen surface
+            # needs no display, and pygame.init() would also start audio.
             pygame.font.init()
             PygameCanvas._pygame_ready = True
 
         self.width = width
         self.height = height
         self.floor_count = max(2, floor_count)
-        self.surface = pygame.Surface((self.width, self.height))
         self.font = pygame.font.Font(None, 20)
-        self._buffer: Optional[bytes] = None
+        self._allocate()
+        # Sky, building, floor lines and labels only change with the floor
+        # count, size or visible floors, so they are rendered once and the car
+        # is drawn over a copy, restoring just the rectangle it covered last frame.
+        self._background: Optional[pygame.Surface] = None
+        self._car_rect: Optional[pygame.Rect] = None
 
         self._colors = {
             "sky": (16, 196, 222),
@@ -35,26 +44,31 @@ class PygameCanvas:
         }
 
     def set_floor_count(self, floor_count: int) -> None:
-        self.floor_count = max(2, floor_count)
-
-    def draw(self, state: ElevatorState) -> QImage:
-        self.surface.fill(self._colors["sky"])
+        floor_count = max(2, floor_count)
+        if floor_count != self.floor_count:
+            self.floor_count = floor_count
+            self.viewport = FloorViewport(floor_count, self.height)
+            self._background = None
 
-        building_x = int(self.width * 0.15)
-        building_w = int(self.width * 0.7)
-        pygame.draw.rect(self.surface, self._colors["building"], (building_x, 0, building_w, self.height))
+    def resize(self, width: int, height: int) -> None:
+        if (width, height) == (self.width, self.height):
+            return
+        self.width = width
+        self.height = height
+        self._allocate()
 
-        floor_h = self.height / self.floor_count
-        for i in range(self.floor_count):
-            y = int(self.height - (i + 1) * floor_h)
-            pygame.draw.line(self.surface, self._colors["line"], (building_x, y), (building_x + building_w, y), 2)
-            label = self.font.render(str(i + 1), True, self._colors["line"])
-            self.surface.blit(label, (building_x + building_w + 6, y + int(floor_h * 0.35)))
+    def draw(self, state: ElevatorState) -> QImage:
+        if self.viewport.follow(state.current_floor) or self._background is None:
+            self._build_background()
+        elif self._car_rect is not None:
+            self.surface.blit(self._background, self._car_rect, self._car_rect)
 
+        building_x, building_w = self._building_span()
+        floor_h = self.viewport.floor_h
         car_w = int(building_w * 0.35)
         car_h = int(floor_h * 0.75)
         car_x = building_x + int(building_w * 0.5 - car_w * 0.5)
-        car_y = int(self.height - state.current_floor * floor_h + (floor_h - car_h) * 0.5)
+        car_y = int(self.viewport.top(state.current_floor) + (floor_h - car_h) * 0.5)
         pygame.draw.rect(self.surface, self._colors["car"], (car_x, car_y, car_w, car_h))
         pygame.draw.rect(self.surface, self._colors["car_border"], (car_x, car_y, car_w, car_h), 2)
 
@@ -67,6 +81,38 @@ class PygameCanvas:
             door_color,
             (car_x + door_w + door_gap + 2, car_y + 4, door_w - 4, car_h - 8),
         )
+        self._car_rect = pygame.Rect(car_x, car_y, car_w, car_h)
+
+        return self._image
+
+    def _allocate(self) -> None:
+        # The surface draws straight into this buffer and the QImage reads the
+        # same memory, so a frame reaches Qt without tostring() or a format
+        # conversion. Format_RGB32 is one native-endian 0xffRRGGBB word per pixel.
+        self._pixels = bytearray(self.width * self.height * 4)
+        self.surface = pygame.image.frombuffer(self._pixels, (self.width, self.height), _PIXEL_LAYOUT)
+        self._image = QImage(self._pixels, self.width, self.height, self.width * 4, QImage.Format_RGB32)
+        self.viewport = FloorViewport(self.floor_count, self.height)
+        self._background = None
+        self._car_rect = None
+
+    def _building_span(self) -> Tuple[int, int]:
+        return int(self.width * 0.15), int(self.width * 0.7)
+
+    def _build_background(self) -> None:
+        background = pygame.Surface((self.width, self.height))
+        background.fill(self._colors["sky"])
+
+        building_x, building_w = self._building_span()
+        pygame.draw.rect(background, self._colors["building"], (building_x, 0, building_w, self.height))
+
+        floor_h = self.viewport.floor_h
+        for floor in self.viewport.floors():
+            y = int(self.viewport.top(floor))
+            pygame.draw.line(background, self._colors["line"], (building_x, y), (building_x + building_w, y), 2)
+            label = self.font.render(str(floor), True, self._colors["line"])
+            background.blit(label, (building_x + building_w + 6, y + int(floor_h * 0.35)))
 
-        self._buffer = pygame.image.tostring(self.surface, "RGB")
-        return QImage(self._buffer, self.width, self.height, QImage.Format_RGB888)
+        self._background = background
+        self.surface.blit(background, (0, 0))
+        self._car_rect = None
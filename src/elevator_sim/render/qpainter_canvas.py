@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPaintEvent, QPen, QPixmap, QResizeEvent
+from PySide6.QtWidgets import QWidget
+
+from ..core.model import DoorState, ElevatorState
+from ..core.profiling import Profiler
+from .viewport import FloorViewport
+
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL support
+    QOpenGLWidget = None
+
+
+class _CanvasMixin:
+    """Drawing shared by the QWidget and QOpenGLWidget canvases.
+
+    Same picture and interface as PygameCanvas, except that draw() only
+    records the state and schedules a repaint of the area the car left and
+    entered; nothing is painted when the car looks the same as last frame.
+    The whole canvas is repainted when the viewport moves to follow the car.
+    """
+
+    def _init_canvas(self, floor_count: int) -> None:
+        self.floor_count = max(2, floor_count)
+        self._car: Optional[Tuple[float, bool]] = None
+        self._car_rect = QRect()
+        self._background: Optional[QPixmap] = None
+        self.viewport = FloorViewport(self.floor_count, self.height())
+        self.profiler = Profiler()  # paints are timed as "render.paint" when enabled
+        self._font = QFont()
+        self._font.setPixelSize(14)
+        self._colors = {
+            "sky": QColor(16, 196, 222),
+            "building": QColor(32, 42, 54),
+            "line": QColor(220, 220, 220),
+            "car": QColor(245, 182, 89),
+            "car_border": QColor(30, 30, 30),
+            "door_open": QColor(98, 187, 108),
+            "door_closed": QColor(200, 86, 86),
+        }
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def set_floor_count(self, floor_count: int) -> None:
+        floor_count = max(2, floor_count)
+        if floor_count != self.floor_count:
+            self.floor_count = floor_count
+            self.viewport = FloorViewport(floor_count, self.height())
+            self._background = None
+            self._car_rect = self._car_geometry()
+            self.update()
+
+    def draw(self, state: ElevatorState) -> None:
+        car = (state.current_floor, state.door_state == DoorState.OPEN)
+        if car == self._car:
+            return
+        self._car = car
+        previous = self._car_rect
+        scrolled = self.viewport.follow(car[0])
+        self._car_rect = self._car_geometry()
+        if scrolled:
+            self._background = None
+            self.update()
+        else:
+            self.update(previous.united(self._car_rect))
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self.viewport = FloorViewport(self.floor_count, self.height())
+        if self._car is not None:
+            self.viewport.follow(self._car[0])
+        self._background = None
+        self._car_rect = self._car_geometry()
+        super().resizeEvent(event)
+
+    def _paint(self, painter: QPainter, area: QRect) -> None:
+        if self._background is None:
+            self._background = self._build_background()
+        ratio = self._background.devicePixelRatio()
+        source = QRectF(area.x() * ratio, area.y() * ratio, area.width() * ratio, area.height() * ratio)
+        painter.drawPixmap(QRectF(area), self._background, source)
+        if self._car is None or not self._car_rect.intersects(area):
+            return
+
+        rect = self._car_rect
+        painter.fillRect(rect, self._colors["car"])
+        painter.setPen(QPen(self._colors["car_border"], 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(rect.adjusted(1, 1, -1, -1))
+
+        doors_open = self._car[1]
+        door_color = self._colors["door_open"] if doors_open else self._colors["door_closed"]
+        door_gap = int(rect.width() * 0.08) if doors_open else 0
+        door_w = int((rect.width() - door_gap) / 2)
+        painter.fillRect(rect.x() + 4, rect.y() + 4, door_w - 4, rect.height() - 8, door_color)
+        painter.fillRect(rect.x() + door_w + door_gap + 2, rect.y() + 4, door_w - 4, rect.height() - 8, door_color)
+
+    def _car_geometry(self) -> QRect:
+        if self._car is None:
+            return QRect()
+        width = self.width()
+        building_x, building_w = int(width * 0.15), int(width * 0.7)
+        floor_h = self.viewport.floor_h
+        car_w = int(building_w * 0.35)
+        car_h = int(floor_h * 0.75)
+        car_x = building_x + int(building_w * 0.5 - car_w * 0.5)
+        car_y = int(self.viewport.top(self._car[0]) + (floor_h - car_h) * 0.5)
+        return QRect(car_x, car_y, car_w, car_h)
+
+    def _build_background(self) -> QPixmap:
+        width, height = self.width(), self.height()
+        ratio = self.devicePixelRatioF()
+        background = QPixmap(round(width * ratio), round(height * ratio))
+        background.setDevicePixelRatio(ratio)
+        background.fill(self._colors["sky"])
+
+        painter = QPainter(background)
+        building_x, building_w = int(width * 0.15), int(width * 0.7)
+        painter.fillRect(building_x, 0, building_w, height, self._colors["building"])
+
+        painter.setPen(QPen(self._colors["line"], 2))
+        painter.setFont(self._font)
+        floor_h = self.viewport.floor_h
+        for floor in self.viewport.floors():
+            y = int(self.viewport.top(floor))
+            painter.drawLine(building_x, y, building_x + building_w, y)
+            painter.drawText(building_x + building_w + 6, y + int(floor_h * 0.35) + 12, str(floor))
+        painter.end()
+        return background
+
+
+class QPainterCanvas(_CanvasMixin, QWidget):
+    def __init__(self, floor_count: int = 6, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._init_canvas(floor_count)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        started = self.profiler.start()
+        painter = QPainter(self)
+        self._paint(painter, event.rect())
+        painter.end()
+        self.profiler.lap("render.paint", started)
+
+
+if QOpenGLWidget is not None:
+
+    class OpenGLCanvas(_CanvasMixin, QOpenGLWidget):
+        """QPainterCanvas drawn through OpenGL; the whole frame is repainted on update."""
+
+        def __init__(self, floor_count: int = 6, parent: Optional[QWidget] = None) -> None:
+            super().__init__(parent)
+            self._init_canvas(floor_count)
+
+        def paintGL(self) -> None:
+            started = self.profiler.start()
+            painter = QPainter(self)
+            self._paint(painter, self.rect())
+            painter.end()
+            self.profiler.lap("render.paint", started)
+
+else:
+    OpenGLCanvas = None
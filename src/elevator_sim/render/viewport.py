@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+MIN_FLOOR_HEIGHT = 36
+
+
+class FloorViewport:
+    """The floors a canvas of `height` pixels shows, and where they go.
+
+    A building that fits at MIN_FLOOR_HEIGHT or more per floor is shown
+    whole, as before. A taller one keeps that floor height and shows a
+    window of `visible` floors; follow() moves the window in whole floors
+    when the car nears its edge, so the static layer only changes then.
+    """
+
+    def __init__(self, floor_count: int, height: int, min_floor_height: int = MIN_FLOOR_HEIGHT) -> None:
+        self.floor_count = max(2, floor_count)
+        self.height = height
+        self.visible = min(self.floor_count, max(2, height // max(1, min_floor_height)))
+        self.floor_h = height / self.visible
+        self.base = 0  # floors below the window
+
+    @property
+    def scrolls(self) -> bool:
+        return self.visible < self.floor_count
+
+    def floors(self) -> range:
+        """1-based floors inside the window, bottom first."""
+        return range(self.base + 1, self.base + self.visible + 1)
+
+    def follow(self, floor: float) -> bool:
+        """Keep the car at `floor` away from the window's edges; True if it moved."""
+        if not self.scrolls:
+            return False
+        margin = self.visible // 4
+        if self.base + margin <= floor - 1 and floor <= self.base + self.visible - margin:
+            return False
+        # Center the car, which spans floor - 1 to floor.
+        base = min(max(round(floor - 0.5 - self.visible / 2), 0), self.floor_count - self.visible)
+        if base == self.base:
+            return False
+        self.base = base
+        return True
+
+    def top(self, floor: float) -> float:
+        """Y of the top edge of `floor` (1-based, fractional while moving)."""
+        return self.height - (floor - self.base) * self.floor_h
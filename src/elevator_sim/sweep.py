@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .core.controller import ElevatorController
+from .core.metrics import DistributionSummary, KpiCollector
+from .core.scheduler import SCHEDULERS, create_scheduler
+from .core.simulation import EventDrivenSimulation
+from .core.traffic import TrafficProfile, generate_traffic
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    scheduler: str
+    floors: int
+    speed: float
+    dwell: float
+    door_open: float
+    door_close: float
+    profile: str
+    rate: float
+    duration: float
+    seed: int
+
+    def key(self) -> Tuple[str, ...]:
+        return tuple(str(value) for value in asdict(self).values())
+
+
+CONFIG_COLUMNS = [field.name for field in fields(SweepConfig)]
+RESULT_COLUMNS = [
+    "passengers",
+    "delivered",
+    "request_wait_mean",
+    "request_wait_p95",
+    "passenger_wait_mean",
+    "passenger_wait_p50",
+    "passenger_wait_p95",
+    "passenger_wait_p99",
+    "journey_time_mean",
+    "journey_time_p50",
+    "journey_time_p95",
+    "journey_time_p99",
+    "stops_per_trip_mean",
+    "utilization",
+    "sim_time",
+    "wall_time",
+]
+COLUMNS = CONFIG_COLUMNS + RESULT_COLUMNS
+
+
+def build_grid(
+    schedulers: Sequence[str],
+    floors: Sequence[int],
+    speeds: Sequence[float],
+    dwells: Sequence[float],
+    door_opens: Sequence[float],
+    door_closes: Sequence[float],
+    profiles: Sequence[str],
+    rates: Sequence[float],
+    durations: Sequence[float],
+    seeds: Sequence[int],
+) -> Iterator[SweepConfig]:
+    for values in itertools.product(
+        schedulers, floors, speeds, dwells, door_opens, door_closes, profiles, rates, durations, seeds
+    ):
+        yield SweepConfig(*values)
+
+
+def run_config(config: SweepConfig) -> Dict[str, str]:
+    started = time.perf_counter()
+    controller = ElevatorController(
+        floor_count=config.floors,
+        scheduler=create_scheduler(config.scheduler),
+        speed_fps=config.speed,
+        door_open_time=config.door_open,
+        door_close_time=config.door_close,
+        dwell_time=config.dwell,
+    )
+    traffic = generate_traffic(
+        controller.floor_count,
+        config.rate,
+        TrafficProfile(config.profile),
+        seed=config.seed,
+        duration=config.duration,
+    )
+    simulation = EventDrivenSimulation(controller, traffic)
+    kpis = KpiCollector()
+    kpis.attach(simulation)
+    stats = simulation.run()
+    summary = kpis.summary(until=simulation.time)
+
+    row = dict(zip(CONFIG_COLUMNS, config.key()))
+    row.update(
+        passengers=str(stats.requests),
+        delivered=str(stats.delivered),
+        request_wait_mean=_fmt(summary.request_wait.mean),
+        request_wait_p95=_fmt(summary.request_wait.p95),
+        stops_per_trip_mean=_fmt(summary.stops_per_trip.mean),
+        utilization=_fmt(summary.utilization),
+        sim_time=_fmt(simulation.time),
+        wall_time=_fmt(time.perf_counter() - started),
+    )
+    row.update(_distribution_columns("passenger_wait", summary.passenger_wait))
+    row.update(_distribution_columns("journey_time", summary.journey_time))
+    return row
+
+
+def completed_keys(path: Path) -> Set[Tuple[str, ...]]:
+    """Keys of the configurations already recorded in a results file.
+
+    A trailing line cut short by an interruption is dropped from the file so
+    new rows append cleanly.
+    """
+    if not path.exists():
+        return set()
+    _truncate_partial_line(path)
+    done: Set[Tuple[str, ...]] = set()
+    with open(path, "r", newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            if all(row.get(column) not in (None, "") for column in CONFIG_COLUMNS + ["wall_time"]):
+                done.add(tuple(row[column] for column in CONFIG_COLUMNS))
+    return done
+
+
+def run_sweep(configs: Iterable[SweepConfig], output: Path, workers: Optional[int] = None) -> int:
+    """Run every configuration not already in `output`, appending rows as they finish."""
+    done = completed_keys(output)
+    pending = [config for config in configs if config.key() not in done]
+    if not pending:
+        return 0
+
+    write_header = not output.exists() or output.stat().st_size == 0
+    with open(output, "a", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=COLUMNS)
+        if write_header:
+            writer.writeheader()
+            handle.flush()
+        for row in _results(pending, workers):
+            writer.writerow(row)
+            handle.flush()
+    return len(pending)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m elevator_sim.sweep",
+        description="Sweep controller configurations across all cores and stream KPIs to a CSV file.",
+    )
+    parser.add_argument("output", type=Path, help="CSV results file; existing rows are skipped on resume")
+    parser.add_argument("--schedulers", nargs="+", choices=sorted(SCHEDULERS), default=sorted(SCHEDULERS))
+    parser.add_argument("--floors", nargs="+", type=int, default=[6])
+    parser.add_argument("--speeds", nargs="+", type=float, default=[1.0])
+    parser.add_argument("--dwell", nargs="+", type=float, default=[1.5])
+    parser.add_argument("--door-open", nargs="+", type=float, default=[0.6])
+    parser.add_argument("--door-close", nargs="+", type=float, default=[0.6])
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=[profile.value for profile in TrafficProfile],
+        default=[TrafficProfile.INTER_FLOOR.value],
+    )
+    parser.add_argument("--rates", nargs="+", type=float, default=[4.0], help="passengers per minute")
+    parser.add_argument("--duration", nargs="+", type=float, default=[3600.0])
+    parser.add_argument("--seeds", nargs="+", type=int, default=[1])
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    grid = list(
+        build_grid(
+            args.schedulers,
+            args.floors,
+            args.speeds,
+            args.dwell,
+            args.door_open,
+            args.door_close,
+            args.profiles,
+            args.rates,
+            args.duration,
+            args.seeds,
+        )
+    )
+    started = time.perf_counter()
+    ran = run_sweep(grid, args.output, args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"{ran} of {len(grid)} configurations run in {elapsed:.1f} s ({len(grid) - ran} already done)")
+
+
+def _results(configs: List[SweepConfig], workers: Optional[int]) -> Iterator[Dict[str, str]]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(configs) == 1:
+        for config in configs:
+            yield run_config(config)
+        return
+    # Spawn rather than fork: a forked child of a process that has already
+    # initialized SDL or Qt can deadlock on locks held by their threads.
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=min(workers, len(configs))) as pool:
+        yield from pool.imap_unordered(run_config, configs)
+
+
+def _distribution_columns(prefix: str, distribution: DistributionSummary) -> Dict[str, str]:
+    return {
+        f"{prefix}_mean": _fmt(distribution.mean),
+        f"{prefix}_p50": _fmt(distribution.p50),
+        f"{prefix}_p95": _fmt(distribution.p95),
+        f"{prefix}_p99": _fmt(distribution.p99),
+    }
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "" if value is None else f"{value:.4f}"
+
+
+def _truncate_partial_line(path: Path) -> None:
+    with open(path, "rb+") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        handle.seek(size - 1)
+        if handle.read(1) == b"\n":
+            return
+        position = size
+        while position > 0:
+            step = min(65536, position)
+            position -= step
+            handle.seek(position)
+            newline = handle.read(step).rfind(b"\n")
+            if newline != -1:
+                handle.truncate(position + newline + 1)
+                return
+        handle.truncate(0)
+
+
+if __name__ == "__main__":
+    main()
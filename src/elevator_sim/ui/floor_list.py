@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import AbstractSet, Any, FrozenSet, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSize, Qt
+
+ITEM_SIZE = QSize(48, 42)
+
+
+class FloorListModel(QAbstractListModel):
+    """One row per floor for the floor selector, floor 1 first.
+
+    Rows hold no widgets, so the view only creates and paints the ones that
+    are visible. Floors with a pending request are disabled until served.
+    """
+
+    def __init__(self, floor_count: int = 6, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self._floor_count = max(2, floor_count)
+        self._pending: FrozenSet[int] = frozenset()
+
+    @property
+    def floor_count(self) -> int:
+        return self._floor_count
+
+    def set_floor_count(self, floor_count: int) -> None:
+        floor_count = max(2, floor_count)
+        if floor_count == self._floor_count:
+            return
+        self.beginResetModel()
+        self._floor_count = floor_count
+        self._pending = frozenset()
+        self.endResetModel()
+
+    def set_pending(self, pending: AbstractSet[int]) -> None:
+        """Disable the floors in `pending`; only rows that flipped are signalled."""
+        pending = frozenset(pending)
+        flipped = pending ^ self._pending
+        self._pending = pending
+        for floor in flipped:
+            if 1 <= floor <= self._floor_count:
+                index = self.index(floor - 1)
+                self.dataChanged.emit(index, index, [])
+
+    def requestable(self, index: QModelIndex) -> bool:
+        return bool(self.flags(index) & Qt.ItemIsEnabled)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._floor_count
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(index.row() + 1)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.SizeHintRole:
+            return ITEM_SIZE
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid() or index.row() + 1 in self._pending:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled
@@ -0,0 +1,4 @@
+# Generated by pyside6-uic from ../ui_files; edit the .ui files and rerun:
+#   pyside6-uic ui_files/Elevator_Interface_updated.ui -o forms/ui_main_window.py
+#   pyside6-uic ui_files/Info_window_gui.ui -o forms/ui_info_dialog.py
+# (from src/elevator_sim/ui). tests/test_forms.py fails when they are stale.
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'Info_window_gui.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QLabel, QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_InfoDialogWindow(object):
+    def setupUi(self, InfoDialogWindow):
+        if not InfoDialogWindow.objectName():
+            InfoDialogWindow.setObjectName(u"InfoDialogWindow")
+        self.verticalLayout = QVBoxLayout(InfoDialogWindow)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.info_label = QLabel(InfoDialogWindow)
+        self.info_label.setObjectName(u"info_label")
+        self.info_label.setWordWrap(True)
+
+        self.verticalLayout.addWidget(self.info_label)
+
+        self.OkButton = QDialogButtonBox(InfoDialogWindow)
+        self.OkButton.setObjectName(u"OkButton")
+        self.OkButton.setOrientation(Qt.Horizontal)
+        self.OkButton.setStandardButtons(QDialogButtonBox.Ok)
+
+        self.verticalLayout.addWidget(self.OkButton)
+
+
+        self.retranslateUi(InfoDialogWindow)
+        self.OkButton.accepted.connect(InfoDialogWindow.accept)
+        self.OkButton.rejected.connect(InfoDialogWindow.reject)
+
+        QMetaObject.connectSlotsByName(InfoDialogWindow)
+    # setupUi
+
+    def retranslateUi(self, InfoDialogWindow):
+        InfoDialogWindow.setWindowTitle(QCoreApplication.translate("InfoDialogWindow", u"About Elevator Simulation", None))
+        self.info_label.setText(QCoreApplication.translate("InfoDialogWindow", u"This demo shows a responsive Qt UI with an embedded offscreen pygame simulation.", None))
+    # retranslateUi
+
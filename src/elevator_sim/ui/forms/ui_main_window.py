@@ -0,0 +1,542 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'Elevator_Interface_updated.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QFormLayout,
+    QFrame, QGridLayout, QHBoxLayout, QLabel,
+    QListView, QPlainTextEdit, QPushButton, QSizePolicy,
+    QSlider, QSpacerItem, QSpinBox, QStackedWidget,
+    QToolButton, QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.setMinimumSize(QSize(980, 640))
+        MainWindow.setStyleSheet(u"\n"
+"* {\n"
+"    font-family: \"Segoe UI\";\n"
+"    font-size: 12pt;\n"
+"    color: rgb(220, 225, 230);\n"
+"}\n"
+"QWidget {\n"
+"    background-color: rgb(18, 22, 28);\n"
+"}\n"
+"QFrame#card_frame, QFrame#config_card, QFrame#status_card, QFrame#requests_card, QFrame#logs_panel {\n"
+"    background-color: rgb(26, 30, 36);\n"
+"    border: 1px solid rgb(40, 46, 54);\n"
+"    border-radius: 12px;\n"
+"}\n"
+"QPushButton {\n"
+"    background-color: rgb(56, 120, 200);\n"
+"    border: none;\n"
+"    border-radius: 8px;\n"
+"    padding: 8px 16px;\n"
+"}\n"
+"QPushButton:hover {\n"
+"    background-color: rgb(70, 135, 215);\n"
+"}\n"
+"QPushButton:pressed {\n"
+"    background-color: rgb(44, 105, 180);\n"
+"}\n"
+"QPushButton[secondary=\"true\"] {\n"
+"    background-color: rgb(40, 46, 54);\n"
+"    border: 1px solid rgb(60, 70, 82);\n"
+"}\n"
+"QPushButton[secondary=\"true\"]:hover {\n"
+"    background-color: rgb(52, 60, 70);\n"
+"}\n"
+"QListView#floor_list {\n"
+"    border: none;\n"
+"}\n"
+"QListView#floor_list::item {\n"
+"    backgroun"
+                        "d-color: rgb(56, 120, 200);\n"
+"    border-radius: 8px;\n"
+"}\n"
+"QListView#floor_list::item:hover {\n"
+"    background-color: rgb(70, 135, 215);\n"
+"}\n"
+"QListView#floor_list::item:disabled {\n"
+"    background-color: rgb(40, 46, 54);\n"
+"    color: rgb(120, 130, 140);\n"
+"}\n"
+"QLabel#title_label {\n"
+"    font-size: 28pt;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QLabel#subtitle_label {\n"
+"    color: rgb(160, 170, 180);\n"
+"}\n"
+"QGroupBox {\n"
+"    border: none;\n"
+"    font-weight: bold;\n"
+"}\n"
+"QGroupBox::title {\n"
+"    subcontrol-origin: margin;\n"
+"    left: 6px;\n"
+"    padding: 0 6px;\n"
+"}\n"
+"QSpinBox, QComboBox, QSlider, QPlainTextEdit {\n"
+"    background-color: rgb(30, 34, 40);\n"
+"    border: 1px solid rgb(50, 56, 66);\n"
+"    border-radius: 6px;\n"
+"    padding: 4px;\n"
+"}\n"
+"QToolButton {\n"
+"    background-color: transparent;\n"
+"    border: none;\n"
+"    color: rgb(200, 210, 220);\n"
+"}\n"
+"   ")
+        self.root_layout = QVBoxLayout(MainWindow)
+        self.root_layout.setObjectName(u"root_layout")
+        self.stacked_widget = QStackedWidget(MainWindow)
+        self.stacked_widget.setObjectName(u"stacked_widget")
+        self.start_page = QWidget()
+        self.start_page.setObjectName(u"start_page")
+        self.start_layout = QVBoxLayout(self.start_page)
+        self.start_layout.setObjectName(u"start_layout")
+        self.start_top_spacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.start_layout.addItem(self.start_top_spacer)
+
+        self.start_center_layout = QHBoxLayout()
+        self.start_center_layout.setObjectName(u"start_center_layout")
+        self.start_left_spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.start_center_layout.addItem(self.start_left_spacer)
+
+        self.card_frame = QFrame(self.start_page)
+        self.card_frame.setObjectName(u"card_frame")
+        self.card_frame.setMinimumSize(QSize(360, 260))
+        self.card_layout = QVBoxLayout(self.card_frame)
+        self.card_layout.setObjectName(u"card_layout")
+        self.title_label = QLabel(self.card_frame)
+        self.title_label.setObjectName(u"title_label")
+        self.title_label.setAlignment(Qt.AlignCenter)
+
+        self.card_layout.addWidget(self.title_label)
+
+        self.subtitle_label = QLabel(self.card_frame)
+        self.subtitle_label.setObjectName(u"subtitle_label")
+        self.subtitle_label.setAlignment(Qt.AlignCenter)
+
+        self.card_layout.addWidget(self.subtitle_label)
+
+        self.start_buttons_layout = QVBoxLayout()
+        self.start_buttons_layout.setObjectName(u"start_buttons_layout")
+        self.start_button = QPushButton(self.card_frame)
+        self.start_button.setObjectName(u"start_button")
+        self.start_button.setMinimumSize(QSize(200, 40))
+
+        self.start_buttons_layout.addWidget(self.start_button)
+
+        self.about_button = QPushButton(self.card_frame)
+        self.about_button.setObjectName(u"about_button")
+        self.about_button.setMinimumSize(QSize(200, 36))
+        self.about_button.setProperty(u"secondary", True)
+
+        self.start_buttons_layout.addWidget(self.about_button)
+
+
+        self.card_layout.addLayout(self.start_buttons_layout)
+
+
+        self.start_center_layout.addWidget(self.card_frame)
+
+        self.start_right_spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.start_center_layout.addItem(self.start_right_spacer)
+
+
+        self.start_layout.addLayout(self.start_center_layout)
+
+        self.start_bottom_spacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.start_layout.addItem(self.start_bottom_spacer)
+
+        self.stacked_widget.addWidget(self.start_page)
+        self.config_page = QWidget()
+        self.config_page.setObjectName(u"config_page")
+        self.config_layout = QVBoxLayout(self.config_page)
+        self.config_layout.setObjectName(u"config_layout")
+        self.config_top_spacer = QSpacerItem(20, 30, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.config_layout.addItem(self.config_top_spacer)
+
+        self.config_center_layout = QHBoxLayout()
+        self.config_center_layout.setObjectName(u"config_center_layout")
+        self.config_left_spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.config_center_layout.addItem(self.config_left_spacer)
+
+        self.config_card = QFrame(self.config_page)
+        self.config_card.setObjectName(u"config_card")
+        self.config_card.setMinimumSize(QSize(420, 260))
+        self.config_card_layout = QVBoxLayout(self.config_card)
+        self.config_card_layout.setObjectName(u"config_card_layout")
+        self.config_title = QLabel(self.config_card)
+        self.config_title.setObjectName(u"config_title")
+        self.config_title.setAlignment(Qt.AlignCenter)
+
+        self.config_card_layout.addWidget(self.config_title)
+
+        self.config_form_layout = QFormLayout()
+        self.config_form_layout.setObjectName(u"config_form_layout")
+        self.floor_count_label = QLabel(self.config_card)
+        self.floor_count_label.setObjectName(u"floor_count_label")
+
+        self.config_form_layout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.floor_count_label)
+
+        self.floor_count_spin = QSpinBox(self.config_card)
+        self.floor_count_spin.setObjectName(u"floor_count_spin")
+        self.floor_count_spin.setMinimum(2)
+        self.floor_count_spin.setMaximum(300)
+        self.floor_count_spin.setValue(6)
+
+        self.config_form_layout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.floor_count_spin)
+
+        self.mode_label = QLabel(self.config_card)
+        self.mode_label.setObjectName(u"mode_label")
+
+        self.config_form_layout.setWidget(1, QFormLayout.ItemRole.LabelRole, self.mode_label)
+
+        self.mode_combo = QComboBox(self.config_card)
+        self.mode_combo.addItem("")
+        self.mode_combo.addItem("")
+        self.mode_combo.addItem("")
+        self.mode_combo.addItem("")
+        self.mode_combo.addItem("")
+        self.mode_combo.addItem("")
+        self.mode_combo.setObjectName(u"mode_combo")
+
+        self.config_form_layout.setWidget(1, QFormLayout.ItemRole.FieldRole, self.mode_combo)
+
+        self.speed_label = QLabel(self.config_card)
+        self.speed_label.setObjectName(u"speed_label")
+
+        self.config_form_layout.setWidget(2, QFormLayout.ItemRole.LabelRole, self.speed_label)
+
+        self.speed_slider = QSlider(self.config_card)
+        self.speed_slider.setObjectName(u"speed_slider")
+        self.speed_slider.setOrientation(Qt.Horizontal)
+        self.speed_slider.setMinimum(1)
+        self.speed_slider.setMaximum(10)
+        self.speed_slider.setValue(5)
+
+        self.config_form_layout.setWidget(2, QFormLayout.ItemRole.FieldRole, self.speed_slider)
+
+
+        self.config_card_layout.addLayout(self.config_form_layout)
+
+        self.config_buttons_layout = QHBoxLayout()
+        self.config_buttons_layout.setObjectName(u"config_buttons_layout")
+        self.config_button_spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.config_buttons_layout.addItem(self.config_button_spacer)
+
+        self.back_button = QPushButton(self.config_card)
+        self.back_button.setObjectName(u"back_button")
+        self.back_button.setProperty(u"secondary", True)
+
+        self.config_buttons_layout.addWidget(self.back_button)
+
+        self.simulate_button = QPushButton(self.config_card)
+        self.simulate_button.setObjectName(u"simulate_button")
+
+        self.config_buttons_layout.addWidget(self.simulate_button)
+
+
+        self.config_card_layout.addLayout(self.config_buttons_layout)
+
+
+        self.config_center_layout.addWidget(self.config_card)
+
+        self.config_right_spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.config_center_layout.addItem(self.config_right_spacer)
+
+
+        self.config_layout.addLayout(self.config_center_layout)
+
+        self.config_bottom_spacer = QSpacerItem(20, 30, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.config_layout.addItem(self.config_bottom_spacer)
+
+        self.stacked_widget.addWidget(self.config_page)
+        self.sim_page = QWidget()
+        self.sim_page.setObjectName(u"sim_page")
+        self.sim_page_layout = QVBoxLayout(self.sim_page)
+        self.sim_page_layout.setObjectName(u"sim_page_layout")
+        self.sim_root_layout = QHBoxLayout()
+        self.sim_root_layout.setObjectName(u"sim_root_layout")
+        self.simulation_frame = QFrame(self.sim_page)
+        self.simulation_frame.setObjectName(u"simulation_frame")
+        self.simulation_frame.setFrameShape(QFrame.StyledPanel)
+        self.simulation_layout = QVBoxLayout(self.simulation_frame)
+        self.simulation_layout.setObjectName(u"simulation_layout")
+        self.simulation_label = QLabel(self.simulation_frame)
+        self.simulation_label.setObjectName(u"simulation_label")
+        self.simulation_label.setMinimumSize(QSize(520, 520))
+        self.simulation_label.setStyleSheet(u"background-color: rgb(12, 16, 22); border: 1px solid rgb(40, 46, 54); border-radius: 10px;")
+        self.simulation_label.setAlignment(Qt.AlignCenter)
+
+        self.simulation_layout.addWidget(self.simulation_label)
+
+
+        self.sim_root_layout.addWidget(self.simulation_frame)
+
+        self.controls_panel = QWidget(self.sim_page)
+        self.controls_panel.setObjectName(u"controls_panel")
+        self.controls_layout = QVBoxLayout(self.controls_panel)
+        self.controls_layout.setObjectName(u"controls_layout")
+        self.controls_layout.setContentsMargins(0, 0, 0, 0)
+        self.status_card = QFrame(self.controls_panel)
+        self.status_card.setObjectName(u"status_card")
+        self.status_layout = QFormLayout(self.status_card)
+        self.status_layout.setObjectName(u"status_layout")
+        self.current_floor_label = QLabel(self.status_card)
+        self.current_floor_label.setObjectName(u"current_floor_label")
+
+        self.status_layout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.current_floor_label)
+
+        self.current_floor_value = QLabel(self.status_card)
+        self.current_floor_value.setObjectName(u"current_floor_value")
+
+        self.status_layout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.current_floor_value)
+
+        self.direction_label = QLabel(self.status_card)
+        self.direction_label.setObjectName(u"direction_label")
+
+        self.status_layout.setWidget(1, QFormLayout.ItemRole.LabelRole, self.direction_label)
+
+        self.direction_value = QLabel(self.status_card)
+        self.direction_value.setObjectName(u"direction_value")
+
+        self.status_layout.setWidget(1, QFormLayout.ItemRole.FieldRole, self.direction_value)
+
+        self.door_label = QLabel(self.status_card)
+        self.door_label.setObjectName(u"door_label")
+
+        self.status_layout.setWidget(2, QFormLayout.ItemRole.LabelRole, self.door_label)
+
+        self.door_value = QLabel(self.status_card)
+        self.door_value.setObjectName(u"door_value")
+
+        self.status_layout.setWidget(2, QFormLayout.ItemRole.FieldRole, self.door_value)
+
+        self.mode_value_label = QLabel(self.status_card)
+        self.mode_value_label.setObjectName(u"mode_value_label")
+
+        self.status_layout.setWidget(3, QFormLayout.ItemRole.LabelRole, self.mode_value_label)
+
+        self.mode_value = QLabel(self.status_card)
+        self.mode_value.setObjectName(u"mode_value")
+
+        self.status_layout.setWidget(3, QFormLayout.ItemRole.FieldRole, self.mode_value)
+
+        self.next_stops_label = QLabel(self.status_card)
+        self.next_stops_label.setObjectName(u"next_stops_label")
+
+        self.status_layout.setWidget(4, QFormLayout.ItemRole.LabelRole, self.next_stops_label)
+
+        self.next_stops_value = QLabel(self.status_card)
+        self.next_stops_value.setObjectName(u"next_stops_value")
+
+        self.status_layout.setWidget(4, QFormLayout.ItemRole.FieldRole, self.next_stops_value)
+
+
+        self.controls_layout.addWidget(self.status_card)
+
+        self.requests_card = QFrame(self.controls_panel)
+        self.requests_card.setObjectName(u"requests_card")
+        self.requests_card_layout = QVBoxLayout(self.requests_card)
+        self.requests_card_layout.setObjectName(u"requests_card_layout")
+        self.requests_title = QLabel(self.requests_card)
+        self.requests_title.setObjectName(u"requests_title")
+
+        self.requests_card_layout.addWidget(self.requests_title)
+
+        self.floor_list = QListView(self.requests_card)
+        self.floor_list.setObjectName(u"floor_list")
+        self.floor_list.setMinimumSize(QSize(240, 200))
+        self.floor_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.floor_list.setMovement(QListView.Static)
+        self.floor_list.setFlow(QListView.LeftToRight)
+        self.floor_list.setProperty(u"isWrapping", True)
+        self.floor_list.setResizeMode(QListView.Adjust)
+        self.floor_list.setGridSize(QSize(56, 50))
+        self.floor_list.setUniformItemSizes(True)
+
+        self.requests_card_layout.addWidget(self.floor_list)
+
+        self.controls_grid = QGridLayout()
+        self.controls_grid.setObjectName(u"controls_grid")
+        self.start_pause_button = QPushButton(self.requests_card)
+        self.start_pause_button.setObjectName(u"start_pause_button")
+
+        self.controls_grid.addWidget(self.start_pause_button, 0, 0, 1, 1)
+
+        self.reset_button = QPushButton(self.requests_card)
+        self.reset_button.setObjectName(u"reset_button")
+
+        self.controls_grid.addWidget(self.reset_button, 0, 1, 1, 1)
+
+        self.open_door_button = QPushButton(self.requests_card)
+        self.open_door_button.setObjectName(u"open_door_button")
+
+        self.controls_grid.addWidget(self.open_door_button, 1, 0, 1, 1)
+
+        self.close_door_button = QPushButton(self.requests_card)
+        self.close_door_button.setObjectName(u"close_door_button")
+
+        self.controls_grid.addWidget(self.close_door_button, 1, 1, 1, 1)
+
+        self.emergency_button = QPushButton(self.requests_card)
+        self.emergency_button.setObjectName(u"emergency_button")
+
+        self.controls_grid.addWidget(self.emergency_button, 2, 0, 1, 2)
+
+
+        self.requests_card_layout.addLayout(self.controls_grid)
+
+
+        self.controls_layout.addWidget(self.requests_card)
+
+        self.back_to_config_button = QPushButton(self.controls_panel)
+        self.back_to_config_button.setObjectName(u"back_to_config_button")
+        self.back_to_config_button.setProperty(u"secondary", True)
+
+        self.controls_layout.addWidget(self.back_to_config_button)
+
+        self.right_spacer = QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.controls_layout.addItem(self.right_spacer)
+
+
+        self.sim_root_layout.addWidget(self.controls_panel)
+
+
+        self.sim_page_layout.addLayout(self.sim_root_layout)
+
+        self.logs_panel = QFrame(self.sim_page)
+        self.logs_panel.setObjectName(u"logs_panel")
+        self.logs_panel_layout = QVBoxLayout(self.logs_panel)
+        self.logs_panel_layout.setObjectName(u"logs_panel_layout")
+        self.logs_toggle_button = QToolButton(self.logs_panel)
+        self.logs_toggle_button.setObjectName(u"logs_toggle_button")
+        self.logs_toggle_button.setCheckable(True)
+
+        self.logs_panel_layout.addWidget(self.logs_toggle_button)
+
+        self.logs_content = QWidget(self.logs_panel)
+        self.logs_content.setObjectName(u"logs_content")
+        self.logs_content_layout = QVBoxLayout(self.logs_content)
+        self.logs_content_layout.setObjectName(u"logs_content_layout")
+        self.logs_content_layout.setContentsMargins(0, 0, 0, 0)
+        self.log_output = QPlainTextEdit(self.logs_content)
+        self.log_output.setObjectName(u"log_output")
+        self.log_output.setMinimumSize(QSize(320, 140))
+
+        self.logs_content_layout.addWidget(self.log_output)
+
+        self.log_controls_layout = QHBoxLayout()
+        self.log_controls_layout.setObjectName(u"log_controls_layout")
+        self.log_controls_spacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.log_controls_layout.addItem(self.log_controls_spacer)
+
+        self.copy_log_button = QPushButton(self.logs_content)
+        self.copy_log_button.setObjectName(u"copy_log_button")
+        self.copy_log_button.setProperty(u"secondary", True)
+
+        self.log_controls_layout.addWidget(self.copy_log_button)
+
+        self.export_log_button = QPushButton(self.logs_content)
+        self.export_log_button.setObjectName(u"export_log_button")
+        self.export_log_button.setProperty(u"secondary", True)
+
+        self.log_controls_layout.addWidget(self.export_log_button)
+
+        self.clear_log_button = QPushButton(self.logs_content)
+        self.clear_log_button.setObjectName(u"clear_log_button")
+        self.clear_log_button.setProperty(u"secondary", True)
+
+        self.log_controls_layout.addWidget(self.clear_log_button)
+
+
+        self.logs_content_layout.addLayout(self.log_controls_layout)
+
+
+        self.logs_panel_layout.addWidget(self.logs_content)
+
+
+        self.sim_page_layout.addWidget(self.logs_panel)
+
+        self.stacked_widget.addWidget(self.sim_page)
+
+        self.root_layout.addWidget(self.stacked_widget)
+
+
+        self.retranslateUi(MainWindow)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Elevator Simulation", None))
+        self.title_label.setText(QCoreApplication.translate("MainWindow", u"Elevator Simulation", None))
+        self.subtitle_label.setText(QCoreApplication.translate("MainWindow", u"Embedded real-time elevator simulator", None))
+        self.start_button.setText(QCoreApplication.translate("MainWindow", u"Configure Simulation", None))
+        self.about_button.setText(QCoreApplication.translate("MainWindow", u"About", None))
+        self.config_title.setText(QCoreApplication.translate("MainWindow", u"Configure Simulation", None))
+        self.floor_count_label.setText(QCoreApplication.translate("MainWindow", u"How many floors?", None))
+        self.mode_label.setText(QCoreApplication.translate("MainWindow", u"Mode", None))
+        self.mode_combo.setItemText(0, QCoreApplication.translate("MainWindow", u"Simple", None))
+        self.mode_combo.setItemText(1, QCoreApplication.translate("MainWindow", u"FIFO", None))
+        self.mode_combo.setItemText(2, QCoreApplication.translate("MainWindow", u"SCAN", None))
+        self.mode_combo.setItemText(3, QCoreApplication.translate("MainWindow", u"LOOK", None))
+        self.mode_combo.setItemText(4, QCoreApplication.translate("MainWindow", u"C-SCAN", None))
+        self.mode_combo.setItemText(5, QCoreApplication.translate("MainWindow", u"Cost", None))
+
+        self.speed_label.setText(QCoreApplication.translate("MainWindow", u"Speed", None))
+        self.back_button.setText(QCoreApplication.translate("MainWindow", u"Back", None))
+        self.simulate_button.setText(QCoreApplication.translate("MainWindow", u"Start Simulation", None))
+        self.simulation_label.setText("")
+        self.current_floor_label.setText(QCoreApplication.translate("MainWindow", u"Current Floor", None))
+        self.current_floor_value.setText(QCoreApplication.translate("MainWindow", u"-", None))
+        self.direction_label.setText(QCoreApplication.translate("MainWindow", u"Direction", None))
+        self.direction_value.setText(QCoreApplication.translate("MainWindow", u"-", None))
+        self.door_label.setText(QCoreApplication.translate("MainWindow", u"Door State", None))
+        self.door_value.setText(QCoreApplication.translate("MainWindow", u"-", None))
+        self.mode_value_label.setText(QCoreApplication.translate("MainWindow", u"Mode", None))
+        self.mode_value.setText(QCoreApplication.translate("MainWindow", u"-", None))
+        self.next_stops_label.setText(QCoreApplication.translate("MainWindow", u"Next Stops", None))
+        self.next_stops_value.setText(QCoreApplication.translate("MainWindow", u"-", None))
+        self.requests_title.setText(QCoreApplication.translate("MainWindow", u"Requests & Controls", None))
+        self.start_pause_button.setText(QCoreApplication.translate("MainWindow", u"Start", None))
+        self.reset_button.setText(QCoreApplication.translate("MainWindow", u"Reset", None))
+        self.open_door_button.setText(QCoreApplication.translate("MainWindow", u"Open Door", None))
+        self.close_door_button.setText(QCoreApplication.translate("MainWindow", u"Close Door", None))
+        self.emergency_button.setText(QCoreApplication.translate("MainWindow", u"Emergency Stop", None))
+        self.back_to_config_button.setText(QCoreApplication.translate("MainWindow", u"Back to Configure", None))
+        self.logs_toggle_button.setText(QCoreApplication.translate("MainWindow", u"Logs ?", None))
+        self.copy_log_button.setText(QCoreApplication.translate("MainWindow", u"Copy", None))
+        self.export_log_button.setText(QCoreApplication.translate("MainWindow", u"Export", None))
+        self.clear_log_button.setText(QCoreApplication.translate("MainWindow", u"Clear", None))
+    # retranslateUi
+
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import logging
+import shutil
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, Optional, Union
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QPlainTextEdit
+
+
+class LogSink:
+    """Timestamped log lines for a QPlainTextEdit, batched and bounded.
+
+    Lines written during one pass of the event loop are appended in a single
+    edit, the widget keeps at most `max_lines`, and every line also goes to
+    a rotating file at `path`. The file is rolled over when the sink opens
+    and on clear(), so earlier runs and cleared lines stay in the backups
+    and export() only copies what was written since.
+    """
+
+    def __init__(
+        self,
+        widget: QPlainTextEdit,
+        path: Optional[Path] = None,
+        max_lines: int = 2000,
+        max_bytes: int = 1_000_000,
+        backups: int = 3,
+    ) -> None:
+        self.widget = widget
+        self.path = path
+        self.widget.setMaximumBlockCount(max(1, max_lines))
+        self._pending: List[str] = []
+        self._second = -1
+        self._stamp = ""
+        self._handler: Optional[_SessionFileHandler] = None
+        if path is not None:
+            self._handler = _SessionFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+            self._handler.start_session()
+
+    def write(self, message: str) -> None:
+        second = int(time.time())
+        if second != self._second:
+            self._second = second
+            self._stamp = time.strftime("%H:%M:%S", time.localtime(second))
+        if not self._pending:
+            QTimer.singleShot(0, self.flush)
+        self._pending.append(f"[{self._stamp}] {message}")
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        self.widget.appendPlainText(text)
+        self.widget.ensureCursorVisible()
+        if self._handler is not None:
+            # Straight to the handler: a named logger per sink would stay
+            # registered in the logging module after close().
+            self._handler.handle(logging.makeLogRecord({"msg": text, "levelno": logging.INFO}))
+
+    def clear(self) -> None:
+        """Clear the widget and start a new file; the backups keep the history."""
+        self._pending.clear()
+        self.widget.clear()
+        if self._handler is not None:
+            self._handler.start_session()
+
+    def export(self, target: Union[str, Path]) -> None:
+        """Copy this session's log, oldest rotated backup first, to `target`."""
+        self.flush()
+        if self._handler is None or self.path is None:
+            with open(target, "w", encoding="utf-8") as handle:
+                handle.write(self.widget.toPlainText())
+            return
+        self._handler.flush()
+        rotated = min(self._handler.rollovers, self._handler.backupCount)
+        backups = [Path(f"{self.path}.{index}") for index in range(rotated, 0, -1)]
+        with open(target, "wb") as output:
+            for source in backups + [self.path]:
+                if source.exists():
+                    with open(source, "rb") as handle:
+                        shutil.copyfileobj(handle, output)
+
+    def close(self) -> None:
+        """Flush and release the log file; the sink keeps working for the widget only."""
+        self.flush()
+        if self._handler is not None:
+            self._handler.close()
+            self._handler = None
+
+
+class _SessionFileHandler(RotatingFileHandler):
+    """Counts the rollovers since start_session(), i.e. the backups that belong to it."""
+
+    rollovers = 0
+
+    def start_session(self) -> None:
+        if self.stream is not None and self.stream.tell() > 0:
+            self.doRollover()
+        self.rollovers = 0
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self.rollovers += 1
+
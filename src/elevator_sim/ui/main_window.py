@@ -3,51 +3,88 @@ from __future__ import annotations
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Optional
 
-from PySide6.QtCore import QTimer
-from PySide6.QtGui import QGuiApplication, QIcon, QPixmap
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtWidgets import QFileDialog, QGridLayout, QPushButton, QWidget
+from PySide6.QtCore import QModelIndex, Qt, QTimer
+from PySide6.QtGui import QGuiApplication, QIcon, QKeySequence, QPixmap, QShortcut
+from PySide6.QtWidgets import QDialog, QFileDialog, QLabel, QWidget
 
 from ..core.controller import ElevatorController
 from ..core.events import format_event
 from ..core.model import DoorState
-from ..core.scheduler import FifoScheduler, ScanScheduler, SimpleScheduler
-from ..render.pygame_canvas import PygameCanvas
+from ..core.profiling import Profiler
+from ..core.scheduler import FifoScheduler, create_scheduler
+from ..core.worker import CommandResult, ControllerSnapshot, SimulationWorker
+from .floor_list import FloorListModel
+from .forms.ui_info_dialog import Ui_InfoDialogWindow
+from .forms.ui_main_window import Ui_MainWindow
+from .log_sink import LogSink
+from .storage import data_dir, prune
+from .view_model import ViewModel
+
+RENDERERS = ("pygame", "qpainter", "opengl")
+
+# The controller runs on a SimulationWorker thread in fixed steps, whatever
+# the display rate. The UI timer ticks every ACTIVE_INTERVAL ms while
+# something is moving and backs off to IDLE_INTERVAL ms when the car is idle
+# or paused.
+ACTIVE_INTERVAL = 33
+IDLE_INTERVAL = 250
+LOG_MAX_LINES = 2000
+KEEP_SESSIONS = 20
+OVERLAY_REFRESH = 0.5
 
 
 class MainWindow:
-    def __init__(self) -> None:
-        ui_path = Path(__file__).resolve().parent / "ui_files" / "Elevator_Interface_updated.ui"
-        loader = QUiLoader()
-        self.ui = loader.load(str(ui_path))
-        if self.ui is None:
-            raise RuntimeError(f"Failed to load UI: {ui_path}")
-
+    def __init__(self, renderer: str = "pygame", log_lines: int = LOG_MAX_LINES, profile: bool = False) -> None:
+        if renderer not in RENDERERS:
+            raise ValueError(f"Unknown renderer: {renderer}")
+        self.ui = _MainForm()
         self.ui.setWindowTitle("Elevator Simulation")
-        self._info_dialog = self._load_info_dialog()
+        self._info_dialog: Optional[QDialog] = None
+        self.log = self._create_log_sink(log_lines)
 
+        # Owned by the worker thread once it starts; the UI reads snapshots.
         self.controller = ElevatorController()
-        self.renderer = PygameCanvas(width=480, height=520, floor_count=self.controller.floor_count)
+        # Shared with the worker thread; F3 toggles it and the overlay.
+        self.profiler = Profiler()
+        self.profiler.enabled = profile
+        self._overlay: Optional[QLabel] = None
+        self._overlay_refreshed = 0.0
+        self._worker = SimulationWorker(self.controller, profiler=self.profiler)
+        self._snapshot: ControllerSnapshot = self._worker.snapshot()
+        self._floor_count = self.controller.floor_count
+        # Created when the simulation page is first shown, so the backend
+        # (pygame in particular) is not imported on the startup path.
+        self.renderer: Optional[Any] = None
+        self._renderer_name = renderer
         self._running = False
-        self._last_tick = time.monotonic()
-        self._floor_layout: Optional[QGridLayout] = None
-        self._floor_buttons: Dict[int, QPushButton] = {}
+        self._view_key: Optional[tuple] = None
+        self._dirty = True
+        self.view = ViewModel()
+        # The floor selector is a list view over this model, so a tall
+        # building costs one row per floor and no widgets.
+        self.floors = FloorListModel(self._floor_count, self.ui)
+        self.ui.floor_list.setModel(self.floors)
 
         self.timer = QTimer()
-        self.timer.setInterval(33)
+        self.timer.setInterval(ACTIVE_INTERVAL)
         self.timer.timeout.connect(self._on_tick)
 
         self._apply_assets()
         self._setup_controls()
-        self._rebuild_floor_buttons()
-        self._render_frame()
         self._show_start_page()
+        self._worker.start()
 
     def show(self) -> None:
         self.ui.show()
 
+    def shutdown(self) -> None:
+        self._stop_timer()
+        self._stop_recording()
+        self._worker.stop()
+        self.log.close()
+
     def _apply_assets(self) -> None:
         assets_dir = Path(__file__).resolve().parent / "assets"
         open_icon = QIcon(str(assets_dir / "open_doors.png"))
@@ -69,168 +106,306 @@ class MainWindow:
         self.ui.emergency_button.toggled.connect(self._toggle_emergency)
         self.ui.open_door_button.clicked.connect(self._open_door)
         self.ui.close_door_button.clicked.connect(self._close_door)
+        self.ui.floor_list.clicked.connect(self._floor_clicked)
 
-        self.ui.clear_log_button.clicked.connect(self.ui.log_output.clear)
+        self.ui.clear_log_button.clicked.connect(self.log.clear)
         self.ui.copy_log_button.clicked.connect(self._copy_logs)
         self.ui.export_log_button.clicked.connect(self._export_logs)
         self.ui.logs_toggle_button.toggled.connect(self._toggle_logs_drawer)
+        QShortcut(QKeySequence(Qt.Key_F3), self.ui, self._toggle_profiling)
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self.ui, self._dump_profile)
 
         self.ui.simulation_label.setFixedSize(520, 520)
-        self.ui.simulation_label.setScaledContents(True)
         self.ui.log_output.setReadOnly(True)
         self.ui.emergency_button.setCheckable(True)
         self.ui.logs_toggle_button.setChecked(False)
         self.ui.logs_content.setVisible(False)
 
-        self.ui.floor_count_spin.setValue(self.controller.floor_count)
+        self.ui.floor_count_spin.setValue(self._floor_count)
         self._change_mode(self.ui.mode_combo.currentText())
 
     def _show_start_page(self) -> None:
         self._stop_timer()
+        self._worker.set_running(False)
+        self._stop_recording()
         self.ui.stacked_widget.setCurrentWidget(self.ui.start_page)
 
     def _show_config_page(self) -> None:
         self._stop_timer()
+        self._worker.set_running(False)
+        self._stop_recording()
         self.ui.stacked_widget.setCurrentWidget(self.ui.config_page)
 
     def _start_simulation(self) -> None:
+        if self.renderer is None:
+            self.renderer = self._create_renderer(self._renderer_name)
         self._apply_config()
+        self._start_recording()
         self.ui.stacked_widget.setCurrentWidget(self.ui.sim_page)
-        self._last_tick = time.monotonic()
+        self._worker.set_running(self._running)
+        self._dirty = True
         self._start_timer()
-        self._update_status()
-        self._update_controls()
 
     def _apply_config(self) -> None:
-        floor_count = self.ui.floor_count_spin.value()
-        self.controller.reset()
-        self.controller.set_floor_count(floor_count)
-        self.renderer.set_floor_count(self.controller.floor_count)
+        self._set_floor_count(self.ui.floor_count_spin.value(), reset=True)
         self._change_mode(self.ui.mode_combo.currentText())
-        self._rebuild_floor_buttons()
-        self._log_message(f"Configured for {floor_count} floors")
+        self._log_message(f"Configured for {self._floor_count} floors")
+
+    def _set_floor_count(self, floor_count: int, reset: bool) -> None:
+        if reset:
+            self._worker.call("reset")
+        self._worker.call("set_floor_count", floor_count)
+        self._floor_count = max(2, floor_count)
+        if self.renderer is not None:
+            self.renderer.set_floor_count(self._floor_count)
+        self.floors.set_floor_count(self._floor_count)
 
     def _toggle_running(self) -> None:
         self._running = not self._running
+        self._worker.set_running(self._running)
         label = "Pause" if self._running else "Start"
         self.ui.start_pause_button.setText(label)
+        self._wake()
 
     def _reset_simulation(self) -> None:
         self._running = False
+        self._worker.set_running(False)
         self.ui.start_pause_button.setText("Start")
-        self.controller.reset()
-        self.controller.set_floor_count(self.ui.floor_count_spin.value())
-        self.renderer.set_floor_count(self.controller.floor_count)
-        self._rebuild_floor_buttons()
+        self._set_floor_count(self.ui.floor_count_spin.value(), reset=True)
         self._log_message("Simulation reset")
+        self._wake()
 
     def _toggle_emergency(self, active: bool) -> None:
-        self.controller.set_emergency_stop(active)
+        self._worker.call("set_emergency_stop", active)
         if active:
             self._running = False
+            self._worker.set_running(False)
             self.ui.start_pause_button.setText("Start")
-        self._update_controls()
+        self._wake()
 
     def _open_door(self) -> None:
-        if self.controller.request_open_door():
-            self._log_message("Door command: open")
+        self._worker.call("request_open_door", tag="open_door")
+        self._wake()
 
     def _close_door(self) -> None:
-        if self.controller.request_close_door():
-            self._log_message("Door command: close")
+        self._worker.call("request_close_door", tag="close_door")
+        self._wake()
 
     def _change_mode(self, text: str) -> None:
-        if text == "Simple":
-            scheduler = SimpleScheduler()
-        elif text == "SCAN":
-            scheduler = ScanScheduler()
-        else:
+        try:
+            scheduler = create_scheduler(text)
+        except ValueError:
             scheduler = FifoScheduler()
-        self.controller.set_scheduler(scheduler)
-        self._update_status()
-
-    def _rebuild_floor_buttons(self) -> None:
-        container = self.ui.floor_button_container
-        if self._floor_layout is not None:
-            while self._floor_layout.count():
-                item = self._floor_layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-            QWidget().setLayout(self._floor_layout)
-
-        self._floor_layout = QGridLayout()
-        self._floor_layout.setSpacing(6)
-        container.setLayout(self._floor_layout)
-        self._floor_buttons.clear()
-
-        floor_count = self.controller.floor_count
-        columns = 3 if floor_count > 6 else 2
-        for index in range(floor_count):
-            floor = index + 1
-            button = QPushButton(str(floor))
-            button.setMinimumSize(48, 42)
-            button.clicked.connect(lambda _, f=floor: self._request_floor(f))
-            row = index // columns
-            col = index % columns
-            self._floor_layout.addWidget(button, row, col)
-            self._floor_buttons[floor] = button
-
-        self._update_request_buttons()
+        self._worker.call("set_scheduler", scheduler)
+        self._wake()
+
+    def _floor_clicked(self, index: QModelIndex) -> None:
+        if self.floors.requestable(index):
+            self._request_floor(index.row() + 1)
 
     def _request_floor(self, floor: int) -> None:
-        if self.controller.add_request(floor):
-            self._log_message(f"Floor {floor} requested")
-        self._update_request_buttons()
+        self._worker.call("add_request", floor, tag=("request", floor))
+        self._wake()
 
     def _on_tick(self) -> None:
-        now = time.monotonic()
-        dt = now - self._last_tick
-        self._last_tick = now
-
-        if self._running:
-            self.controller.update(dt)
-
-        self._render_frame()
-        self._update_status()
-        self._update_controls()
+        profiler = self.profiler
+        tick_started = started = profiler.start()
+        self._snapshot = self._worker.snapshot()
+        view_key = self._state_key()
+        started = profiler.lap("tick.snapshot", started)
+        if self._dirty or view_key != self._view_key:
+            self._view_key = view_key
+            self._dirty = False
+            self._render_frame()
+            started = profiler.lap("tick.render", started)
+            self._update_status()
+            started = profiler.lap("tick.status", started)
+            self._update_controls()
+            started = profiler.lap("tick.controls", started)
         self._drain_events()
+        profiler.lap("tick.drain_events", started)
+        profiler.lap("tick", tick_started)
+        if profiler.enabled:
+            self._refresh_overlay()
+
+        busy = self._snapshot.running and not self._snapshot.idle
+        interval = ACTIVE_INTERVAL if busy else IDLE_INTERVAL
+        if self.timer.interval() != interval:
+            self.timer.setInterval(interval)
+
+    def _state_key(self) -> tuple:
+        snapshot = self._snapshot
+        state = snapshot.state
+        return (
+            state.current_floor,
+            state.direction,
+            state.door_state,
+            state.target_floor,
+            snapshot.emergency_stop,
+            snapshot.pending_requests,
+            snapshot.scheduler_name,
+        )
+
+    def _wake(self) -> None:
+        """Refresh the view on the next tick and tick at the active rate."""
+        self._dirty = True
+        if self.timer.isActive() and self.timer.interval() != ACTIVE_INTERVAL:
+            self.timer.setInterval(ACTIVE_INTERVAL)
+
+    def _create_renderer(self, name: str):
+        floor_count = self._floor_count
+        if name == "pygame":
+            # Imported here so the QPainter backends never load pygame.
+            from ..render.pygame_canvas import PygameCanvas
+
+            return PygameCanvas(width=520, height=520, floor_count=floor_count)
+
+        from ..render.qpainter_canvas import OpenGLCanvas, QPainterCanvas
+
+        if name == "opengl":
+            if OpenGLCanvas is None:
+                raise ValueError("This Qt build has no OpenGL widget support")
+            canvas = OpenGLCanvas(floor_count)
+        else:
+            canvas = QPainterCanvas(floor_count)
+        canvas.profiler = self.profiler
+        label = self.ui.simulation_label
+        canvas.setFixedSize(label.minimumSize())
+        label.parentWidget().layout().replaceWidget(label, canvas)
+        label.hide()
+        return canvas
 
     def _render_frame(self) -> None:
-        image = self.renderer.draw(self.controller.state)
+        if isinstance(self.renderer, QWidget):
+            # Painting happens later, in the canvas's paint event ("render.paint").
+            self.renderer.draw(self._snapshot.state)
+            return
+        # Render at the label's size in device pixels so Qt shows the frame
+        # as is; the single fromImage() below is the only copy per frame.
+        label = self.ui.simulation_label
+        ratio = label.devicePixelRatioF()
+        size = label.contentsRect().size()
+        self.renderer.resize(round(size.width() * ratio), round(size.height() * ratio))
+        started = self.profiler.start()
+        image = self.renderer.draw(self._snapshot.state)
+        started = self.profiler.lap("render.draw", started)
         pixmap = QPixmap.fromImage(image)
-        self.ui.simulation_label.setPixmap(pixmap)
+        pixmap.setDevicePixelRatio(ratio)
+        label.setPixmap(pixmap)
+        self.profiler.lap("render.present", started)
 
     def _update_status(self) -> None:
-        state = self.controller.state
-        self.ui.current_floor_value.setText(f"{state.current_floor:.2f}")
-        self.ui.direction_value.setText(state.direction.value)
-        self.ui.door_value.setText(state.door_state.value)
-        next_stops = self.controller.pending_requests()
-        next_text = ", ".join(str(floor) for floor in next_stops) if next_stops else "-"
-        self.ui.next_stops_value.setText(next_text)
-        self.ui.mode_value.setText(self.controller.scheduler.name)
+        view = self.view
+        snapshot = self._snapshot
+        state = snapshot.state
+        view.set_text(self.ui.current_floor_value, f"{state.current_floor:.2f}")
+        view.set_text(self.ui.direction_value, state.direction.value)
+        view.set_text(self.ui.door_value, state.door_state.value)
+        next_stops = snapshot.pending_requests
+        if view.changed("next_stops", next_stops):
+            next_text = ", ".join(str(floor) for floor in next_stops) if next_stops else "-"
+            view.set_text(self.ui.next_stops_value, next_text)
+        view.set_text(self.ui.mode_value, snapshot.scheduler_name)
 
     def _update_controls(self) -> None:
-        door = self.controller.state.door_state
-        emergency = self.controller.emergency_stop
-        self.ui.open_door_button.setEnabled(not emergency and door in (DoorState.CLOSED, DoorState.CLOSING))
-        self.ui.close_door_button.setEnabled(not emergency and door in (DoorState.OPEN, DoorState.OPENING))
-        self._update_request_buttons()
-
-    def _update_request_buttons(self) -> None:
-        pending = set(self.controller.pending_requests())
-        for floor, button in self._floor_buttons.items():
-            button.setEnabled(floor not in pending)
+        door = self._snapshot.state.door_state
+        emergency = self._snapshot.emergency_stop
+        self.view.set_enabled(self.ui.open_door_button, not emergency and door in (DoorState.CLOSED, DoorState.CLOSING))
+        self.view.set_enabled(self.ui.close_door_button, not emergency and door in (DoorState.OPEN, DoorState.OPENING))
+        self.floors.set_pending(self._snapshot.pending_requests)
 
     def _drain_events(self) -> None:
-        for event in self.controller.consume_events():
-            self._log_message(format_event(event))
+        for item in self._worker.drain():
+            if isinstance(item, CommandResult):
+                self._handle_result(item)
+            else:
+                self._log_message(format_event(item[1]))
+
+    def _handle_result(self, result: CommandResult) -> None:
+        tag = result.tag
+        if tag == "recording":
+            if result.error is not None:
+                self._log_message(f"Session recording unavailable: {result.error}")
+            else:
+                self._log_message(f"Recording session to {result.value}")
+        elif result.error is not None:
+            self._log_message(f"Command failed: {result.error}")
+        elif tag == "open_door" and result.value:
+            self._log_message("Door command: open")
+        elif tag == "close_door" and result.value:
+            self._log_message("Door command: close")
+        elif isinstance(tag, tuple) and tag[0] == "request" and result.value:
+            self._log_message(f"Floor {tag[1]} requested")
 
     def _log_message(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.ui.log_output.appendPlainText(f"[{timestamp}] {message}")
-        self.ui.log_output.ensureCursorVisible()
+        self.log.write(message)
+
+    def _create_log_sink(self, max_lines: int) -> LogSink:
+        try:
+            path = data_dir("logs") / "simulation.log"
+            return LogSink(self.ui.log_output, path, max_lines=max_lines)
+        except OSError:
+            return LogSink(self.ui.log_output, max_lines=max_lines)
+
+    def _toggle_profiling(self) -> None:
+        profiler = self.profiler
+        profiler.enabled = not profiler.enabled
+        if profiler.enabled:
+            profiler.reset()
+            self._overlay_refreshed = 0.0
+            self._log_message("Profiling on (F3 hides it, Ctrl+Shift+D saves a report)")
+        elif self._overlay is not None:
+            self._overlay.hide()
+
+    def _refresh_overlay(self) -> None:
+        now = time.monotonic()
+        if now - self._overlay_refreshed < OVERLAY_REFRESH or self.renderer is None:
+            return
+        self._overlay_refreshed = now
+        if self._overlay is None:
+            host = self.renderer if isinstance(self.renderer, QWidget) else self.ui.simulation_label
+            self._overlay = QLabel(host)
+            self._overlay.setObjectName("profile_overlay")
+            self._overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
+            self._overlay.setStyleSheet(
+                "QLabel#profile_overlay { background-color: rgba(0, 0, 0, 170); color: rgb(230, 235, 240);"
+                " font-family: monospace; font-size: 8pt; padding: 4px; border-radius: 4px; }"
+            )
+            self._overlay.move(6, 6)
+        self._overlay.setText(self._overlay_text())
+        self._overlay.adjustSize()
+        self._overlay.show()
+        self._overlay.raise_()
+
+    def _overlay_text(self) -> str:
+        header = f"{'span':<20} {'mean':>7} {'p95':>7} {'max':>7}  ms"
+        view = self.view
+        footer = f"widget writes {view.updates_per_second:5.1f}/s, {view.skipped} skipped"
+        return "\n".join([header] + self.profiler.report() + [footer])
+
+    def _dump_profile(self) -> None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        try:
+            target = data_dir("profiles") / f"profile-{stamp}.json"
+            self.profiler.dump(target)
+        except OSError as exc:
+            self._log_message(f"Profile not saved: {exc}")
+            return
+        self._log_message(f"Profile saved to {target}")
+
+    def _start_recording(self) -> None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        try:
+            sessions = data_dir("sessions")
+            # Make room for the new recording among the newest KEEP_SESSIONS.
+            prune(sessions, "session-*.elevrec", KEEP_SESSIONS - 1)
+        except OSError as exc:
+            self._log_message(f"Recording not saved: {exc}")
+            return
+        self._worker.start_recording(sessions / f"session-{stamp}.elevrec")
+
+    def _stop_recording(self) -> None:
+        self._worker.stop_recording()
 
     def _start_timer(self) -> None:
         if not self.timer.isActive():
@@ -245,22 +420,29 @@ class MainWindow:
         self.ui.logs_toggle_button.setText("Logs ▲" if expanded else "Logs ▼")
 
     def _copy_logs(self) -> None:
+        self.log.flush()
         QGuiApplication.clipboard().setText(self.ui.log_output.toPlainText())
 
     def _export_logs(self) -> None:
         path, _ = QFileDialog.getSaveFileName(self.ui, "Export Logs", "elevator_logs.txt", "Text Files (*.txt)")
         if path:
-            with open(path, "w", encoding="utf-8") as handle:
-                handle.write(self.ui.log_output.toPlainText())
-
-    def _load_info_dialog(self) -> Optional[QWidget]:
-        info_path = Path(__file__).resolve().parent / "ui_files" / "Info_window_gui.ui"
-        loader = QUiLoader()
-        dialog = loader.load(str(info_path))
-        if dialog is None:
-            return None
-        return dialog
+            self.log.export(path)
 
     def _show_about_dialog(self) -> None:
-        if self._info_dialog is not None:
-            self._info_dialog.show()
+        if self._info_dialog is None:
+            self._info_dialog = _InfoDialog(self.ui)
+        self._info_dialog.show()
+
+
+# Forms precompiled from ui_files/ by pyside6-uic (see forms/__init__.py), so
+# startup does not parse XML with QUiLoader.
+class _MainForm(QWidget, Ui_MainWindow):
+    def __init__(self) -> None:
+        super().__init__()
+        self.setupUi(self)
+
+
+class _InfoDialog(QDialog, Ui_InfoDialogWindow):
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setupUi(self)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from PySide6.QtCore import QStandardPaths
+
+
+def data_dir(name: str) -> Path:
+    base = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+    path = Path(base or Path.home() / ".elevator_sim") / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def prune(directory: Path, pattern: str, keep: int) -> List[Path]:
+    """Delete all but the `keep` newest files matching `pattern`; returns the deleted ones.
+
+    Files are ordered by name, so names must sort by creation time.
+    """
+    files = sorted(directory.glob(pattern))
+    stale = files[: max(0, len(files) - keep)]
+    for path in stale:
+        path.unlink(missing_ok=True)
+    return stale
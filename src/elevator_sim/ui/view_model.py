@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Hashable
+
+
+class ViewModel:
+    """Last values shown in the widgets; setters only reach Qt on a change.
+
+    `updates` and `skipped` count widget writes made and avoided, and
+    `updates_per_second` is the write rate over the last full second or more.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.updates = 0
+        self.skipped = 0
+        self._rate = 0.0
+        self._clock = clock
+        self._values: Dict[Hashable, Hashable] = {}
+        self._window_start = clock()
+        self._window_updates = 0
+
+    def set_text(self, widget: Any, text: str) -> None:
+        if self.changed((widget, "text"), text):
+            widget.setText(text)
+            self._count()
+
+    def set_enabled(self, widget: Any, enabled: bool) -> None:
+        if self.changed((widget, "enabled"), enabled):
+            widget.setEnabled(enabled)
+            self._count()
+
+    def changed(self, key: Hashable, value: Hashable) -> bool:
+        """Remember `value` under `key`; False if it was already there."""
+        if key in self._values and self._values[key] == value:
+            self.skipped += 1
+            return False
+        self._values[key] = value
+        return True
+
+    def forget(self, widget: Any) -> None:
+        for key in [key for key in self._values if isinstance(key, tuple) and key[0] is widget]:
+            del self._values[key]
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    @property
+    def updates_per_second(self) -> float:
+        self._roll()
+        return self._rate
+
+    def _count(self) -> None:
+        self.updates += 1
+        self._window_updates += 1
+        self._roll()
+
+    def _roll(self) -> None:
+        now = self._clock()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self._rate = self._window_updates / elapsed
+            self._window_start = now
+            self._window_updates = 0
@@ -0,0 +1,53 @@
+import importlib.util
+from pathlib import Path
+
+_PATH = Path(__file__).resolve().parents[1] / "benchmarks" / "suite.py"
+_SPEC = importlib.util.spec_from_file_location("bench_suite", _PATH)
+suite = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(suite)
+
+Timing = suite.Timing
+
+
+def test_only_slowdowns_in_both_figures_regress() -> None:
+    baseline = {"a": Timing(1.0, 10.0), "b": Timing(1.0, 10.0), "c": Timing(1.0, 10.0)}
+    results = {
+        "a": Timing(2.0, 20.0),  # the code got slower
+        "b": Timing(2.0, 10.0),  # the machine got slower
+        "c": Timing(1.0, 20.0),  # the reference loop got lucky
+        "new": Timing(5.0, 50.0),
+    }
+    assert [name for name, _ in suite.compare(baseline, results, threshold=1.5)] == ["a"]
+
+
+def test_baseline_round_trip(tmp_path) -> None:
+    path = tmp_path / "baseline.json"
+    suite.save_baseline(path, {"events.format_event": Timing(0.25, 2.5)})
+    assert suite.load_baseline(path) == {"events.format_event": Timing(0.25, 2.5)}
+
+
+def test_every_hot_path_has_cases() -> None:
+    names = list(suite.cases())
+    prefixes = (
+        "controller.update.travel",
+        "controller.update.door",
+        "controller.update.idle",
+        "scheduler.SCAN.next_stop.",
+        "scheduler.FIFO.remove_request.",
+        "render.draw.",
+        "events.format_event",
+        "events.consume_events",
+    )
+    for prefix in prefixes:
+        assert any(name.startswith(prefix) for name in names), prefix
+
+
+def test_run_suite_keeps_the_best_round_relative_to_the_reference(monkeypatch) -> None:
+    case_times = iter([3.0, 2.0, 2.5])
+    reference_times = iter([5.0, 4.0, 8.0])
+    monkeypatch.setattr(suite, "measure", lambda setup, run, ops, repeat: next(reference_times))
+    monkeypatch.setattr(
+        suite, "cases", lambda: {"stub.case": lambda: lambda repeat: next(case_times), "other": None}
+    )
+
+    assert suite.run_suite("stub.", repeat=1, rounds=3) == {"stub.case": Timing(2.0, 0.5)}
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.scheduler import SimpleScheduler
+
+np = pytest.importorskip("numpy")
+from elevator_sim.core.fleet import FleetEngine  # noqa: E402
+
+
+def test_fleet_matches_controller_per_car() -> None:
+    rng = random.Random(7)
+    car_count = 16
+    speeds = [rng.uniform(0.5, 2.0) for _ in range(car_count)]
+    fleet = FleetEngine(car_count, floor_count=12, speed_fps=np.array(speeds))
+    controllers = [
+        ElevatorController(floor_count=12, scheduler=SimpleScheduler(), speed_fps=speed) for speed in speeds
+    ]
+
+    for tick in range(3000):
+        if tick % 40 == 0:
+            cars = np.array([index for index in range(car_count) if rng.random() < 0.3], dtype=np.int64)
+            floors = np.array([rng.randint(1, 12) for _ in cars], dtype=np.int64)
+            fleet.request(cars, floors)
+            for car, floor in zip(cars, floors):
+                controllers[car].add_request(int(floor))
+        dt = rng.uniform(0.01, 0.1)
+        fleet.step(dt)
+        for controller in controllers:
+            controller.update(dt)
+
+    for index, controller in enumerate(controllers):
+        state = fleet.state(index)
+        assert state.current_floor == pytest.approx(controller.state.current_floor)
+        assert state.direction == controller.state.direction
+        assert state.door_state == controller.state.door_state
+        assert state.target_floor == next(iter(controller.pending_requests()), None)
+        assert fleet.door_timers[index] == pytest.approx(controller.door_timer)
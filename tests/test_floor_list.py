@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("PySide6.QtCore")
+
+from PySide6.QtCore import Qt
+
+from elevator_sim.ui.floor_list import FloorListModel
+
+
+def test_rows_follow_floor_count() -> None:
+    model = FloorListModel(6)
+    assert model.rowCount() == 6
+    assert model.data(model.index(0)) == "1"
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.set_floor_count(250)
+    model.set_floor_count(250)
+    assert model.rowCount() == 250
+    assert len(resets) == 1
+
+
+def test_pending_floors_are_disabled_and_only_flips_signalled() -> None:
+    model = FloorListModel(300)
+    changed = []
+    model.dataChanged.connect(lambda first, last, roles: changed.append(first.row() + 1))
+    model.set_pending({5, 120})
+    assert sorted(changed) == [5, 120]
+    assert not model.requestable(model.index(119))
+    assert model.flags(model.index(3)) & Qt.ItemIsEnabled
+
+    changed.clear()
+    model.set_pending({120, 7})
+    assert sorted(changed) == [5, 7]
+    assert model.requestable(model.index(4))
@@ -0,0 +1,27 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+UI_DIR = Path(__file__).resolve().parents[1] / "src" / "elevator_sim" / "ui"
+FORMS = {
+    "Elevator_Interface_updated.ui": "ui_main_window.py",
+    "Info_window_gui.ui": "ui_info_dialog.py",
+}
+
+
+def _code(text: str) -> list:
+    # The banner carries the uic version, which may differ between machines.
+    return [line for line in text.splitlines() if not line.startswith("#")]
+
+
+@pytest.mark.parametrize("source, form", FORMS.items())
+def test_committed_form_matches_ui_file(tmp_path, source, form) -> None:
+    uic = shutil.which("pyside6-uic")
+    if uic is None:
+        pytest.skip("pyside6-uic is not installed")
+    output = tmp_path / form
+    subprocess.run([uic, f"ui_files/{source}", "-o", str(output)], cwd=UI_DIR, check=True)
+    committed = (UI_DIR / "forms" / form).read_text(encoding="utf-8")
+    assert _code(output.read_text(encoding="utf-8")) == _code(committed), f"regenerate forms/{form}"
@@ -0,0 +1,30 @@
+from elevator_sim.core.group import ElevatorGroup, RoundRobinDispatcher
+
+
+def _run(group: ElevatorGroup, seconds: float, dt: float = 0.1) -> None:
+    for _ in range(int(seconds / dt)):
+        group.update(dt)
+
+
+def test_nearest_car_splits_requests_between_cars() -> None:
+    group = ElevatorGroup(car_count=2, floor_count=10)
+    group.cars[1].state.current_floor = 10.0
+
+    assert group.add_request(2) == 0
+    assert group.add_request(9) == 1
+    assert group.add_request(9) == 1
+
+    _run(group, 10.0)
+
+    assert group.pending_requests() == []
+    assert group.served == 2
+    assert group.throughput() == 2
+
+
+def test_dispatcher_is_pluggable() -> None:
+    group = ElevatorGroup(car_count=3, floor_count=6, dispatcher=RoundRobinDispatcher())
+
+    assigned = [group.add_request(floor) for floor in (2, 3, 4, 5)]
+
+    assert assigned == [0, 1, 2, 0]
+    assert sorted(group.cars[0].pending_requests()) == [2, 5]
@@ -0,0 +1,58 @@
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.events import ArrivedAtFloor, DirectionChanged, EmergencyStop, RequestAdded, format_event
+from elevator_sim.core.journal import EventJournal
+from elevator_sim.core.model import Direction
+
+
+def test_journal_drains_across_the_ring_boundary() -> None:
+    journal = EventJournal(capacity=4)
+    journal.append(RequestAdded(1), 0.0)
+    journal.append(RequestAdded(2), 0.5)
+    journal.drain()
+
+    events = [RequestAdded(3), DirectionChanged(Direction.DOWN), EmergencyStop(True)]
+    for index, event in enumerate(events):
+        journal.append(event, float(index))
+    batch = journal.drain()
+
+    assert len(batch) == 3
+    assert list(batch) == events
+    assert [time for time, _ in batch.timed()] == [0.0, 1.0, 2.0]
+    assert len(journal) == 0
+
+
+def test_journal_overwrites_oldest_when_full() -> None:
+    journal = EventJournal(capacity=3)
+    for floor in range(1, 6):
+        journal.append(ArrivedAtFloor(floor), float(floor))
+
+    assert journal.dropped == 2
+    assert list(journal.drain()) == [ArrivedAtFloor(3), ArrivedAtFloor(4), ArrivedAtFloor(5)]
+
+
+def test_controller_journal_capacity_is_configurable() -> None:
+    controller = ElevatorController(floor_count=10, journal_capacity=2)
+    for floor in (2, 3, 4):
+        controller.add_request(floor)
+
+    assert controller.journal.capacity == 2
+    assert controller.journal.dropped == 1
+    assert controller.consume_events() == [RequestAdded(3), RequestAdded(4)]
+
+
+def test_controller_events_carry_sim_time() -> None:
+    controller = ElevatorController(floor_count=6, speed_fps=1.0)
+    controller.add_request(3)
+    for _ in range(25):
+        controller.update(0.1)
+
+    timed = list(controller.drain_events().timed())
+
+    assert [format_event(event) for _, event in timed] == [
+        "Request added: floor 3",
+        "Direction changed: Up",
+        "Arrived at floor 3",
+        "Direction changed: Idle",
+    ]
+    assert timed[0][0] == 0.0
+    assert abs(timed[2][0] - 2.0) < 0.11
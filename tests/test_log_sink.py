@@ -0,0 +1,78 @@
+import logging
+import os
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QPlainTextEdit
+
+from elevator_sim.ui.log_sink import LogSink
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_burst_is_appended_once_and_bounded(app, tmp_path) -> None:
+    widget = QPlainTextEdit()
+    sink = LogSink(widget, tmp_path / "sim.log", max_lines=5)
+    for index in range(8):
+        sink.write(f"event {index}")
+    assert widget.toPlainText() == ""
+
+    app.processEvents()
+    lines = widget.toPlainText().splitlines()
+    assert len(lines) == 5
+    assert lines[-1].endswith("event 7")
+    sink.close()
+
+
+def test_export_copies_rotated_files_in_order(app, tmp_path) -> None:
+    widget = QPlainTextEdit()
+    sink = LogSink(widget, tmp_path / "sim.log", max_lines=3, max_bytes=200, backups=20)
+    for index in range(40):
+        sink.write(f"event {index:02d}")
+        sink.flush()
+
+    target = tmp_path / "export.txt"
+    sink.export(target)
+    exported = [line.split("] ", 1)[1] for line in target.read_text(encoding="utf-8").splitlines()]
+    assert exported == [f"event {index:02d}" for index in range(40)]
+    assert (tmp_path / "sim.log.1").exists()
+    sink.close()
+
+
+def test_export_leaves_out_cleared_lines_and_earlier_runs(app, tmp_path) -> None:
+    path = tmp_path / "sim.log"
+    earlier = LogSink(QPlainTextEdit(), path)
+    earlier.write("previous run")
+    earlier.close()
+
+    sink = LogSink(QPlainTextEdit(), path)
+    sink.write("cleared")
+    sink.flush()
+    sink.clear()
+    sink.write("kept")
+
+    target = tmp_path / "export.txt"
+    sink.export(target)
+    assert [line.split("] ", 1)[1] for line in target.read_text(encoding="utf-8").splitlines()] == ["kept"]
+    assert "previous run" in (tmp_path / "sim.log.2").read_text(encoding="utf-8")
+    sink.close()
+
+
+def test_close_releases_the_file_and_leaves_no_logger(app, tmp_path) -> None:
+    loggers = set(logging.Logger.manager.loggerDict)
+    sink = LogSink(QPlainTextEdit(), tmp_path / "sim.log")
+    handler = sink._handler
+    sink.write("event")
+    sink.close()
+
+    assert handler.stream is None
+    assert set(logging.Logger.manager.loggerDict) == loggers
+    assert (tmp_path / "sim.log").read_text(encoding="utf-8").endswith("event\n")
+    sink.write("after close")
+    sink.flush()  # widget only
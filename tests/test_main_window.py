@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtWidgets import QApplication
+
+from elevator_sim.ui.main_window import ACTIVE_INTERVAL, IDLE_INTERVAL, MainWindow
+from elevator_sim.ui.view_model import ViewModel
+
+
+@pytest.fixture
+def window():
+    app = QApplication.instance() or QApplication([])
+    QStandardPaths.setTestModeEnabled(True)  # keep logs out of the user's data folder
+    window = MainWindow(renderer="qpainter")
+    yield window
+    window.shutdown()
+    app.processEvents()
+
+
+def test_unchanged_snapshot_skips_redraw_and_idle_timer_backs_off(window) -> None:
+    renders = []
+    window._render_frame = lambda: renders.append(window._snapshot)
+    snapshot = window._worker.snapshot()
+    window._worker.snapshot = lambda: snapshot
+    window.timer.start()
+    assert window.timer.interval() == ACTIVE_INTERVAL
+
+    window._on_tick()
+    window._on_tick()
+    assert renders == [snapshot]
+    assert window.timer.interval() == IDLE_INTERVAL
+
+    window._floor_clicked(window.floors.index(2))
+    assert window.timer.interval() == ACTIVE_INTERVAL
+    window._on_tick()
+    assert len(renders) == 2
+
+
+def test_profile_overlay_shows_widget_write_rate(window) -> None:
+    window.view = ViewModel(clock=lambda: 0.0)
+    window.view.skipped = 7
+    assert window._overlay_text().splitlines()[-1] == "widget writes   0.0/s, 7 skipped"
+
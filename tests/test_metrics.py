@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.metrics import KpiCollector, QuantileSketch
+from elevator_sim.core.simulation import EventDrivenSimulation, TimedRequest
+
+
+def test_sketch_quantiles_stay_within_relative_accuracy() -> None:
+    rng = random.Random(9)
+    samples = [rng.lognormvariate(2.0, 1.0) for _ in range(50_000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in samples:
+        sketch.add(value)
+
+    ordered = sorted(samples)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+
+def test_sketch_memory_is_bounded() -> None:
+    sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+    for exponent in range(-300, 300):
+        sketch.add(10.0 ** (exponent / 10.0))
+
+    assert len(sketch._buckets) <= 64
+    assert sketch.quantile(1.0) == pytest.approx(sketch.maximum)
+
+
+def test_collector_measures_trips_and_utilization() -> None:
+    controller = ElevatorController(floor_count=6, speed_fps=1.0, door_open_time=0.5, door_close_time=0.5, dwell_time=1.0)
+    simulation = EventDrivenSimulation(controller, [TimedRequest(0.0, 3, 5)])
+    kpis = KpiCollector()
+    kpis.attach(simulation)
+
+    simulation.run(until=20.0)
+    summary = kpis.summary(until=simulation.time)
+
+    assert summary.passenger_wait.count == 1
+    assert summary.passenger_wait.p50 == pytest.approx(2.0, rel=0.02)
+    assert summary.journey_time.p50 == pytest.approx(2.0 + 2.0 + 2.0, rel=0.02)
+    assert summary.stops_per_trip.p50 == pytest.approx(1.0, rel=0.02)
+    assert summary.utilization == pytest.approx(8.0 / 20.0, rel=0.01)
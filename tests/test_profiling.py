@@ -0,0 +1,83 @@
+import json
+import time
+
+import pytest
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.profiling import Profiler
+from elevator_sim.core.worker import SimulationWorker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SteppingClock:
+    """Moves on by `interval` each time it is read, however long the caller took."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += self.interval
+        return self.now
+
+
+def test_laps_build_rolling_stats_and_histogram() -> None:
+    clock = FakeClock()
+    profiler = Profiler(window=4, clock=clock)
+    profiler.enabled = True
+    for duration in (0.001, 0.002, 0.003, 0.004, 0.020):
+        started = profiler.start()
+        clock.now += duration
+        profiler.lap("tick", started)
+
+    stats = profiler.stats()["tick"]
+    assert stats.count == 5
+    assert stats.max == pytest.approx(0.020)
+    assert stats.mean == pytest.approx(0.00725)
+    assert sum(stats.histogram) == 4  # only the window is kept
+    assert "tick" in profiler.report()[0]
+
+
+def test_disabled_profiler_records_nothing_even_if_enabled_mid_span(tmp_path) -> None:
+    clock = FakeClock()
+    profiler = Profiler(clock=clock)
+    started = profiler.start()
+    profiler.lap("tick", started)
+    assert profiler.stats() == {}
+
+    profiler.enabled = True
+    clock.now += 5.0
+    profiler.lap("tick", started)
+    assert profiler.stats() == {}
+
+    profiler.record("render.draw", 0.002)
+    profiler.dump(tmp_path / "profile.json")
+    document = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert document["spans"]["render.draw"]["count"] == 1
+
+
+def test_worker_times_steps_and_scheduler_calls() -> None:
+    clock = SteppingClock(0.05)  # three steps per pass of the worker loop
+    profiler = Profiler()
+    profiler.enabled = True
+    worker = SimulationWorker(ElevatorController(speed_fps=4.0), clock=clock, profiler=profiler)
+    worker.call("add_request", 3)
+    worker.set_running(True)
+    worker.start()
+    deadline = time.monotonic() + 10.0
+    while worker.snapshot().time < 1.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    worker.stop()
+
+    steps = round(worker.snapshot().time / worker.step)
+    stats = profiler.stats()
+    assert steps >= 60
+    assert stats["controller.update"].count == steps
+    assert 0 < stats["scheduler.next_stop"].count < steps
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from elevator_sim.core.model import DoorState, ElevatorState
+from elevator_sim.render.qpainter_canvas import QPainterCanvas
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_car_is_painted_at_its_floor(app) -> None:
+    canvas = QPainterCanvas(floor_count=4)
+    canvas.resize(400, 400)
+    state = ElevatorState()
+    state.current_floor = 3
+    canvas.draw(state)
+
+    image = canvas.grab().toImage()
+    rect = canvas._car_rect
+    assert 100 < rect.center().y() < 200
+    assert QColor(image.pixel(rect.center().x(), rect.top() + 2)) == QColor(245, 182, 89)
+    assert QColor(image.pixel(2, 2)) == QColor(16, 196, 222)
+
+
+def test_draw_skips_unchanged_frames(app) -> None:
+    canvas = QPainterCanvas()
+    canvas.resize(200, 200)
+    repaints = []
+    canvas.update = lambda *area: repaints.append(area)
+    state = ElevatorState()
+
+    canvas.draw(state)
+    canvas.draw(state)
+    assert len(repaints) == 1
+
+    state.door_state = DoorState.OPEN
+    canvas.draw(state)
+    assert len(repaints) == 2
@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("pygame")
+pytest.importorskip("PySide6.QtGui")
+
+from elevator_sim.core.model import DoorState, ElevatorState
+from elevator_sim.render.pygame_canvas import PygameCanvas
+
+
+def _full_redraw(canvas: PygameCanvas, state: ElevatorState) -> bytes:
+    canvas._background = None
+    canvas.draw(state)
+    return bytes(canvas._pixels)
+
+
+def test_cached_frames_match_full_redraw() -> None:
+    cached = PygameCanvas(240, 260, floor_count=6)
+    reference = PygameCanvas(240, 260, floor_count=6)
+    state = ElevatorState()
+    for step in range(40):
+        state.current_floor = 1 + (step * 0.3) % 5
+        state.door_state = DoorState.OPEN if step % 7 == 0 else DoorState.CLOSED
+        if step == 20:
+            cached.set_floor_count(9)
+            reference.set_floor_count(9)
+        cached.draw(state)
+        assert bytes(cached._pixels) == _full_redraw(reference, state)
+
+
+def test_resize_rebuilds_background() -> None:
+    canvas = PygameCanvas(240, 260, floor_count=6)
+    state = ElevatorState()
+    canvas.draw(state)
+    canvas.resize(300, 320)
+    image = canvas.draw(state)
+    assert (image.width(), image.height()) == (300, 320)
+    assert canvas._background.get_size() == (300, 320)
+
+
+def test_tall_building_scrolls_and_matches_full_redraw() -> None:
+    cached = PygameCanvas(240, 260, floor_count=300)
+    reference = PygameCanvas(240, 260, floor_count=300)
+    state = ElevatorState()
+    for step in range(120):
+        state.current_floor = 1 + step * 2.5
+        cached.draw(state)
+        reference.viewport.follow(state.current_floor)
+        assert bytes(cached._pixels) == _full_redraw(reference, state)
+    assert cached.viewport.base > 0
+    assert cached._car_rect.top >= 0 and cached._car_rect.bottom <= 260
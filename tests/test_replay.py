@@ -0,0 +1,53 @@
+import io
+import random
+import struct
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.replay import SessionRecorder, replay, state_hash
+from elevator_sim.core.scheduler import ScanScheduler
+
+
+def _record_session(seed: int) -> "tuple[bytes, ElevatorController]":
+    rng = random.Random(seed)
+    controller = ElevatorController(floor_count=9)
+    stream = io.BytesIO()
+    session = SessionRecorder(controller, stream, checkpoint_interval=10)
+    for tick in range(3000):
+        roll = rng.random()
+        if roll < 0.02:
+            session.add_request(rng.randint(1, 9))
+        elif roll < 0.025:
+            session.request_open_door()
+        elif roll < 0.03:
+            session.request_close_door()
+        elif tick == 1500:
+            session.set_scheduler(ScanScheduler())
+        elif tick in (2000, 2100):
+            session.set_emergency_stop(tick == 2000)
+        session.update(rng.uniform(0.02, 0.05))
+    session.close()
+    return stream.getvalue(), controller
+
+
+def test_replay_reproduces_recorded_session() -> None:
+    data, original = _record_session(4)
+
+    result = replay(data)
+
+    assert result.ok
+    assert result.updates == 3000
+    assert result.checkpoints == 300
+    assert result.controller.time == original.time
+    assert state_hash(result.controller) == state_hash(original)
+
+
+def test_replay_detects_divergence() -> None:
+    data, _ = _record_session(5)
+    tampered = bytearray(data)
+    speed_offset = 8 + 4
+    tampered[speed_offset : speed_offset + 8] = struct.pack("<d", 1.25)
+
+    result = replay(bytes(tampered))
+
+    assert not result.ok
+    assert result.mismatches[0] <= 100
@@ -1,5 +1,41 @@
+import random
+from collections import deque
+from typing import Iterable, List, Set
+
+import pytest
+
+from elevator_sim.core.controller import ElevatorController
 from elevator_sim.core.model import Direction
-from elevator_sim.core.scheduler import ScanScheduler
+from elevator_sim.core.scheduler import (
+    BaseScheduler,
+    CostScheduler,
+    DecisionCache,
+    CScanScheduler,
+    FifoScheduler,
+    LookScheduler,
+    ScanScheduler,
+)
+
+
+def _service_order(
+    scheduler: BaseScheduler,
+    floors: Iterable[int],
+    current: float,
+    direction: Direction,
+    idle_at_stops: bool = False,
+) -> List[int]:
+    for floor in floors:
+        scheduler.add_request(floor)
+
+    order = []
+    while scheduler.pending_requests():
+        decision = scheduler.next_stop(current, direction)
+        assert decision is not None
+        order.append(decision.floor)
+        scheduler.remove_request(decision.floor)
+        current = decision.floor
+        direction = Direction.IDLE if idle_at_stops else decision.direction
+    return order
 
 
 def test_scan_ordering_example() -> None:
@@ -20,3 +56,155 @@ def test_scan_ordering_example() -> None:
         direction = decision.direction
 
     assert order == [3, 5, 1]
+
+
+def test_scan_index_matches_brute_force() -> None:
+    rng = random.Random(3)
+    scheduler = ScanScheduler()
+    requests = set()
+    for _ in range(2000):
+        floor = rng.randint(1, 40)
+        if rng.random() < 0.6:
+            scheduler.add_request(floor)
+            requests.add(floor)
+        else:
+            scheduler.remove_request(floor)
+            requests.discard(floor)
+        current = rng.choice((rng.randint(1, 40), rng.uniform(1, 40)))
+        decision = scheduler.next_stop(current, Direction.UP)
+        ahead = [f for f in requests if f > current]
+        behind = [f for f in requests if f < current]
+        expected = min(ahead) if ahead else (max(behind) if behind else None)
+        assert (decision.floor if decision else None) == expected
+        assert scheduler.pending_requests() == sorted(requests)
+
+
+def test_look_keeps_sweeping_across_idle_stops() -> None:
+    order = _service_order(LookScheduler(), (5, 1, 3, 2), 2.5, Direction.UP, idle_at_stops=True)
+
+    assert order == [3, 5, 2, 1]
+
+
+def test_cscan_returns_to_lowest_request() -> None:
+    order = _service_order(CScanScheduler(), (5, 1, 3, 2), 2.5, Direction.UP)
+
+    assert order == [3, 5, 1, 2]
+
+
+def test_fifo_keeps_deque_service_order() -> None:
+    rng = random.Random(11)
+    scheduler = FifoScheduler()
+    reference = deque()
+    for _ in range(3000):
+        floor = rng.randint(1, 60)
+        if rng.random() < 0.7:
+            scheduler.add_request(floor)
+            if floor not in reference:
+                reference.append(floor)
+        elif reference and rng.random() < 0.5:
+            head = reference.popleft()
+            assert scheduler.next_stop(0.5, Direction.IDLE).floor == head
+            scheduler.remove_request(head)
+        else:
+            scheduler.remove_request(floor)
+            if floor in reference:
+                reference.remove(floor)
+        assert scheduler.pending_requests() == list(reference)
+
+
+def test_controller_reuses_decisions_within_a_travel_segment() -> None:
+    controller = ElevatorController(floor_count=10, scheduler=ScanScheduler(), speed_fps=1.0)
+    controller.add_request(9)
+
+    for _ in range(20):
+        controller.update(0.1)
+    cache = controller.decision_cache
+    assert controller.state.direction == Direction.UP
+    assert cache.hits > cache.misses
+
+    misses = cache.misses
+    controller.add_request(5)
+    controller.update(0.1)
+    assert cache.misses == misses + 1
+    assert controller.state.target_floor == 5
+
+
+def _brute_tour(floors: Set[int], current: float, per_floor: float, stop: float, up_first: bool) -> float:
+    above = sorted(f for f in floors if f > current)
+    below = sorted((f for f in floors if f < current), reverse=True)
+    total = elapsed = 0.0
+    position = current
+    for floor in (above + below) if up_first else (below + above):
+        elapsed += abs(floor - position) * per_floor
+        total += elapsed
+        elapsed += stop
+        position = floor
+    return total
+
+
+def test_cost_tours_match_brute_force() -> None:
+    rng = random.Random(5)
+    scheduler = CostScheduler()
+    scheduler.configure(40, 2.0, 0.5, 1.0, 0.5)
+    requests = set()
+    for _ in range(1500):
+        floor = rng.randint(1, 60)  # beyond the configured floors, so the sums grow
+        if rng.random() < 0.6:
+            scheduler.add_request(floor)
+            requests.add(floor)
+        else:
+            scheduler.remove_request(floor)
+            requests.discard(floor)
+        current = rng.choice((rng.randint(1, 60), rng.uniform(1, 60)))
+        up_first, down_first = scheduler.tour_costs(current)
+        assert up_first == pytest.approx(_brute_tour(requests, current, 0.5, 2.0, True))
+        assert down_first == pytest.approx(_brute_tour(requests, current, 0.5, 2.0, False))
+
+
+def test_cost_serves_the_cheaper_side_first() -> None:
+    # Two floors away either way, but four calls wait above and one below.
+    order = _service_order(CostScheduler(), (3, 7, 8, 9, 10), 5, Direction.IDLE, idle_at_stops=True)
+
+    assert order == [7, 8, 9, 10, 3]
+    assert _service_order(CostScheduler(), (4, 7), 5, Direction.IDLE) == [4, 7]
+
+
+def test_cost_only_reverses_a_sweep_when_clearly_cheaper() -> None:
+    scheduler = CostScheduler()
+    for floor in (3, 8):
+        scheduler.add_request(floor)
+
+    up_first, down_first = scheduler.tour_costs(5.4)
+    assert down_first < up_first < down_first / (1 - CostScheduler.REVERSAL_MARGIN)
+    assert scheduler.next_stop(5.4, Direction.UP).floor == 8
+    assert scheduler.next_stop(6.5, Direction.DOWN).floor == 8
+
+
+def test_cost_clone_keeps_configuration_and_requests() -> None:
+    scheduler = CostScheduler()
+    controller = ElevatorController(floor_count=20, scheduler=scheduler, speed_fps=4.0, dwell_time=3.0)
+    for floor in (2, 15, 18):
+        controller.add_request(floor)
+
+    clone = controller.fork().scheduler
+    clone.remove_request(15)
+    assert scheduler.pending_requests() == [2, 15, 18]
+    assert scheduler.tour_costs(10) == pytest.approx(
+        (_brute_tour({2, 15, 18}, 10, 0.25, 4.2, True), _brute_tour({2, 15, 18}, 10, 0.25, 4.2, False))
+    )
+    assert clone.tour_costs(10) == pytest.approx(
+        (_brute_tour({2, 18}, 10, 0.25, 4.2, True), _brute_tour({2, 18}, 10, 0.25, 4.2, False))
+    )
+
+
+def test_decision_cache_asks_position_sensitive_schedulers_every_time() -> None:
+    cache = DecisionCache()
+    scheduler = CostScheduler()
+    for floor in (3, 8):
+        scheduler.add_request(floor)
+
+    # Both positions are in the band above floor 6, on either side of the reversal point.
+    assert cache.next_stop(scheduler, 6.1, Direction.DOWN).floor == 3
+    assert cache.next_stop(scheduler, 6.3, Direction.DOWN).floor == 8
+    assert (cache.hits, cache.misses) == (0, 2)
+
@@ -0,0 +1,87 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Sequence, Tuple, Type
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.events import ArrivedAtFloor, Event
+from elevator_sim.core.simulation import EventDrivenSimulation, Simulation, TimedRequest
+from elevator_sim.headless import main
+
+
+def test_simulation_serves_timed_requests() -> None:
+    controller = ElevatorController(floor_count=6, speed_fps=1.0)
+    requests = [TimedRequest(0.0, 4), TimedRequest(2.0, 2)]
+    simulation = Simulation(controller, requests, dt=0.1)
+    arrivals = []
+    simulation.subscribe(
+        lambda sim_time, event: arrivals.append(event.floor) if isinstance(event, ArrivedAtFloor) else None
+    )
+
+    stats = simulation.run()
+
+    assert arrivals == [4, 2]
+    assert stats.requests == 2
+    assert controller.is_idle()
+
+
+def test_headless_runs_without_gui_modules(tmp_path, capsys) -> None:
+    scenario = tmp_path / "scenario.txt"
+    scenario.write_text("# time floor\n0 3\n1.5 5\n", encoding="utf-8")
+
+    main([str(scenario), "--scheduler", "SCAN", "--events", "-"])
+
+    output = capsys.readouterr().out
+    assert "Arrived at floor 5" in output
+    assert "Arrivals: 2" in output
+    assert "Event journal: 0 dropped (capacity 4096)" in output
+
+
+def test_headless_does_not_import_gui_modules() -> None:
+    code = (
+        "import sys; import elevator_sim.headless; "
+        "print(any(name in sys.modules for name in ('PySide6', 'pygame')))"
+    )
+    src = Path(__file__).resolve().parents[1] / "src"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(src)},
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def _event_trace(
+    engine: Type[Simulation], requests: Sequence[TimedRequest]
+) -> Tuple[Simulation, List[Tuple[float, Event]]]:
+    controller = ElevatorController(floor_count=10, speed_fps=1.0)
+    simulation = engine(controller, requests, dt=0.05)
+    trace = []
+    simulation.subscribe(lambda sim_time, event: trace.append((sim_time, event)))
+    simulation.run()
+    return simulation, trace
+
+
+def test_event_engine_matches_tick_engine_sequence() -> None:
+    requests = [TimedRequest(0.0, 7), TimedRequest(1.0, 3), TimedRequest(30.0, 1), TimedRequest(31.0, 9)]
+
+    ticked, tick_trace = _event_trace(Simulation, requests)
+    jumped, event_trace = _event_trace(EventDrivenSimulation, requests)
+
+    assert [event for _, event in event_trace] == [event for _, event in tick_trace]
+    for (event_time, _), (tick_time, _) in zip(event_trace, tick_trace):
+        assert abs(event_time - tick_time) <= 0.2
+    assert jumped.stats.steps * 20 < ticked.stats.steps
+
+
+def test_event_engine_skips_idle_time() -> None:
+    controller = ElevatorController(floor_count=6)
+    simulation = EventDrivenSimulation(controller, [TimedRequest(86_000.0, 6)])
+
+    stats = simulation.run(until=86_400.0)
+
+    assert stats.arrivals == 1
+    assert stats.steps < 20
+    assert simulation.time == 86_400.0
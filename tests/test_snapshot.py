@@ -0,0 +1,53 @@
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.replay import state_hash
+from elevator_sim.core.scheduler import BaseScheduler, FifoScheduler, LookScheduler, ScanScheduler
+from elevator_sim.core.snapshot import restore, snapshot
+
+
+def _busy_controller(scheduler: BaseScheduler) -> ElevatorController:
+    controller = ElevatorController(floor_count=12, scheduler=scheduler)
+    for floor in (9, 3, 11, 6):
+        controller.add_request(floor)
+    for _ in range(130):
+        controller.update(0.05)
+    return controller
+
+
+def _run(controller: ElevatorController, seconds: float) -> list:
+    for _ in range(int(seconds / 0.05)):
+        controller.update(0.05)
+    return controller.consume_events()
+
+
+def test_snapshot_round_trip_preserves_future() -> None:
+    original = _busy_controller(LookScheduler())
+    restored = restore(snapshot(original))
+
+    assert state_hash(restored) == state_hash(original)
+    assert _run(restored, 40.0) == _run(original, 40.0)
+    assert state_hash(restored) == state_hash(original)
+
+
+def test_fork_branches_are_independent() -> None:
+    original = _busy_controller(FifoScheduler())
+    baseline = original.fork()
+    what_if = original.fork()
+    what_if.set_scheduler(ScanScheduler())
+
+    baseline_events = _run(baseline, 60.0)
+    what_if_events = _run(what_if, 60.0)
+
+    assert baseline_events != what_if_events
+    assert original.pending_requests() == [9, 3, 11, 6]
+    assert baseline.is_idle() and what_if.is_idle()
+
+
+def test_fork_copies_every_attribute() -> None:
+    original = _busy_controller(LookScheduler())
+    original.decision_cache.profiler = object()
+    clone = original.fork()
+
+    assert vars(clone).keys() == vars(original).keys()
+    assert clone.decision_cache.profiler is original.decision_cache.profiler
+    for name in ("scheduler", "state", "decision_cache", "journal"):
+        assert getattr(clone, name) is not getattr(original, name)
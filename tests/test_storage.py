@@ -0,0 +1,21 @@
+import pytest
+
+pytest.importorskip("PySide6.QtCore")
+
+from elevator_sim.ui.storage import prune
+
+
+def test_prune_keeps_the_newest_files(tmp_path) -> None:
+    for stamp in ("20250103", "20250101", "20250102"):
+        (tmp_path / f"session-{stamp}.elevrec").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("kept")
+
+    deleted = prune(tmp_path, "session-*.elevrec", 2)
+
+    assert [path.name for path in deleted] == ["session-20250101.elevrec"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "notes.txt",
+        "session-20250102.elevrec",
+        "session-20250103.elevrec",
+    ]
+    assert prune(tmp_path, "session-*.elevrec", 0) and not list(tmp_path.glob("session-*"))
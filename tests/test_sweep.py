@@ -0,0 +1,26 @@
+import csv
+from typing import List
+
+from elevator_sim.sweep import SweepConfig, build_grid, run_sweep
+
+
+def _grid() -> List[SweepConfig]:
+    return list(
+        build_grid(["FIFO", "SCAN"], [6], [1.0], [1.5], [0.6], [0.6], ["lunch"], [4.0], [600.0], [1, 2])
+    )
+
+
+def test_sweep_streams_rows_and_resumes(tmp_path) -> None:
+    output = tmp_path / "results.csv"
+
+    assert run_sweep(_grid(), output, workers=2) == 4
+    with open(output, "a", encoding="utf-8") as handle:
+        handle.write("LOOK,6,1.0,1.5,0.6")
+
+    assert run_sweep(_grid(), output, workers=2) == 0
+
+    with open(output, newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 4
+    assert {row["scheduler"] for row in rows} == {"FIFO", "SCAN"}
+    assert all(float(row["passenger_wait_p95"]) > 0.0 for row in rows)
@@ -0,0 +1,34 @@
+from itertools import islice
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.scheduler import LookScheduler
+from elevator_sim.core.simulation import EventDrivenSimulation
+from elevator_sim.core.traffic import TrafficProfile, generate_traffic
+
+
+def test_traffic_is_reproducible_and_time_ordered() -> None:
+    first = list(generate_traffic(12, 30.0, TrafficProfile.LUNCH, seed=5, duration=600.0))
+    second = list(generate_traffic(12, 30.0, TrafficProfile.LUNCH, seed=5, duration=600.0))
+
+    assert first == second
+    assert [p.time for p in first] == sorted(p.time for p in first)
+    assert all(p.floor != p.destination for p in first)
+    assert all(1 <= p.floor <= 12 and 1 <= p.destination <= 12 for p in first)
+
+
+def test_up_peak_mostly_leaves_the_lobby() -> None:
+    passengers = list(islice(generate_traffic(20, 60.0, TrafficProfile.UP_PEAK, seed=1), 2000))
+
+    from_lobby = sum(1 for p in passengers if p.floor == 1)
+    assert from_lobby / len(passengers) > 0.8
+
+
+def test_simulation_delivers_generated_passengers() -> None:
+    controller = ElevatorController(floor_count=8, scheduler=LookScheduler())
+    traffic = generate_traffic(8, 3.0, TrafficProfile.INTER_FLOOR, seed=2, duration=1800.0)
+
+    stats = EventDrivenSimulation(controller, traffic).run()
+
+    assert stats.boarded == stats.requests
+    assert stats.delivered == stats.boarded
+    assert controller.is_idle()
@@ -0,0 +1,47 @@
+from elevator_sim.ui.view_model import ViewModel
+
+
+class FakeWidget:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def setText(self, text: str) -> None:
+        self.calls.append(("text", text))
+
+    def setEnabled(self, enabled: bool) -> None:
+        self.calls.append(("enabled", enabled))
+
+
+def test_only_changed_values_reach_widgets() -> None:
+    view = ViewModel()
+    label = FakeWidget()
+    button = FakeWidget()
+
+    view.set_text(label, "1.00")
+    view.set_text(label, "1.00")
+    view.set_enabled(button, True)
+    view.set_enabled(button, True)
+    view.set_text(label, "1.50")
+
+    assert label.calls == [("text", "1.00"), ("text", "1.50")]
+    assert button.calls == [("enabled", True)]
+    assert (view.updates, view.skipped) == (3, 2)
+
+    view.forget(button)
+    view.set_enabled(button, True)
+    assert button.calls == [("enabled", True), ("enabled", True)]
+
+
+def test_updates_per_second_uses_the_last_window() -> None:
+    now = [0.0]
+    view = ViewModel(clock=lambda: now[0])
+    label = FakeWidget()
+    for step in range(10):
+        now[0] = step * 0.1
+        view.set_text(label, str(step))
+    assert view.updates_per_second == 0.0
+
+    now[0] = 1.0
+    assert view.updates_per_second == 10.0
+    now[0] = 2.5
+    assert view.updates_per_second == 0.0
@@ -0,0 +1,24 @@
+from elevator_sim.render.viewport import MIN_FLOOR_HEIGHT, FloorViewport
+
+
+def test_short_building_is_shown_whole() -> None:
+    viewport = FloorViewport(6, 520)
+    assert not viewport.scrolls
+    assert viewport.floors() == range(1, 7)
+    assert viewport.top(1) == 520 - viewport.floor_h
+    assert not viewport.follow(6)
+
+
+def test_tall_building_keeps_car_in_window() -> None:
+    viewport = FloorViewport(300, 520)
+    assert viewport.scrolls
+    assert viewport.floor_h >= MIN_FLOOR_HEIGHT
+    moves = 0
+    floor = 1.0
+    while floor <= 300:
+        moves += viewport.follow(floor)
+        assert 0 <= viewport.top(floor) and viewport.top(floor) + viewport.floor_h <= 520
+        floor += 0.1
+    assert viewport.floors()[-1] == 300
+    # The window moves in jumps, not on every frame.
+    assert moves < 300 / (viewport.visible // 4)
@@ -0,0 +1,49 @@
+import io
+import time
+
+from elevator_sim.core.controller import ElevatorController
+from elevator_sim.core.events import ArrivedAtFloor, RequestAdded
+from elevator_sim.core.replay import replay, state_hash
+from elevator_sim.core.worker import CommandResult, SimulationWorker
+
+
+def test_commands_results_and_events_arrive_in_order() -> None:
+    worker = SimulationWorker(ElevatorController())
+    worker.start()
+    worker.call("add_request", 3, tag="request")
+    worker.call("add_request", 99, tag="bad request")
+    worker.submit(lambda w: w.controller.missing(), tag="broken")
+    worker.stop()
+
+    items = list(worker.drain())
+    assert items[0] == CommandResult("request", True)
+    assert items[1] == CommandResult("bad request", False)
+    assert items[2].tag == "broken" and isinstance(items[2].error, AttributeError)
+    assert items[3] == (0.0, RequestAdded(3))
+    assert worker.snapshot().pending_requests == (3,)
+
+
+def test_runs_in_real_time_with_fixed_steps_and_records() -> None:
+    controller = ElevatorController(speed_fps=4.0)
+    stream = io.BytesIO()
+    worker = SimulationWorker(controller)
+    worker.start()
+    worker.start_recording(stream)
+    worker.call("add_request", 2)
+    worker.set_running(True)
+    started = time.monotonic()
+    time.sleep(0.6)
+    worker.set_running(False)
+    worker.stop_recording()
+    worker.stop()
+    elapsed = time.monotonic() - started
+
+    snapshot = worker.snapshot()
+    assert 0.3 < snapshot.time <= elapsed + worker.step
+    assert abs(snapshot.time / worker.step - round(snapshot.time / worker.step)) < 1e-6
+    events = [item[1] for item in worker.drain() if not isinstance(item, CommandResult)]
+    assert ArrivedAtFloor(2) in events
+
+    result = replay(stream.getvalue())
+    assert result.ok
+    assert state_hash(result.controller) == state_hash(controller)